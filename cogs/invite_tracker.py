@@ -297,8 +297,8 @@ class InviteTracker(commands.Cog):
             # Check if VIP role was added
             VIP_ROLE_ID = int(self.bot.get_env_var('VIP_ROLE_ID', '1401614579850543206'))
             
-            before_vip = any(role.id == VIP_ROLE_ID for role in before.roles)
-            after_vip = any(role.id == VIP_ROLE_ID for role in after.roles)
+            before_vip = before.get_role(VIP_ROLE_ID) is not None
+            after_vip = after.get_role(VIP_ROLE_ID) is not None
             
             # If user just got VIP role
             if not before_vip and after_vip:
@@ -8,114 +8,617 @@ Main cog for handling VIP upgrade system including:
 - Staff notifications and management
 """
 
+import asyncio
+import functools
+import itertools
 import discord
 from discord.ext import commands
 from discord import app_commands
 import logging
 import json
-from datetime import datetime
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
 import os
 
 from views.vip_upgrade import VIPUpgradeView
 
 logger = logging.getLogger(__name__)
 
+INVITE_CACHE_TTL = 60  # Seconds before cached guild invites are refetched
+VIP_REQUESTS_CACHE_TTL = 15  # Seconds a /vip_requests result is reused
+VIP_REQUESTS_PAGE_SIZE = 10  # Requests per page in /vip_requests
+INVITE_USERS_PAGE_SIZE = 25  # Users per page in the invite user listings
+MEMBER_QUERY_TIMEOUT = 2.0  # Seconds to wait on a gateway member query
+INVITE_CREATE_CONCURRENCY = 5  # Invite REST calls (delete/create/fetch) in flight at once in bulk invite commands
+BULK_INVITE_COOLDOWN = 60  # Seconds between any two bulk invite rewrites (regenerate/fix/create/cleanup) in a guild
+MESSAGE_EMBED_CHARS = 6000  # Discord's limit on the combined text of all embeds in one message
+MESSAGE_EMBED_COUNT = 10  # Discord's limit on embeds per message
+_STICKY_TITLE = "👑 VIP Upgrade Center"
+_NO_MENTIONS = discord.AllowedMentions.none()  # Status replies never ping anyone
+# Embed colours shared by the invite test/cleanup commands
+_PURPLE = discord.Color.purple()
+_ORANGE = discord.Color.orange()
+_GREEN = discord.Color.green()
+_RED = discord.Color.red()
+_INVITE_PERMISSION_BIT = discord.Permissions(create_instant_invite=True).value
+WELCOME_CHANNEL_ID = 1401614581503365244
+PREFERRED_INVITE_CHANNELS = ('welcome', 'general', 'lobby', 'main')
+
+
+def _with_invite_permission(permissions: discord.Permissions, allowed: bool) -> discord.Permissions:
+    """Copy of permissions with only the create_instant_invite bit set or cleared"""
+    if allowed:
+        return discord.Permissions(permissions.value | _INVITE_PERMISSION_BIT)
+    return discord.Permissions(permissions.value & ~_INVITE_PERMISSION_BIT)
+
+
+def _is_unauthorized_invite(invite, authorized_codes, bot_user_id: int) -> bool:
+    """Whether an invite is anything other than a bot-generated staff invite (admin-created invites included)"""
+    return not (invite.code in authorized_codes and invite.inviter and invite.inviter.id == bot_user_id)
+
+
+def _percent(part: int, total: int) -> str:
+    """Format part/total as a one-decimal percentage ("0.0%" when total is 0)"""
+    return f"{part * 100 / total:.1f}%" if total else "0.0%"
+
+
+def _chunk_text(text: str, limit: int = 3900) -> list:
+    """Split text into chunks of at most limit characters, breaking at newlines where possible"""
+    chunks = []
+    start = 0
+    while len(text) - start > limit:
+        # Last newline that keeps this chunk within the limit; a longer single line is cut at the limit
+        split = text.rfind("\n", start, start + limit + 1)
+        if split > start:
+            chunks.append(text[start:split])
+            start = split + 1
+        else:
+            chunks.append(text[start:start + limit])
+            start += limit
+    chunks.append(text[start:])
+    return chunks
+
+
+async def _send_chunked_embeds(interaction: discord.Interaction, title: str, lines, color: discord.Color,
+                               message: discord.WebhookMessage = None):
+    """Send lines as one ephemeral followup embed, split into numbered embeds when too long.
+
+    Consecutive embeds share a message while they fit Discord's per-message limits, and if
+    message is given (e.g. a progress placeholder) the first message's embeds replace its content.
+    """
+    text = "\n".join(lines)
+    chunks = [text] if len(text) <= 4000 else _chunk_text(text)
+    
+    batches = []
+    batch_size = 0
+    for i, chunk in enumerate(chunks, 1):
+        embed = discord.Embed(
+            title=title if len(chunks) == 1 else f"{title} ({i}/{len(chunks)})",
+            description=chunk,
+            color=color
+        )
+        if not batches or batch_size + len(embed) > MESSAGE_EMBED_CHARS or len(batches[-1]) == MESSAGE_EMBED_COUNT:
+            batches.append([])
+            batch_size = 0
+        batches[-1].append(embed)
+        batch_size += len(embed)
+    
+    for n, embeds in enumerate(batches):
+        if message and n == 0:
+            await message.edit(embeds=embeds)
+        else:
+            await interaction.followup.send(embeds=embeds, ephemeral=True, allowed_mentions=_NO_MENTIONS)
+
+
+# One cooldown per guild shared by every bulk invite command {guild_id: Cooldown}
+_bulk_invite_cooldowns = {}
+
+
+def _bulk_invite_cooldown():
+    """Check applying the shared per-guild bulk invite cooldown; non-admins are rejected later and don't consume it"""
+    def predicate(interaction: discord.Interaction) -> bool:
+        user = interaction.user
+        if not (isinstance(user, discord.Member) and user.guild_permissions.administrator):
+            return True
+        
+        bucket = _bulk_invite_cooldowns.get(interaction.guild_id)
+        if bucket is None:
+            bucket = _bulk_invite_cooldowns[interaction.guild_id] = app_commands.Cooldown(1, BULK_INVITE_COOLDOWN)
+        retry_after = bucket.update_rate_limit()
+        if retry_after:
+            raise app_commands.CommandOnCooldown(bucket, retry_after)
+        return True
+    
+    return app_commands.check(predicate)
+
+
+def _now() -> datetime:
+    """Current UTC time for embed timestamps (skips the local-time conversion)"""
+    return datetime.now(timezone.utc)
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_join_day(day: str) -> str:
+    """Format the YYYY-MM-DD prefix of a stored join time as mm/dd/yy"""
+    try:
+        return date.fromisoformat(day).strftime('%m/%d/%y')
+    except ValueError:
+        return "Unknown"
+
+
+@functools.lru_cache(maxsize=64)
+def _fmt_label(value: str) -> str:
+    """Format a stored request type or status (e.g. "email_sent") as a display label"""
+    return value.replace('_', ' ').title()
+
+
+def _env_id(name: str) -> int:
+    """Read a Discord ID from the environment, treating unset, blank or invalid values as 0 (not configured)"""
+    value = os.getenv(name, '').strip()
+    if not value:
+        return 0
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"⚠️ Ignoring invalid {name}: {value!r}")
+        return 0
+
+
+@dataclass(frozen=True, slots=True)
+class VIPConfig:
+    """Guild, role and channel IDs for the VIP upgrade system"""
+    vip_channel_id: int
+    vip_role_id: int
+    guild_id: int
+    staff_channel_id: int
+    
+    @classmethod
+    def from_env(cls) -> "VIPConfig":
+        """Read and coerce all IDs from the environment (0 when unset or invalid)"""
+        return cls(
+            vip_channel_id=_env_id('VIP_UPGRADE_CHANNEL_ID'),
+            vip_role_id=_env_id('VIP_ROLE_ID'),
+            guild_id=_env_id('DISCORD_GUILD_ID'),
+            staff_channel_id=_env_id('STAFF_NOTIFICATION_CHANNEL_ID'),
+        )
+
+
 class VIPUpgrade(commands.Cog):
     """VIP upgrade system with invite tracking and staff attribution"""
     
     def __init__(self, bot):
         self.bot = bot
-        self.VIP_UPGRADE_CHANNEL_ID = int(os.getenv('VIP_UPGRADE_CHANNEL_ID', '0'))
-        self.VIP_ROLE_ID = os.getenv('VIP_ROLE_ID', '0')
-        self.GUILD_ID = os.getenv('DISCORD_GUILD_ID', '0')
-        self.STAFF_NOTIFICATION_CHANNEL_ID = int(os.getenv('STAFF_NOTIFICATION_CHANNEL_ID', '0'))
+        self.cfg = VIPConfig.from_env()
+        
+        # Cache of guild invites {guild_id: {code: invite}} with fetch times {guild_id: monotonic}
+        self._invite_cache = {}
+        self._invite_cache_fetched_at = {}
+        
+        # Cache of VIP request listings {status: (monotonic, requests)}
+        self._requests_cache = {}
+        
+        # Resolved VIP role per guild {guild_id: role} and bot avatar URL (set in cog_load)
+        self._vip_roles = {}
+        self._bot_avatar_url = None
         
-        # Add persistent views
-        self.bot.add_view(VIPUpgradeView())
+        # Channel used for staff invites per guild {guild_id: channel_id}
+        self._invite_channel_by_guild = {}
+        
+        # In-flight invite user page queries {(invite_code, offset): task}
+        self._inflight_invite_lookups = {}
+        
+        # Sticky embed message per channel {channel_id: message_id}, backed by the sticky_messages table
+        self._sticky_message_ids = {}
+        
+        # Background DM sends, kept referenced until they finish
+        self._pending_dms = set()
+        
+        # Add persistent views (stateless, so one instance serves every sticky message)
+        self._vip_view = VIPUpgradeView()
+        self.bot.add_view(self._vip_view)
     
     async def cog_load(self):
         """Called when cog is loaded"""
+        self._sticky_embed = self._build_sticky_embed()
+        self._vip_stats_embed = self._build_vip_stats_embed()
+        self._approval_dm_embed = self._build_approval_dm_embed()
+        self._test_dm_embed = self._build_test_dm_embed()
+        self._bot_avatar_url = self.bot.user.display_avatar.url if self.bot.user else None
         logger.info("👑 VIP Upgrade system loaded")
     
+    async def cog_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        """Tell admins when a bulk invite command is still cooling down"""
+        if isinstance(error, app_commands.CommandOnCooldown):
+            await interaction.response.send_message(
+                f"⏳ Another bulk invite operation ran recently. Try again in {error.retry_after:.0f}s.",
+                ephemeral=True,
+                allowed_mentions=_NO_MENTIONS
+            )
+    
+    def _build_vip_stats_embed(self):
+        """Build the static /vip_stats embed (timestamp is added at send time)"""
+        embed = discord.Embed(
+            title="📊 VIP Upgrade Statistics",
+            description="Overview of VIP upgrade system performance",
+            color=discord.Color.blue()
+        )
+        
+        # Placeholder stats - would be populated from database
+        embed.add_field(name="Total Requests", value="🔢 Coming Soon", inline=True)
+        embed.add_field(name="Approved", value="✅ Coming Soon", inline=True)
+        embed.add_field(name="Pending", value="⏳ Coming Soon", inline=True)
+        embed.add_field(name="Conversion Rate", value="📈 Coming Soon", inline=True)
+        embed.add_field(name="Top Staff", value="👑 Coming Soon", inline=True)
+        embed.add_field(name="This Month", value="📅 Coming Soon", inline=True)
+        return embed
+    
+    def _build_approval_dm_embed(self):
+        """Build the static VIP approval DM embed (timestamp is added at send time)"""
+        embed = discord.Embed(
+            title="🎉 VIP Access Granted!",
+            description=(
+                "Congratulations! Your VIP upgrade request has been approved.\n\n"
+                "You now have access to:\n"
+                "• 📈 Premium trading signals\n"
+                "• 🔍 Detailed market analysis\n"
+                "• 💎 VIP-only channels\n"
+                "• 🚀 Priority support"
+            ),
+            color=discord.Color.gold()
+        )
+        embed.set_footer(text="Welcome to Zinrai VIP!")
+        return embed
+    
+    def _build_test_dm_embed(self):
+        """Build the static /test_dm embed"""
+        embed = discord.Embed(
+            title="🧪 DM Test Message",
+            description="This is a test message from the Zinrai Server Bot to verify DM functionality.",
+            color=discord.Color.blue()
+        )
+        embed.add_field(
+            name="✅ Success!",
+            value="If you're seeing this message, the bot can successfully send you DMs.",
+            inline=False
+        )
+        return embed
+    
+    def _build_sticky_embed(self):
+        """Build the static VIP upgrade sticky embed (footer icon is added at send time)"""
+        embed = discord.Embed(
+            title=_STICKY_TITLE,
+            description=(
+                "Welcome to the VIP upgrade system! Upgrade your account to unlock "
+                "premium trading signals, exclusive analysis, and VIP-only benefits."
+            ),
+            color=discord.Color.gold()
+        )
+        
+        embed.add_field(
+            name="🎯 VIP Benefits",
+            value=(
+                "• 📈 Premium trading signals\n"
+                "• 🔍 Detailed market analysis\n"
+                "• 💎 VIP-only channels\n"
+                "• 🚀 Priority support\n"
+                "• 📊 Advanced trading tools"
+            ),
+            inline=True
+        )
+        
+        embed.add_field(
+            name="📋 How It Works",
+            value=(
+                "1️⃣ Click **Upgrade to VIP** below\n"
+                "2️⃣ Choose your account type\n"
+                "3️⃣ Follow the guided process\n"
+                "4️⃣ Get VIP access within 24-48h"
+            ),
+            inline=True
+        )
+        
+        embed.add_field(
+            name="ℹ️ Requirements",
+            value=(
+                "• Valid Vantage trading account\n"
+                "• Account verification completed\n"
+                "• Minimum deposit requirement met\n"
+                "• Follow attribution guidelines"
+            ),
+            inline=False
+        )
+        
+        return embed
+    
+    async def _refresh_invite_cache(self, guild):
+        """Fetch all guild invites from Discord and cache them by code"""
+        invites = {invite.code: invite for invite in await guild.invites()}
+        self._invite_cache[guild.id] = invites
+        self._invite_cache_fetched_at[guild.id] = time.monotonic()
+        return invites
+    
+    async def _get_invite_by_code(self, guild, invite_code):
+        """Look up a guild invite by code, only hitting Discord on a stale cache or miss"""
+        cached = self._invite_cache.get(guild.id)
+        fetched_at = self._invite_cache_fetched_at.get(guild.id, 0)
+        if cached and invite_code in cached and time.monotonic() - fetched_at < INVITE_CACHE_TTL:
+            return cached[invite_code]
+        
+        invites = await self._refresh_invite_cache(guild)
+        return invites.get(invite_code)
+    
+    async def _get_guild_invites(self, guild, force_refresh=False):
+        """List the guild's invites, only hitting Discord when the cache is cold or stale (or force_refresh is set)"""
+        cached = self._invite_cache.get(guild.id)
+        fetched_at = self._invite_cache_fetched_at.get(guild.id, 0)
+        if force_refresh or cached is None or time.monotonic() - fetched_at >= INVITE_CACHE_TTL:
+            cached = await self._refresh_invite_cache(guild)
+        return list(cached.values())
+    
+    def _remember_invite(self, guild, invite):
+        """Add a newly created invite to a warm cache"""
+        if guild.id in self._invite_cache:
+            self._invite_cache[guild.id][invite.code] = invite
+    
+    def _forget_invite(self, guild, invite_code):
+        """Drop a deleted invite from the cache"""
+        self._invite_cache.get(guild.id, {}).pop(invite_code, None)
+    
+    @commands.Cog.listener()
+    async def on_invite_create(self, invite):
+        """Add new invites to a warm cache instead of refetching the list"""
+        if invite.guild and invite.guild.id in self._invite_cache:
+            self._invite_cache[invite.guild.id][invite.code] = invite
+    
+    @commands.Cog.listener()
+    async def on_invite_delete(self, invite):
+        """Drop deleted invites from the cache"""
+        if invite.guild:
+            self._forget_invite(invite.guild, invite.code)
+    
+    async def _delete_invite_by_code(self, guild, invite_code, reason):
+        """Delete a guild invite by code, returning whether Discord removed it"""
+        discord_invite = await self._get_invite_by_code(guild, invite_code)
+        if not discord_invite:
+            return False
+        
+        try:
+            await discord_invite.delete(reason=reason)
+            return True
+        except discord.NotFound:
+            # Deleted elsewhere since it was cached
+            return False
+        except Exception as e:
+            logger.warning(f"Could not delete Discord invite {invite_code}: {e}")
+            return False
+        finally:
+            self._forget_invite(guild, invite_code)
+    
+    async def _get_invite_user_page(self, invite_code, offset):
+        """Fetch one page of invite users, sharing the query with concurrent identical requests"""
+        key = (invite_code, offset)
+        task = self._inflight_invite_lookups.get(key)
+        if task is None:
+            task = asyncio.ensure_future(asyncio.to_thread(
+                self.bot.db.get_invite_user_summary, invite_code, INVITE_USERS_PAGE_SIZE, offset
+            ))
+            self._inflight_invite_lookups[key] = task
+            task.add_done_callback(lambda _: self._inflight_invite_lookups.pop(key, None))
+        
+        # Shield so one cancelled command doesn't cancel the query for the others
+        return await asyncio.shield(task)
+    
+    async def _resolve_members(self, guild, user_ids):
+        """Map user ids to guild members, querying the gateway once for ids missing from the cache"""
+        members = {}
+        missing = []
+        for user_id in user_ids:
+            member = guild.get_member(user_id)
+            if member:
+                members[user_id] = member
+            else:
+                missing.append(user_id)
+        
+        # Users who left simply come back absent; query_members accepts at most 100 ids.
+        # The wait is bounded so callers can still answer inside the interaction window.
+        for start in range(0, len(missing), 100):
+            chunk = missing[start:start + 100]
+            try:
+                queried = await asyncio.wait_for(
+                    guild.query_members(user_ids=chunk, limit=len(chunk), cache=True),
+                    timeout=MEMBER_QUERY_TIMEOUT
+                )
+                for member in queried:
+                    members[member.id] = member
+            except (asyncio.TimeoutError, discord.ClientException) as e:
+                logger.warning(f"Could not query {len(chunk)} uncached members: {e}")
+        
+        return members
+    
+    def _staff_usernames(self, staff_configs):
+        """Map staff ids to display names, falling back to "User <id>" for uncached users"""
+        usernames = {}
+        for config in staff_configs:
+            staff_id = config['staff_id']
+            user = self.bot.get_user(staff_id)
+            usernames[staff_id] = user.display_name if user else f"User {staff_id}"
+        return usernames
+    
+    def _get_vip_role(self, guild):
+        """Resolve the configured VIP role for a guild, caching the lookup"""
+        vip_role = self._vip_roles.get(guild.id)
+        if vip_role is None and self.cfg.vip_role_id:
+            vip_role = guild.get_role(self.cfg.vip_role_id)
+            if vip_role:
+                self._vip_roles[guild.id] = vip_role
+        return vip_role
+    
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role):
+        """Forget the cached VIP role if it gets deleted"""
+        if self._vip_roles.get(role.guild.id) == role:
+            del self._vip_roles[role.guild.id]
+    
+    def _get_invite_channel(self, guild):
+        """Pick the channel staff invites are created in, reusing the last pick for this guild"""
+        channel_id = self._invite_channel_by_guild.get(guild.id)
+        if channel_id:
+            channel = guild.get_channel(channel_id)
+            if channel and channel.permissions_for(guild.me).create_instant_invite:
+                return channel
+        
+        invite_channel = None
+        
+        # First priority: use the specific welcome channel ID
+        welcome_channel = guild.get_channel(WELCOME_CHANNEL_ID)
+        if (welcome_channel and 
+            welcome_channel.permissions_for(guild.me).create_instant_invite):
+            invite_channel = welcome_channel
+        
+        # Second priority: find welcome/general channel by name
+        if not invite_channel:
+            for channel in guild.text_channels:
+                if (channel.name.lower() in PREFERRED_INVITE_CHANNELS and 
+                    channel.permissions_for(guild.me).create_instant_invite):
+                    invite_channel = channel
+                    break
+        
+        # Fallback: the system channel, then any channel where bot can create invites
+        if not invite_channel:
+            candidates = (guild.system_channel, *guild.text_channels)
+            invite_channel = next(
+                (c for c in candidates if c and c.permissions_for(guild.me).create_instant_invite),
+                None
+            )
+        
+        if invite_channel:
+            self._invite_channel_by_guild[guild.id] = invite_channel.id
+        return invite_channel
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        """Forget the cached invite channel if it gets deleted"""
+        if self._invite_channel_by_guild.get(channel.guild.id) == channel.id:
+            del self._invite_channel_by_guild[channel.guild.id]
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        """Re-pick the invite channel when its name or permissions change"""
+        if self._invite_channel_by_guild.get(after.guild.id) == after.id:
+            del self._invite_channel_by_guild[after.guild.id]
+    
+    async def _get_vip_requests(self, status, page=1):
+        """Get one page of VIP requests and the total count, reusing a recent result for the same filter"""
+        key = (status, page)
+        cached = self._requests_cache.get(key)
+        if cached and time.monotonic() - cached[0] < VIP_REQUESTS_CACHE_TTL:
+            return cached[1]
+        
+        # Served by idx_vip_requests_status_created / idx_vip_requests_created; keep them when changing the schema
+        result = await asyncio.to_thread(
+            self.bot.db.get_vip_requests_page, status, VIP_REQUESTS_PAGE_SIZE, (page - 1) * VIP_REQUESTS_PAGE_SIZE
+        )
+        now = time.monotonic()
+        # Drop expired pages so arbitrary page numbers don't accumulate
+        for stale in [k for k, (fetched_at, _) in self._requests_cache.items() if now - fetched_at >= VIP_REQUESTS_CACHE_TTL]:
+            del self._requests_cache[stale]
+        self._requests_cache[key] = (now, result)
+        return result
+    
+    def _send_dm_in_background(self, user, embed, what):
+        """Send a non-critical DM without holding up the interaction, logging failures"""
+        async def send():
+            try:
+                await user.send(embed=embed)
+            except discord.Forbidden:
+                logger.warning(f"Couldn't send {what} DM to {user.name}")
+            except Exception as e:
+                logger.warning(f"Couldn't send {what} DM to {user.name}: {e}")
+        
+        task = asyncio.create_task(send())
+        self._pending_dms.add(task)
+        task.add_done_callback(self._pending_dms.discard)
+    
+    async def _remember_sticky_message(self, channel, message):
+        """Record a channel's sticky embed message in memory and in the database"""
+        self._sticky_message_ids[channel.id] = message.id
+        await asyncio.to_thread(self.bot.db.set_sticky_message_id, channel.id, message.id)
+    
     async def setup_sticky_embed(self, channel):
         """Set up the sticky embed in VIP upgrade channel"""
         try:
-            # Check if sticky embed already exists
-            async for message in channel.history(limit=50):
-                if message.author == self.bot.user and message.embeds:
-                    embed = message.embeds[0]
-                    if embed.title == "👑 VIP Upgrade Center":
-                        logger.info(f"✅ VIP upgrade sticky embed already exists in {channel.name}")
-                        return message
-            
-            # Clear old bot messages to avoid duplicates
+            # Fast path: fetch the sticky embed we posted last time directly
+            cached_id = self._sticky_message_ids.get(channel.id)
+            if cached_id is None:
+                cached_id = await asyncio.to_thread(self.bot.db.get_sticky_message_id, channel.id)
+            if cached_id:
+                try:
+                    message = await channel.fetch_message(cached_id)
+                    self._sticky_message_ids[channel.id] = message.id
+                    logger.info(f"✅ VIP upgrade sticky embed already exists in {channel.name}")
+                    return message
+                except discord.NotFound:
+                    self._sticky_message_ids.pop(channel.id, None)
+                    logger.info(f"🔍 Cached sticky embed {cached_id} missing in {channel.name}, rescanning history")
+            
+            # The sticky embed is pinned, so the pins list finds it in one small request
+            for message in await channel.pins():
+                if message.author == self.bot.user and message.embeds and message.embeds[0].title == _STICKY_TITLE:
+                    await self._remember_sticky_message(channel, message)
+                    logger.info(f"✅ VIP upgrade sticky embed already exists in {channel.name}")
+                    return message
+            
+            # One pass over recent history finds a legacy, unpinned sticky embed, collecting
+            # the other bot messages to clear (avoiding duplicates) in case there is none
             messages_to_delete = []
             async for message in channel.history(limit=20):
-                if message.author == self.bot.user:
-                    messages_to_delete.append(message)
+                if message.author != self.bot.user:
+                    continue
+                if message.embeds and message.embeds[0].title == _STICKY_TITLE:
+                    await self._remember_sticky_message(channel, message)
+                    logger.info(f"✅ VIP upgrade sticky embed already exists in {channel.name}")
+                    return message
+                messages_to_delete.append(message)
+            
+            # Bulk-delete in a single request; Discord only allows this for
+            # messages younger than 14 days, so older ones go one at a time
+            bulk_cutoff = _now() - timedelta(days=14)
+            single_deletes = [m for m in messages_to_delete if m.created_at <= bulk_cutoff]
+            bulk_deletes = [m for m in messages_to_delete if m.created_at > bulk_cutoff]
+            
+            if len(bulk_deletes) > 1:
+                try:
+                    await channel.delete_messages(bulk_deletes)
+                except discord.HTTPException as e:
+                    logger.warning(f"⚠️ Bulk delete failed in {channel.name}, falling back to single deletes: {e}")
+                    single_deletes.extend(bulk_deletes)
+            else:
+                single_deletes.extend(bulk_deletes)
             
-            for message in messages_to_delete:
+            for message in single_deletes:
                 try:
                     await message.delete()
                 except:
                     pass
             
-            # Create the main VIP upgrade embed
-            embed = discord.Embed(
-                title="👑 VIP Upgrade Center",
-                description=(
-                    "Welcome to the VIP upgrade system! Upgrade your account to unlock "
-                    "premium trading signals, exclusive analysis, and VIP-only benefits."
-                ),
-                color=discord.Color.gold()
-            )
-            
-            embed.add_field(
-                name="🎯 VIP Benefits",
-                value=(
-                    "• 📈 Premium trading signals\n"
-                    "• 🔍 Detailed market analysis\n"
-                    "• 💎 VIP-only channels\n"
-                    "• 🚀 Priority support\n"
-                    "• 📊 Advanced trading tools"
-                ),
-                inline=True
-            )
-            
-            embed.add_field(
-                name="📋 How It Works",
-                value=(
-                    "1️⃣ Click **Upgrade to VIP** below\n"
-                    "2️⃣ Choose your account type\n"
-                    "3️⃣ Follow the guided process\n"
-                    "4️⃣ Get VIP access within 24-48h"
-                ),
-                inline=True
-            )
-            
-            embed.add_field(
-                name="ℹ️ Requirements",
-                value=(
-                    "• Valid Vantage trading account\n"
-                    "• Account verification completed\n"
-                    "• Minimum deposit requirement met\n"
-                    "• Follow attribution guidelines"
-                ),
-                inline=False
-            )
-            
+            # Reuse the prebuilt VIP upgrade embed, adding the bot avatar footer
+            if self._bot_avatar_url is None:
+                self._bot_avatar_url = self.bot.user.display_avatar.url
+            embed = self._sticky_embed.copy()
             embed.set_footer(
                 text="Click the button below to start your VIP upgrade process",
-                icon_url=self.bot.user.display_avatar.url
+                icon_url=self._bot_avatar_url
             )
             
             # Send with VIP upgrade view
-            view = VIPUpgradeView()
-            message = await channel.send(embed=embed, view=view)
+            message = await channel.send(embed=embed, view=self._vip_view)
             
             # Pin the message
             await message.pin()
             
+            await self._remember_sticky_message(channel, message)
+            
             logger.info(f"✅ VIP upgrade sticky embed set up in {channel.name}")
             return message
             
@@ -128,6 +631,7 @@ class VIPUpgrade(commands.Cog):
     @app_commands.default_permissions(administrator=True)
     async def setup_vip_channel(self, interaction: discord.Interaction, channel: discord.TextChannel = None):
         """Set up VIP upgrade system in a channel"""
+        await interaction.response.defer(ephemeral=True)
         try:
             target_channel = channel or interaction.channel
             
@@ -151,16 +655,16 @@ class VIPUpgrade(commands.Cog):
                     inline=False
                 )
                 
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+                await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             else:
-                await interaction.response.send_message("❌ Failed to set up VIP upgrade system", ephemeral=True)
+                await interaction.followup.send("❌ Failed to set up VIP upgrade system", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 
         except Exception as e:
             logger.error(f"❌ Error in setup_vip_channel: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="vip_requests", description="[STAFF] View pending VIP requests")
-    @app_commands.describe(status="Filter by request status")
+    @app_commands.describe(status="Filter by request status", page="Page of results to show (10 per page)")
     @app_commands.choices(status=[
         app_commands.Choice(name="Pending", value="pending"),
         app_commands.Choice(name="Email Sent", value="email_sent"),
@@ -169,46 +673,51 @@ class VIPUpgrade(commands.Cog):
         app_commands.Choice(name="All", value="all")
     ])
     @app_commands.default_permissions(manage_guild=True)
-    async def view_vip_requests(self, interaction: discord.Interaction, status: str = "pending"):
+    async def view_vip_requests(self, interaction: discord.Interaction, status: str = "pending", page: app_commands.Range[int, 1] = 1):
         """View VIP requests filtered by status"""
         try:
-            requests = self.bot.db.get_vip_requests_by_status(status)
+            requests, total = await self._get_vip_requests(status, page)
             
             embed = discord.Embed(
                 title=f"📋 VIP Requests ({status.title()})",
-                description=f"Found {len(requests)} requests",
+                description=f"Found {total} requests",
                 color=discord.Color.blue(),
-                timestamp=datetime.now()
+                timestamp=_now()
             )
             
             if not requests:
                 embed.add_field(
                     name="📝 No Requests",
-                    value=f"No VIP requests found with status: {status}",
+                    value=(
+                        f"No VIP requests found with status: {status}" if not total
+                        else f"Page {page} is past the last page of results"
+                    ),
                     inline=False
                 )
             else:
-                # Show up to 10 requests
-                for i, request in enumerate(requests[:10]):
+                for request in requests:
+                    created = f"<t:{request['created_ts']}:R>" if request['created_ts'] is not None else "Unknown"
                     embed.add_field(
                         name=f"Request #{request['id']}",
                         value=(
                             f"**User**: <@{request['user_id']}>\n"
-                            f"**Type**: {request['request_type'].replace('_', ' ').title()}\n"
-                            f"**Status**: {request['status'].title()}\n"
-                            f"**Created**: <t:{int(datetime.fromisoformat(request['created_at']).timestamp())}:R>"
+                            f"**Type**: {_fmt_label(request['request_type'])}\n"
+                            f"**Status**: {_fmt_label(request['status'])}\n"
+                            f"**Created**: {created}"
                         ),
                         inline=True
                     )
                 
-                if len(requests) > 10:
-                    embed.set_footer(text=f"Showing 10 of {len(requests)} requests. Use filters to narrow results.")
+                if total > len(requests):
+                    first = (page - 1) * VIP_REQUESTS_PAGE_SIZE + 1
+                    last = first + len(requests) - 1
+                    embed.set_footer(text=f"Showing {first}-{last} of {total} requests. Use the page option to see more.")
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
             logger.error(f"❌ Error viewing VIP requests: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="approve_vip", description="[ADMIN] Approve a VIP request")
     @app_commands.describe(
@@ -218,63 +727,68 @@ class VIPUpgrade(commands.Cog):
     @app_commands.default_permissions(administrator=True)
     async def approve_vip_request(self, interaction: discord.Interaction, request_id: int, user: discord.Member):
         """Approve a VIP request and grant VIP role"""
+        # Ephemeral so failures stay private; the approval itself is a public followup
+        await interaction.response.defer(ephemeral=True)
         try:
             # Update request status
-            success = self.bot.db.update_vip_request_status(request_id, 'completed')
+            success = await asyncio.to_thread(self.bot.db.update_vip_request_status, request_id, 'completed')
+            self._requests_cache.clear()
             
             if not success:
-                await interaction.response.send_message(f"❌ Failed to update request {request_id}", ephemeral=True)
+                await interaction.followup.send(f"❌ Failed to update request {request_id}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
-            # Grant VIP role if configured
-            if self.VIP_ROLE_ID and self.VIP_ROLE_ID != '0':
-                vip_role = interaction.guild.get_role(int(self.VIP_ROLE_ID))
+            # Grant VIP role if configured, before anything reports it as granted
+            role_error = None
+            if self.cfg.vip_role_id:
+                vip_role = self._get_vip_role(interaction.guild)
                 if vip_role:
-                    await user.add_roles(vip_role)
-                    role_text = f"✅ Granted {vip_role.name} role"
+                    try:
+                        await user.add_roles(vip_role)
+                        role_text = f"✅ Granted {vip_role.name} role"
+                    except Exception as e:
+                        logger.error(f"❌ Failed to grant VIP role to {user.name}: {e}")
+                        role_error = e
+                        role_text = f"❌ Could not grant {vip_role.name} role"
                 else:
                     role_text = "⚠️ VIP role not found"
             else:
                 role_text = "⚠️ VIP role not configured"
             
-            # Send confirmation
+            # Build confirmation
+            approved_at = _now()
             embed = discord.Embed(
                 title="✅ VIP Request Approved",
                 description=f"VIP request {request_id} has been approved for {user.mention}",
                 color=discord.Color.green(),
-                timestamp=datetime.now()
+                timestamp=approved_at
             )
             embed.add_field(name="Role Status", value=role_text, inline=False)
             
-            await interaction.response.send_message(embed=embed)
+            # DM in the background, but never tell the user they have VIP when the grant failed
+            if not role_error:
+                dm_embed = self._approval_dm_embed.copy()
+                dm_embed.timestamp = approved_at
+                self._send_dm_in_background(user, dm_embed, "VIP approval")
             
-            # Send DM to user
-            try:
-                dm_embed = discord.Embed(
-                    title="🎉 VIP Access Granted!",
-                    description=(
-                        "Congratulations! Your VIP upgrade request has been approved.\n\n"
-                        "You now have access to:\n"
-                        "• 📈 Premium trading signals\n"
-                        "• 🔍 Detailed market analysis\n"
-                        "• 💎 VIP-only channels\n"
-                        "• 🚀 Priority support"
-                    ),
-                    color=discord.Color.gold(),
-                    timestamp=datetime.now()
+            # The first followup replaces the ephemeral "thinking" message, so confirm to the admin
+            # privately first; the approval notice is then a separate public followup
+            if role_error:
+                await interaction.followup.send(
+                    f"⚠️ Request approved but the VIP role could not be granted: {role_error}",
+                    ephemeral=True,
+                    allowed_mentions=_NO_MENTIONS
                 )
-                dm_embed.set_footer(text="Welcome to Zinrai VIP!")
-                
-                await user.send(embed=dm_embed)
-                
-            except discord.Forbidden:
-                logger.warning(f"Couldn't send VIP approval DM to {user.name}")
+            else:
+                await interaction.followup.send(f"✅ Approved VIP request {request_id}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
+            
+            await interaction.followup.send(embed=embed, ephemeral=False, allowed_mentions=_NO_MENTIONS)
             
             logger.info(f"✅ VIP request {request_id} approved for {user.name}")
             
         except Exception as e:
             logger.error(f"❌ Error approving VIP request: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="deny_vip", description="[ADMIN] Deny a VIP request")
     @app_commands.describe(
@@ -286,10 +800,11 @@ class VIPUpgrade(commands.Cog):
         """Deny a VIP request"""
         try:
             # Update request status
-            success = self.bot.db.update_vip_request_status(request_id, 'denied')
+            success = await asyncio.to_thread(self.bot.db.update_vip_request_status, request_id, 'denied')
+            self._requests_cache.clear()
             
             if not success:
-                await interaction.response.send_message(f"❌ Failed to update request {request_id}", ephemeral=True)
+                await interaction.response.send_message(f"❌ Failed to update request {request_id}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             # Send confirmation
@@ -297,19 +812,19 @@ class VIPUpgrade(commands.Cog):
                 title="❌ VIP Request Denied",
                 description=f"VIP request {request_id} has been denied",
                 color=discord.Color.red(),
-                timestamp=datetime.now()
+                timestamp=_now()
             )
             
             if reason:
                 embed.add_field(name="Reason", value=reason, inline=False)
             
-            await interaction.response.send_message(embed=embed)
+            await interaction.response.send_message(embed=embed, allowed_mentions=_NO_MENTIONS)
             
             logger.info(f"❌ VIP request {request_id} denied. Reason: {reason}")
             
         except Exception as e:
             logger.error(f"❌ Error denying VIP request: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="create_staff_invite", description="[ADMIN] Create invite for staff member (must be in config)")
     @app_commands.describe(
@@ -318,50 +833,29 @@ class VIPUpgrade(commands.Cog):
     @app_commands.default_permissions(administrator=True)
     async def create_staff_invite(self, interaction: discord.Interaction, staff_member: discord.Member):
         """Create a permanent invite link for a staff member using config file"""
+        await interaction.response.defer(ephemeral=True)
         try:
             # Check if staff member exists in config
-            staff_config = self.bot.db.get_staff_by_discord_id(staff_member.id)
+            staff_config = await asyncio.to_thread(self.bot.db.get_staff_by_discord_id, staff_member.id)
             if not staff_config:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"❌ **{staff_member.display_name}** is not found in the staff configuration file.\n"
                     f"Please add them to `staff_config.json` first with their Discord ID: `{staff_member.id}`",
-                    ephemeral=True
+                    ephemeral=True,
+                    allowed_mentions=_NO_MENTIONS
                 )
                 return
             
             # Create permanent server invite using first available channel
             if not interaction.guild:
-                await interaction.response.send_message("❌ This command must be run in a server", ephemeral=True)
+                await interaction.followup.send("❌ This command must be run in a server", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             # Find the welcome channel first, then fallback to other channels
-            invite_channel = None
-            WELCOME_CHANNEL_ID = 1401614581503365244
-            preferred_channels = ['welcome', 'general', 'lobby', 'main']
-            
-            # First priority: use the specific welcome channel ID
-            welcome_channel = interaction.guild.get_channel(WELCOME_CHANNEL_ID)
-            if (welcome_channel and 
-                welcome_channel.permissions_for(interaction.guild.me).create_instant_invite):
-                invite_channel = welcome_channel
-            
-            # Second priority: find welcome/general channel by name
-            if not invite_channel:
-                for channel in interaction.guild.text_channels:
-                    if (channel.name.lower() in preferred_channels and 
-                        channel.permissions_for(interaction.guild.me).create_instant_invite):
-                        invite_channel = channel
-                        break
-            
-            # Fallback: any channel where bot can create invites
-            if not invite_channel:
-                for channel in interaction.guild.text_channels:
-                    if channel.permissions_for(interaction.guild.me).create_instant_invite:
-                        invite_channel = channel
-                        break
+            invite_channel = self._get_invite_channel(interaction.guild)
             
             if not invite_channel:
-                await interaction.response.send_message("❌ Cannot create invite - no suitable channel found", ephemeral=True)
+                await interaction.followup.send("❌ Cannot create invite - no suitable channel found", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
                 
             invite = await invite_channel.create_invite(
@@ -371,16 +865,17 @@ class VIPUpgrade(commands.Cog):
                 unique=True,  # Create unique invite
                 reason=f"Staff invite for {staff_member.display_name}"
             )
+            self._remember_invite(interaction.guild, invite)
             
             # Update config file with invite code
-            success = self.bot.db.update_staff_invite_code(staff_member.id, invite.code)
+            success = await asyncio.to_thread(self.bot.db.update_staff_invite_code, staff_member.id, invite.code)
             
             if success:
                 embed = discord.Embed(
                     title="✅ Staff Invite Created Successfully",
                     description=f"Created permanent invite link for {staff_member.mention}",
                     color=discord.Color.green(),
-                    timestamp=datetime.now()
+                    timestamp=_now()
                 )
                 
                 embed.add_field(
@@ -398,66 +893,65 @@ class VIPUpgrade(commands.Cog):
                     value=f"`{staff_config['vantage_ib_code']}`", 
                     inline=True
                 )
+                embed.add_field(
+                    name="🔗 Invite Link for Easy Copying",
+                    value=f"```{invite.url}```",
+                    inline=False
+                )
                 
                 embed.set_footer(text="This invite link is permanent and will track all users who join through it")
                 
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                
-                # Send the invite link as a separate message for easy copying
-                await interaction.followup.send(f"🔗 **Invite Link for Easy Copying:**\n{invite.url}", ephemeral=True)
+                # Build the DM for the staff member with their invite link
+                dm_embed = discord.Embed(
+                    title="🎉 Your Personal Invite Link is Ready!",
+                    description="You now have a permanent invite link that will track VIP conversions to you.",
+                    color=discord.Color.blue()
+                )
+                dm_embed.add_field(
+                    name="🔗 Your Invite Link",
+                    value=f"[Click here to copy your link]({invite.url})",
+                    inline=False
+                )
+                dm_embed.add_field(
+                    name="📊 How It Works",
+                    value=(
+                        "• Share this link to invite new members\n"
+                        "• When they upgrade to VIP, you get credit\n"
+                        "• Track your stats with `/invite_stats`\n"
+                        "• All VIP upgrades will use your referral links"
+                    ),
+                    inline=False
+                )
                 
-                # Send DM to staff member with their invite link
+                # DM the staff member first so the outcome can go in the single reply to the admin
                 try:
-                    dm_embed = discord.Embed(
-                        title="🎉 Your Personal Invite Link is Ready!",
-                        description="You now have a permanent invite link that will track VIP conversions to you.",
-                        color=discord.Color.blue()
-                    )
-                    dm_embed.add_field(
-                        name="🔗 Your Invite Link",
-                        value=f"[Click here to copy your link]({invite.url})",
-                        inline=False
-                    )
-                    dm_embed.add_field(
-                        name="📊 How It Works",
-                        value=(
-                            "• Share this link to invite new members\n"
-                            "• When they upgrade to VIP, you get credit\n"
-                            "• Track your stats with `/invite_stats`\n"
-                            "• All VIP upgrades will use your referral links"
-                        ),
-                        inline=False
-                    )
-                    
                     await staff_member.send(embed=dm_embed)
-                    
                     # Send a separate message with just the link for easy copying
                     await staff_member.send(f"🔗 **Your invite link for easy copying:**\n{invite.url}")
-                    
-                    await interaction.followup.send(f"✅ **DM sent successfully** to {staff_member.mention}", ephemeral=True)
-                    
+                    dm_status = f"✅ **DM sent successfully** to {staff_member.mention}"
                 except discord.Forbidden:
                     logger.warning(f"Couldn't send invite DM to {staff_member.name} - DMs disabled")
-                    await interaction.followup.send(
+                    dm_status = (
                         f"⚠️ **Could not send DM** to {staff_member.mention}\n"
                         f"They may have DMs disabled from server members.\n"
-                        f"Please share the invite link with them manually:\n{invite.url}", 
-                        ephemeral=True
+                        f"Please share the invite link above with them manually."
                     )
-                except Exception as dm_error:
-                    logger.error(f"Error sending DM to {staff_member.name}: {dm_error}")
-                    await interaction.followup.send(
-                        f"❌ **Error sending DM** to {staff_member.mention}: {str(dm_error)}\n"
-                        f"Please share the invite link with them manually:\n{invite.url}", 
-                        ephemeral=True
+                except Exception as e:
+                    logger.error(f"Error sending DM to {staff_member.name}: {e}")
+                    dm_status = (
+                        f"❌ **Error sending DM** to {staff_member.mention}: {str(e)[:500]}\n"
+                        f"Please share the invite link above with them manually."
                     )
+                
+                embed.add_field(name="📨 Staff DM", value=dm_status, inline=False)
+                await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
             else:
-                await interaction.response.send_message("❌ Failed to save staff invite configuration", ephemeral=True)
+                await interaction.followup.send("❌ Failed to save staff invite configuration", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
             logger.error(f"❌ Error creating staff invite: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="test_dm", description="[ADMIN] Test if bot can DM a user")
     @app_commands.describe(user="User to test DM with")
@@ -465,22 +959,12 @@ class VIPUpgrade(commands.Cog):
     async def test_dm(self, interaction: discord.Interaction, user: discord.Member):
         """Test if the bot can send DMs to a specific user"""
         try:
-            test_embed = discord.Embed(
-                title="🧪 DM Test Message",
-                description="This is a test message from the Zinrai Server Bot to verify DM functionality.",
-                color=discord.Color.blue()
-            )
-            test_embed.add_field(
-                name="✅ Success!",
-                value="If you're seeing this message, the bot can successfully send you DMs.",
-                inline=False
-            )
-            
-            await user.send(embed=test_embed)
+            await user.send(embed=self._test_dm_embed)
             
             await interaction.response.send_message(
                 f"✅ **DM Test Successful!** Successfully sent test message to {user.mention}",
-                ephemeral=True
+                ephemeral=True,
+                allowed_mentions=_NO_MENTIONS
             )
             
         except discord.Forbidden:
@@ -490,12 +974,14 @@ class VIPUpgrade(commands.Cog):
                 f"• They have DMs disabled from server members\n"
                 f"• They have blocked the bot\n"
                 f"• Their privacy settings prevent DMs",
-                ephemeral=True
+                ephemeral=True,
+                allowed_mentions=_NO_MENTIONS
             )
         except Exception as e:
             await interaction.response.send_message(
                 f"❌ **DM Test Error!** Error sending DM to {user.mention}: {str(e)}",
-                ephemeral=True
+                ephemeral=True,
+                allowed_mentions=_NO_MENTIONS
             )
     
     @app_commands.command(name="list_staff_invites", description="[ADMIN] List all configured staff invites")
@@ -504,7 +990,7 @@ class VIPUpgrade(commands.Cog):
         """List all configured staff invite links"""
         try:
             # Get all staff configurations from database
-            staff_configs = self.bot.db.get_all_staff_configs()
+            staff_configs = await asyncio.to_thread(self.bot.db.get_all_staff_configs)
             
             if not staff_configs:
                 embed = discord.Embed(
@@ -517,29 +1003,32 @@ class VIPUpgrade(commands.Cog):
                     value="Use `/create_staff_invite` to create invite links for your staff members.",
                     inline=False
                 )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+                await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             embed = discord.Embed(
                 title="📋 Staff Invite Configuration",
                 description=f"Currently configured staff invite links ({len(staff_configs)} total)",
                 color=discord.Color.blue(),
-                timestamp=datetime.now()
+                timestamp=_now()
             )
             
-            for config in staff_configs[:10]:  # Limit to 10 to avoid embed size limits
+            shown_configs = staff_configs[:10]  # Limit to 10 to avoid embed size limits
+            all_stats = await asyncio.to_thread(self.bot.db.get_staff_vip_stats_bulk, [config['staff_id'] for config in shown_configs])
+            
+            for config in shown_configs:
                 staff_member = interaction.guild.get_member(config['staff_id'])
                 staff_name = staff_member.display_name if staff_member else config['staff_username']
                 
                 # Get stats for this staff member
-                stats = self.bot.db.get_staff_vip_stats(config['staff_id'])
+                stats = all_stats[config['staff_id']]
                 
                 embed.add_field(
                     name=f"👤 {staff_name}",
                     value=(
                         f"🔗 Code: `{config['invite_code']}`\n"
                         f"📊 Invites: {stats['total_invites']} | VIP: {stats['vip_conversions']}\n"
-                        f"📈 Rate: {stats['conversion_rate']:.1f}%"
+                        f"📈 Rate: {_percent(stats['vip_conversions'], stats['total_invites'])}"
                     ),
                     inline=True
                 )
@@ -547,56 +1036,46 @@ class VIPUpgrade(commands.Cog):
             if len(staff_configs) > 10:
                 embed.set_footer(text=f"Showing first 10 of {len(staff_configs)} staff configurations")
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
             logger.error(f"❌ Error listing staff invites: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="delete_staff_invite", description="[ADMIN] Delete a specific staff member's invite")
     @app_commands.describe(staff_member="The staff member whose invite to delete")
     @app_commands.default_permissions(administrator=True)
     async def delete_staff_invite(self, interaction: discord.Interaction, staff_member: discord.Member):
         """Delete a specific staff member's invite link"""
+        await interaction.response.defer(ephemeral=True)
         try:
             # Check if staff member has an invite configured
-            staff_config = self.bot.db.get_staff_by_discord_id(staff_member.id)
+            staff_config = await asyncio.to_thread(self.bot.db.get_staff_by_discord_id, staff_member.id)
             if not staff_config or not staff_config.get('invite_code'):
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"❌ **{staff_member.display_name}** doesn't have an invite link configured.",
-                    ephemeral=True
+                    ephemeral=True,
+                    allowed_mentions=_NO_MENTIONS
                 )
                 return
             
             invite_code = staff_config['invite_code']
             
             # Find and delete the Discord invite
-            discord_invite = None
-            for invite in await interaction.guild.invites():
-                if invite.code == invite_code:
-                    discord_invite = invite
-                    break
-            
-            # Delete from Discord if it exists
-            if discord_invite:
-                try:
-                    await discord_invite.delete(reason=f"Staff invite deletion by {interaction.user.display_name}")
-                    discord_deleted = True
-                except Exception as e:
-                    logger.warning(f"Could not delete Discord invite {invite_code}: {e}")
-                    discord_deleted = False
-            else:
-                discord_deleted = False
+            discord_deleted = await self._delete_invite_by_code(
+                interaction.guild, invite_code,
+                reason=f"Staff invite deletion by {interaction.user.display_name}"
+            )
             
             # Clear the invite code from database
-            success = self.bot.db.update_staff_invite_code(staff_member.id, None)
+            success = await asyncio.to_thread(self.bot.db.update_staff_invite_code, staff_member.id, None)
             
             if success:
                 embed = discord.Embed(
                     title="✅ Staff Invite Deleted",
                     description=f"Successfully removed invite link for {staff_member.mention}",
                     color=discord.Color.green(),
-                    timestamp=datetime.now()
+                    timestamp=_now()
                 )
                 
                 embed.add_field(
@@ -615,61 +1094,46 @@ class VIPUpgrade(commands.Cog):
                     inline=False
                 )
                 
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+                await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 logger.info(f"🗑️ Deleted staff invite for {staff_member.display_name} (code: {invite_code})")
                 
             else:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"❌ Failed to remove invite configuration for {staff_member.mention}",
-                    ephemeral=True
+                    ephemeral=True,
+                    allowed_mentions=_NO_MENTIONS
                 )
                 
         except Exception as e:
             logger.error(f"❌ Error deleting staff invite: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="delete_invite_by_code", description="[ADMIN] Delete invite by specific invite code")
     @app_commands.describe(invite_code="The invite code to delete (e.g., F82HtFnC6X)")
     @app_commands.default_permissions(administrator=True)
     async def delete_invite_by_code(self, interaction: discord.Interaction, invite_code: str):
         """Delete an invite by its specific code - useful when Discord IDs don't match"""
+        await interaction.response.defer(ephemeral=True)
         try:
             # Find the invite in database
-            staff_configs = self.bot.db.get_all_staff_configs()
-            target_config = None
-            
-            for config in staff_configs:
-                if config.get('invite_code') == invite_code:
-                    target_config = config
-                    break
+            target_config = await asyncio.to_thread(self.bot.db.get_staff_invite_by_code, invite_code)
             
             if not target_config:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"❌ **Invite code `{invite_code}` not found** in staff configuration.",
-                    ephemeral=True
+                    ephemeral=True,
+                    allowed_mentions=_NO_MENTIONS
                 )
                 return
             
             # Find and delete the Discord invite
-            discord_invite = None
-            for invite in await interaction.guild.invites():
-                if invite.code == invite_code:
-                    discord_invite = invite
-                    break
-            
-            # Delete from Discord if it exists
-            if discord_invite:
-                try:
-                    await discord_invite.delete(reason=f"Invite deletion by code by {interaction.user.display_name}")
-                    discord_deleted = True
-                except Exception as e:
-                    logger.warning(f"Could not delete Discord invite {invite_code}: {e}")
-                    discord_deleted = False
-            else:
-                discord_deleted = False
+            discord_deleted = await self._delete_invite_by_code(
+                interaction.guild, invite_code,
+                reason=f"Invite deletion by code by {interaction.user.display_name}"
+            )
             
             # Clear the invite code from database
-            success = self.bot.db.update_staff_invite_code(target_config['staff_id'], None)
+            success = await asyncio.to_thread(self.bot.db.update_staff_invite_code, target_config['staff_id'], None)
             
             if success:
                 # Try to find the Discord user
@@ -680,7 +1144,7 @@ class VIPUpgrade(commands.Cog):
                     title="✅ Invite Deleted by Code",
                     description=f"Successfully removed invite `{invite_code}`",
                     color=discord.Color.green(),
-                    timestamp=datetime.now()
+                    timestamp=_now()
                 )
                 
                 embed.add_field(
@@ -716,18 +1180,19 @@ class VIPUpgrade(commands.Cog):
                         inline=False
                     )
                 
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+                await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 logger.info(f"🗑️ Deleted invite by code: {invite_code} for {staff_name}")
                 
             else:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"❌ Failed to remove invite configuration for code `{invite_code}`",
-                    ephemeral=True
+                    ephemeral=True,
+                    allowed_mentions=_NO_MENTIONS
                 )
                 
         except Exception as e:
             logger.error(f"❌ Error deleting invite by code: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="vip_stats", description="View VIP upgrade statistics")
     @app_commands.default_permissions(manage_guild=True)
@@ -735,42 +1200,33 @@ class VIPUpgrade(commands.Cog):
         """Show VIP upgrade statistics"""
         try:
             # This would require database queries for stats
-            embed = discord.Embed(
-                title="📊 VIP Upgrade Statistics",
-                description="Overview of VIP upgrade system performance",
-                color=discord.Color.blue(),
-                timestamp=datetime.now()
-            )
-            
-            # Placeholder stats - would be populated from database
-            embed.add_field(name="Total Requests", value="🔢 Coming Soon", inline=True)
-            embed.add_field(name="Approved", value="✅ Coming Soon", inline=True)
-            embed.add_field(name="Pending", value="⏳ Coming Soon", inline=True)
-            embed.add_field(name="Conversion Rate", value="📈 Coming Soon", inline=True)
-            embed.add_field(name="Top Staff", value="👑 Coming Soon", inline=True)
-            embed.add_field(name="This Month", value="📅 Coming Soon", inline=True)
+            embed = self._vip_stats_embed.copy()
+            embed.timestamp = _now()
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
             logger.error(f"❌ Error showing VIP stats: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="list_invite_users", description="[ADMIN] Show all users who joined through a specific invite")
-    @app_commands.describe(staff_member="The staff member whose invite users to list")
+    @app_commands.describe(
+        staff_member="The staff member whose invite users to list",
+        page="Page of 25 users to show (default 1)"
+    )
     @app_commands.default_permissions(administrator=True)
-    async def list_invite_users(self, interaction: discord.Interaction, staff_member: discord.Member):
+    async def list_invite_users(self, interaction: discord.Interaction, staff_member: discord.Member,
+                                page: app_commands.Range[int, 1] = 1):
         """List all users who joined through a specific staff member's invite"""
+        await interaction.response.defer(ephemeral=True)
         try:
             # Get staff member's invite code
-            staff_config = self.bot.db.get_staff_by_discord_id(staff_member.id)
+            staff_config = await asyncio.to_thread(self.bot.db.get_staff_by_discord_id, staff_member.id)
             if not staff_config or not staff_config.get('invite_code'):
                 # Debug: Let's check if the user exists with a different ID
-                all_configs = self.bot.db.get_all_staff_configs()
-                matching_configs = []
-                for config in all_configs:
-                    if config.get('staff_username', '').lower() == staff_member.display_name.lower():
-                        matching_configs.append(config)
+                matching_configs = await asyncio.to_thread(
+                    self.bot.db.find_staff_by_username_ci, staff_member.display_name
+                )
                 
                 embed = discord.Embed(
                     title="❌ Staff Member Not Found",
@@ -818,15 +1274,16 @@ class VIPUpgrade(commands.Cog):
                         inline=False
                     )
                 
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+                await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             invite_code = staff_config['invite_code']
             
             # Get all users who joined through this invite
-            invite_users = self.bot.db.get_users_by_invite_code(invite_code)
+            offset = (page - 1) * INVITE_USERS_PAGE_SIZE
+            invite_users, total_joins = await self._get_invite_user_page(invite_code, offset)
             
-            if not invite_users:
+            if not total_joins:
                 embed = discord.Embed(
                     title="📋 No Users Found",
                     description=f"No users have joined through **{staff_member.display_name}**'s invite yet.",
@@ -841,7 +1298,16 @@ class VIPUpgrade(commands.Cog):
                     ),
                     inline=False
                 )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+                await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
+                return
+            
+            if not invite_users:
+                last_page = -(-total_joins // INVITE_USERS_PAGE_SIZE)
+                await interaction.followup.send(
+                    f"❌ Page {page} is past the last page ({last_page}) of {total_joins} users.",
+                    ephemeral=True,
+                    allowed_mentions=_NO_MENTIONS
+                )
                 return
             
             # Create embed with user list
@@ -849,7 +1315,7 @@ class VIPUpgrade(commands.Cog):
                 title=f"👥 Users from {staff_member.display_name}'s Invite",
                 description=f"All users who joined through invite code `{invite_code}`",
                 color=discord.Color.blue(),
-                timestamp=datetime.now()
+                timestamp=_now()
             )
             
             embed.add_field(
@@ -857,7 +1323,7 @@ class VIPUpgrade(commands.Cog):
                 value=(
                     f"**Staff Member:** {staff_member.mention}\n"
                     f"**Invite Code:** `{invite_code}`\n"
-                    f"**Total Joins:** {len(invite_users)}"
+                    f"**Total Joins:** {total_joins}"
                 ),
                 inline=False
             )
@@ -867,19 +1333,20 @@ class VIPUpgrade(commands.Cog):
             vip_count = 0
             active_count = 0
             
-            for i, user_data in enumerate(invite_users[:25]):  # Limit to 25 to avoid embed limits
-                user_id = user_data.get('user_id')
-                username = user_data.get('username', 'Unknown')
-                join_date = user_data.get('joined_at', 'Unknown')
-                
+            # Resolve the VIP role once; get_role on a member is a binary search of its role ids
+            vip_role = self._get_vip_role(interaction.guild)
+            
+            # Resolve the page's members in one go, fetching cache misses in a single gateway query
+            members = await self._resolve_members(
+                interaction.guild, [int(user_id) for user_id, _, _ in invite_users if user_id]
+            )
+            
+            for i, (user_id, username, _) in enumerate(invite_users, offset + 1):  # Page is capped at 25 to avoid embed limits
                 # Check if user is still in server
-                member = interaction.guild.get_member(int(user_id)) if user_id else None
+                member = members.get(int(user_id)) if user_id else None
                 
                 # Check if user has VIP role
-                has_vip = False
-                if member and self.VIP_ROLE_ID:
-                    vip_role = interaction.guild.get_role(int(self.VIP_ROLE_ID))
-                    has_vip = vip_role and vip_role in member.roles
+                has_vip = bool(member and vip_role and member.get_role(vip_role.id))
                 
                 if member:
                     active_count += 1
@@ -891,21 +1358,22 @@ class VIPUpgrade(commands.Cog):
                 vip_emoji = "👑" if has_vip else ""
                 user_mention = member.mention if member else f"~~{username}~~"
                 
-                user_list.append(f"{i+1}. {status_emoji} {user_mention} {vip_emoji}")
+                user_list.append(f"{i}. {status_emoji} {user_mention} {vip_emoji}")
             
             if user_list:
                 embed.add_field(
-                    name=f"👥 Users (Showing {len(user_list)}/{len(invite_users)})",
+                    name=f"👥 Users (Showing {len(user_list)}/{total_joins})",
                     value='\n'.join(user_list),
                     inline=False
                 )
             
+                # Membership and VIP status come from the guild, so these cover only the users on this page
                 embed.add_field(
-                    name="📈 Statistics",
+                    name="📈 Statistics (This Page)",
                     value=(
                         f"🟢 **Active in Server:** {active_count}/{len(invite_users)}\n"
                         f"👑 **VIP Members:** {vip_count}/{len(invite_users)}\n"
-                        f"📊 **VIP Conversion Rate:** {(vip_count/len(invite_users)*100):.1f}%"
+                        f"📊 **VIP Conversion Rate:** {_percent(vip_count, len(invite_users))}"
                     ),
                     inline=True
                 )
@@ -920,27 +1388,33 @@ class VIPUpgrade(commands.Cog):
                     inline=True
                 )
             
-            if len(invite_users) > 25:
-                embed.set_footer(text=f"Showing first 25 of {len(invite_users)} users. Use pagination commands for more.")
+            if total_joins > offset + len(invite_users):
+                embed.set_footer(text=f"Showing {offset + 1}-{offset + len(invite_users)} of {total_joins} users. Use page:{page + 1} for more.")
             else:
                 embed.set_footer(text=f"🟢 Active in server | 👑 VIP member | 🔴 Left server")
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
             logger.error(f"❌ Error listing invite users: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="list_users_by_code", description="[ADMIN] Show all users who joined through a specific invite code")
-    @app_commands.describe(invite_code="The invite code to look up (e.g., abc123def)")
+    @app_commands.describe(
+        invite_code="The invite code to look up (e.g., abc123def)",
+        page="Page of 25 users to show (default 1)"
+    )
     @app_commands.default_permissions(administrator=True)
-    async def list_users_by_code(self, interaction: discord.Interaction, invite_code: str):
+    async def list_users_by_code(self, interaction: discord.Interaction, invite_code: str,
+                                 page: app_commands.Range[int, 1] = 1):
         """List all users who joined through a specific invite code"""
+        await interaction.response.defer(ephemeral=True)
         try:
             # Get all users who joined through this invite code
-            invite_users = self.bot.db.get_users_by_invite_code(invite_code)
+            offset = (page - 1) * INVITE_USERS_PAGE_SIZE
+            invite_users, total_joins = await self._get_invite_user_page(invite_code, offset)
             
-            if not invite_users:
+            if not total_joins:
                 embed = discord.Embed(
                     title="📋 No Users Found",
                     description=f"No users have joined through invite code `{invite_code}`.",
@@ -955,16 +1429,20 @@ class VIPUpgrade(commands.Cog):
                     ),
                     inline=False
                 )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+                await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
+                return
+            
+            if not invite_users:
+                last_page = -(-total_joins // INVITE_USERS_PAGE_SIZE)
+                await interaction.followup.send(
+                    f"❌ Page {page} is past the last page ({last_page}) of {total_joins} users.",
+                    ephemeral=True,
+                    allowed_mentions=_NO_MENTIONS
+                )
                 return
             
             # Find staff member who owns this invite
-            staff_config = None
-            staff_configs = self.bot.db.get_all_staff_configs()
-            for config in staff_configs:
-                if config.get('invite_code') == invite_code:
-                    staff_config = config
-                    break
+            staff_config = await asyncio.to_thread(self.bot.db.get_staff_invite_by_code, invite_code)
             
             staff_member = None
             if staff_config:
@@ -975,7 +1453,7 @@ class VIPUpgrade(commands.Cog):
                 title=f"👥 Users from Invite Code `{invite_code}`",
                 description=f"All users who joined through this invite",
                 color=discord.Color.blue(),
-                timestamp=datetime.now()
+                timestamp=_now()
             )
             
             if staff_member and staff_config:
@@ -984,7 +1462,7 @@ class VIPUpgrade(commands.Cog):
                     value=(
                         f"**Staff Member:** {staff_member.mention}\n"
                         f"**IB Code:** {staff_config.get('vantage_ib_code', 'N/A')}\n"
-                        f"**Total Joins:** {len(invite_users)}"
+                        f"**Total Joins:** {total_joins}"
                     ),
                     inline=False
                 )
@@ -994,7 +1472,7 @@ class VIPUpgrade(commands.Cog):
                     value=(
                         f"**Invite Code:** `{invite_code}`\n"
                         f"**Staff Member:** Unknown/Not Found\n"
-                        f"**Total Joins:** {len(invite_users)}"
+                        f"**Total Joins:** {total_joins}"
                     ),
                     inline=False
                 )
@@ -1004,19 +1482,20 @@ class VIPUpgrade(commands.Cog):
             vip_count = 0
             active_count = 0
             
-            for i, user_data in enumerate(invite_users[:25]):  # Limit to 25 to avoid embed limits
-                user_id = user_data.get('user_id')
-                username = user_data.get('username', 'Unknown')
-                join_date = user_data.get('joined_at', 'Unknown')
-                
+            # Resolve the VIP role once; get_role on a member is a binary search of its role ids
+            vip_role = self._get_vip_role(interaction.guild)
+            
+            # Resolve the page's members in one go, fetching cache misses in a single gateway query
+            members = await self._resolve_members(
+                interaction.guild, [int(user_id) for user_id, _, _ in invite_users if user_id]
+            )
+            
+            for i, (user_id, username, join_date) in enumerate(invite_users, offset + 1):  # Page is capped at 25 to avoid embed limits
                 # Check if user is still in server
-                member = interaction.guild.get_member(int(user_id)) if user_id else None
+                member = members.get(int(user_id)) if user_id else None
                 
                 # Check if user has VIP role
-                has_vip = False
-                if member and self.VIP_ROLE_ID:
-                    vip_role = interaction.guild.get_role(int(self.VIP_ROLE_ID))
-                    has_vip = vip_role and vip_role in member.roles
+                has_vip = bool(member and vip_role and member.get_role(vip_role.id))
                 
                 if member:
                     active_count += 1
@@ -1028,47 +1507,39 @@ class VIPUpgrade(commands.Cog):
                 vip_emoji = "👑" if has_vip else ""
                 user_mention = member.mention if member else f"~~{username}~~"
                 
-                # Format join date
-                if join_date and join_date != 'Unknown':
-                    try:
-                        # Assuming join_date is in ISO format
-                        from datetime import datetime as dt
-                        join_dt = dt.fromisoformat(join_date.replace('Z', '+00:00'))
-                        formatted_date = join_dt.strftime('%m/%d/%y')
-                    except:
-                        formatted_date = "Unknown"
-                else:
-                    formatted_date = "Unknown"
+                # Format join date (only the day is shown, so many rows share a cached result)
+                formatted_date = _fmt_join_day(join_date[:10]) if isinstance(join_date, str) else "Unknown"
                 
-                user_list.append(f"{i+1}. {status_emoji} {user_mention} {vip_emoji} `({formatted_date})`")
+                user_list.append(f"{i}. {status_emoji} {user_mention} {vip_emoji} `({formatted_date})`")
             
             if user_list:
                 embed.add_field(
-                    name=f"👥 Users (Showing {len(user_list)}/{len(invite_users)})",
+                    name=f"👥 Users (Showing {len(user_list)}/{total_joins})",
                     value='\n'.join(user_list),
                     inline=False
                 )
             
+                # Membership and VIP status come from the guild, so these cover only the users on this page
                 embed.add_field(
-                    name="📈 Statistics",
+                    name="📈 Statistics (This Page)",
                     value=(
                         f"🟢 **Active in Server:** {active_count}/{len(invite_users)}\n"
                         f"👑 **VIP Members:** {vip_count}/{len(invite_users)}\n"
-                        f"📊 **VIP Conversion Rate:** {(vip_count/len(invite_users)*100):.1f}%"
+                        f"📊 **VIP Conversion Rate:** {_percent(vip_count, len(invite_users))}"
                     ),
                     inline=True
                 )
             
-            if len(invite_users) > 25:
-                embed.set_footer(text=f"Showing first 25 of {len(invite_users)} users. 🟢 Active | 👑 VIP | 🔴 Left | (Join Date)")
+            if total_joins > offset + len(invite_users):
+                embed.set_footer(text=f"Showing {offset + 1}-{offset + len(invite_users)} of {total_joins} users (page:{page + 1} for more). 🟢 Active | 👑 VIP | 🔴 Left | (Join Date)")
             else:
                 embed.set_footer(text=f"🟢 Active in server | 👑 VIP member | 🔴 Left server | (Join Date)")
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
             logger.error(f"❌ Error listing users by code: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="fix_staff_discord_id", description="[ADMIN] Fix Discord ID mismatch for staff member")
     @app_commands.describe(
@@ -1079,34 +1550,29 @@ class VIPUpgrade(commands.Cog):
     async def fix_staff_discord_id(self, interaction: discord.Interaction, staff_member: discord.Member, old_invite_code: str):
         """Fix Discord ID mismatch for a staff member"""
         try:
-            # Find the staff config with the old invite code
-            all_configs = self.bot.db.get_all_staff_configs()
-            target_config = None
-            
-            for config in all_configs:
-                if config.get('invite_code') == old_invite_code:
-                    target_config = config
-                    break
+            # Check and move the invite owner in a single database transaction
+            new_discord_id = staff_member.id
+            status, old_discord_id = await asyncio.to_thread(
+                self.bot.db.reassign_staff_invite, old_invite_code, new_discord_id
+            )
             
-            if not target_config:
+            if status == 'not_found':
                 await interaction.response.send_message(
                     f"❌ No staff configuration found with invite code `{old_invite_code}`",
-                    ephemeral=True
+                    ephemeral=True,
+                    allowed_mentions=_NO_MENTIONS
                 )
                 return
             
-            old_discord_id = target_config.get('staff_id')
-            new_discord_id = staff_member.id
-            
-            if old_discord_id == new_discord_id:
+            if status == 'unchanged':
                 await interaction.response.send_message(
                     f"✅ Discord ID already matches! {staff_member.mention} is correctly configured.",
-                    ephemeral=True
+                    ephemeral=True,
+                    allowed_mentions=_NO_MENTIONS
                 )
                 return
             
-            # Update the Discord ID in the database
-            success = self.bot.db.update_staff_discord_id(old_discord_id, new_discord_id)
+            success = status == 'updated'
             
             if success:
                 embed = discord.Embed(
@@ -1137,18 +1603,19 @@ class VIPUpgrade(commands.Cog):
                     inline=False
                 )
                 
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+                await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 logger.info(f"✅ Fixed Discord ID for {staff_member.display_name}: {old_discord_id} → {new_discord_id}")
                 
             else:
                 await interaction.response.send_message(
                     f"❌ Failed to update Discord ID in database. Please contact a developer.",
-                    ephemeral=True
+                    ephemeral=True,
+                    allowed_mentions=_NO_MENTIONS
                 )
                 
         except Exception as e:
             logger.error(f"❌ Error fixing staff Discord ID: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="manage_invite_permissions", description="[ADMIN] Manage who can create invites")
     @app_commands.describe(
@@ -1159,19 +1626,26 @@ class VIPUpgrade(commands.Cog):
                                       action: str, role: discord.Role = None):
         """Manage server invite creation permissions"""
         if not interaction.user.guild_permissions.administrator:
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
         
         try:
             guild = interaction.guild
             everyone_role = guild.default_role
             
-            if action.lower() == "disable":
-                # Remove create_instant_invite permission from @everyone
-                permissions = everyone_role.permissions
-                permissions.create_instant_invite = False
-                await everyone_role.edit(permissions=permissions)
-                
+            if action.lower() not in ("enable", "disable"):
+                await interaction.response.send_message("❌ Action must be 'enable' or 'disable'", ephemeral=True, allowed_mentions=_NO_MENTIONS)
+                return
+            allowed = action.lower() == "enable"
+            
+            # Work out every permission change first, skipping roles already in the target state
+            edits = []
+            if everyone_role.permissions.create_instant_invite != allowed:
+                edits.append(everyone_role.edit(permissions=_with_invite_permission(everyone_role.permissions, allowed)))
+            if role and role.permissions.create_instant_invite != allowed:
+                edits.append(role.edit(permissions=_with_invite_permission(role.permissions, allowed)))
+            
+            if not allowed:
                 embed = discord.Embed(
                     title="🔒 Invite Creation Disabled",
                     description="Regular members can no longer create invite links. Only staff with specific permissions can create invites.",
@@ -1186,13 +1660,7 @@ class VIPUpgrade(commands.Cog):
                     ),
                     inline=False
                 )
-                
-            elif action.lower() == "enable":
-                # Restore create_instant_invite permission to @everyone
-                permissions = everyone_role.permissions
-                permissions.create_instant_invite = True
-                await everyone_role.edit(permissions=permissions)
-                
+            else:
                 embed = discord.Embed(
                     title="🔓 Invite Creation Enabled",
                     description="All members can now create invite links.",
@@ -1203,42 +1671,37 @@ class VIPUpgrade(commands.Cog):
                     value="This may affect VIP upgrade attribution accuracy since members could join through non-staff invites.",
                     inline=False
                 )
-                
-            else:
-                await interaction.response.send_message("❌ Action must be 'enable' or 'disable'", ephemeral=True)
-                return
             
             # Handle specific role permissions
             if role:
-                role_permissions = role.permissions
-                if action.lower() == "disable":
-                    role_permissions.create_instant_invite = False
+                if not allowed:
                     embed.add_field(
                         name=f"🚫 Role Updated",
                         value=f"Removed invite permissions from {role.mention}",
                         inline=False
                     )
                 else:
-                    role_permissions.create_instant_invite = True
                     embed.add_field(
                         name=f"✅ Role Updated", 
                         value=f"Granted invite permissions to {role.mention}",
                         inline=False
                     )
-                await role.edit(permissions=role_permissions)
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            # Apply the @everyone and role edits concurrently
+            await asyncio.gather(*edits)
+            
+            await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             logger.info(f"Admin {interaction.user.name} {action}d invite creation permissions")
             
         except Exception as e:
             logger.error(f"❌ Error managing invite permissions: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="check_invite_permissions", description="[ADMIN] Check who can create invites")
     async def check_invite_permissions(self, interaction: discord.Interaction):
         """Check current invite creation permissions"""
         if not interaction.user.guild_permissions.administrator:
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
         
         try:
@@ -1249,7 +1712,7 @@ class VIPUpgrade(commands.Cog):
                 title="🔍 Invite Permission Status",
                 description="Current invite creation permissions in this server",
                 color=discord.Color.blue(),
-                timestamp=datetime.now()
+                timestamp=_now()
             )
             
             # Check @everyone permissions
@@ -1260,16 +1723,17 @@ class VIPUpgrade(commands.Cog):
                 inline=False
             )
             
-            # Check roles that can create invites
-            roles_with_invite = []
-            for role in guild.roles:
-                if role != everyone_role and role.permissions.create_instant_invite:
-                    roles_with_invite.append(role.mention)
+            # Check roles that can create invites, stopping once 10 are found
+            roles_with_invite = list(itertools.islice(
+                (role.mention for role in guild.roles
+                 if role != everyone_role and role.permissions.value & _INVITE_PERMISSION_BIT),
+                10
+            ))
             
             if roles_with_invite:
                 embed.add_field(
                     name="🎭 Roles with Invite Permissions",
-                    value="\n".join(roles_with_invite[:10]),  # Limit to 10 roles
+                    value="\n".join(roles_with_invite),  # Limit to 10 roles
                     inline=False
                 )
             else:
@@ -1281,7 +1745,7 @@ class VIPUpgrade(commands.Cog):
             
             # Show staff invite status from database
             staff_invites = []
-            staff_status = self.bot.db.get_staff_invite_status()
+            staff_status = await asyncio.to_thread(self.bot.db.get_staff_invite_status)
             for username, invite_code in staff_status.items():
                 status = f"✅ {invite_code}" if invite_code else "❌ No invite"
                 staff_invites.append(f"**{username}**: {status}")
@@ -1295,11 +1759,11 @@ class VIPUpgrade(commands.Cog):
             
             embed.set_footer(text="💡 Use /manage_invite_permissions to change these settings")
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
             logger.error(f"❌ Error checking invite permissions: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="add_existing_staff_invite", description="[ADMIN] Manually add existing staff invite code")
     @app_commands.describe(
@@ -1310,11 +1774,11 @@ class VIPUpgrade(commands.Cog):
                                       staff_member: discord.Member, invite_code: str):
         """Manually add existing staff invite codes"""
         if not (isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator):
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
         
         try:
-            success = self.bot.db.manually_add_staff_invite(staff_member.id, invite_code)
+            success = await asyncio.to_thread(self.bot.db.manually_add_staff_invite, staff_member.id, invite_code)
             
             if success:
                 embed = discord.Embed(
@@ -1334,11 +1798,11 @@ class VIPUpgrade(commands.Cog):
                     color=discord.Color.red()
                 )
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
             logger.error(f"❌ Error adding staff invite: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="manually_record_join", description="[ADMIN] Manually record a user join via staff invite")
     @app_commands.describe(
@@ -1350,12 +1814,13 @@ class VIPUpgrade(commands.Cog):
                                  user: discord.Member, invite_code: str, staff_member: discord.Member):
         """Manually record a user join for invite tracking"""
         if not (isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator):
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
         
         try:
             # Record the join in the invite tracking table
-            success = self.bot.db.record_user_join_manual(
+            success = await asyncio.to_thread(
+                self.bot.db.record_user_join_manual,
                 user_id=user.id,
                 username=user.name,
                 invite_code=invite_code,
@@ -1367,11 +1832,12 @@ class VIPUpgrade(commands.Cog):
             if success:
                 # Check if user already has VIP role and create VIP request entry
                 vip_status = "❌ No VIP role"
-                if self.VIP_ROLE_ID and self.VIP_ROLE_ID != '0':
-                    vip_role = interaction.guild.get_role(int(self.VIP_ROLE_ID))
-                    if vip_role and vip_role in user.roles:
+                vip_role = self._get_vip_role(interaction.guild)
+                if vip_role:
+                    if user.get_role(vip_role.id):
                         # User already has VIP - create a completed VIP request
-                        request_id = self.bot.db.create_vip_request(
+                        request_id = await asyncio.to_thread(
+                            self.bot.db.create_vip_request,
                             user_id=user.id,
                             username=user.name,
                             request_type="manual_record",
@@ -1381,7 +1847,7 @@ class VIPUpgrade(commands.Cog):
                         
                         if request_id > 0:
                             # Mark as completed immediately
-                            update_success = self.bot.db.update_vip_request_status(request_id, 'completed')
+                            update_success = await asyncio.to_thread(self.bot.db.update_vip_request_status, request_id, 'completed')
                             if update_success:
                                 vip_status = "✅ VIP role detected - request auto-created as completed"
                             else:
@@ -1389,6 +1855,8 @@ class VIPUpgrade(commands.Cog):
                         else:
                             vip_status = "⚠️ VIP role detected but failed to create request"
                 
+                self._requests_cache.clear()
+                
                 # Immediately backup to cloud API for persistence
                 await self.bot.db.backup_to_cloud()
                 
@@ -1411,51 +1879,52 @@ class VIPUpgrade(commands.Cog):
                     color=discord.Color.red()
                 )
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
-            await interaction.response.send_message(f"❌ Error recording user join: {str(e)}", ephemeral=True)
+            await interaction.response.send_message(f"❌ Error recording user join: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="sync_existing_vip_members", description="[ADMIN] Sync existing VIP role holders with invite statistics")
     async def sync_existing_vip_members(self, interaction: discord.Interaction):
         """Find existing VIP members and create completed VIP requests if missing"""
         if not (isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator):
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
         
         try:
-            if not self.VIP_ROLE_ID or self.VIP_ROLE_ID == '0':
-                await interaction.response.send_message("❌ VIP role ID not configured.", ephemeral=True)
+            if not self.cfg.vip_role_id:
+                await interaction.response.send_message("❌ VIP role ID not configured.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
-            vip_role = interaction.guild.get_role(int(self.VIP_ROLE_ID))
+            vip_role = self._get_vip_role(interaction.guild)
             if not vip_role:
-                await interaction.response.send_message("❌ VIP role not found.", ephemeral=True)
+                await interaction.response.send_message("❌ VIP role not found.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             # Get all members with VIP role
-            vip_members = [member for member in interaction.guild.members if vip_role in member.roles]
+            vip_members = [member for member in interaction.guild.members if member.get_role(vip_role.id)]
             
             synced_count = 0
             skipped_count = 0
             
             for member in vip_members:
                 # Check if they already have a VIP request
-                existing_requests = self.bot.db.get_user_vip_requests(member.id)
+                existing_requests = await asyncio.to_thread(self.bot.db.get_user_vip_requests, member.id)
                 has_completed_request = any(req.get('status') == 'completed' for req in existing_requests)
                 
                 if not has_completed_request:
                     # Check if they have invite tracking (to find referring staff)
-                    invite_info = self.bot.db.get_user_invite_info(member.id)
+                    invite_info = await asyncio.to_thread(self.bot.db.get_user_invite_info, member.id)
                     
                     if invite_info:
                         # Find staff member
-                        staff_config = self.bot.db.get_staff_config_by_invite(invite_info['invite_code'])
+                        staff_config = await asyncio.to_thread(self.bot.db.get_staff_config_by_invite, invite_info['invite_code'])
                         if staff_config:
                             staff_id = staff_config.get('discord_id') or staff_config.get('staff_id') or staff_config.get('staff_user_id', 0)
                             
                             # Create completed VIP request
-                            request_id = self.bot.db.create_vip_request(
+                            request_id = await asyncio.to_thread(
+                                self.bot.db.create_vip_request,
                                 user_id=member.id,
                                 username=member.name,
                                 request_type="sync_existing",
@@ -1464,13 +1933,14 @@ class VIPUpgrade(commands.Cog):
                             )
                             
                             if request_id > 0:
-                                self.bot.db.update_vip_request_status(request_id, 'completed')
+                                await asyncio.to_thread(self.bot.db.update_vip_request_status, request_id, 'completed')
                                 synced_count += 1
                             else:
                                 skipped_count += 1
                         else:
                             # No staff found - create with unknown staff
-                            request_id = self.bot.db.create_vip_request(
+                            request_id = await asyncio.to_thread(
+                                self.bot.db.create_vip_request,
                                 user_id=member.id,
                                 username=member.name,
                                 request_type="sync_existing_unknown_staff",
@@ -1479,13 +1949,14 @@ class VIPUpgrade(commands.Cog):
                             )
                             
                             if request_id > 0:
-                                self.bot.db.update_vip_request_status(request_id, 'completed')
+                                await asyncio.to_thread(self.bot.db.update_vip_request_status, request_id, 'completed')
                                 synced_count += 1
                             else:
                                 skipped_count += 1
                     else:
                         # No invite info - create with unknown staff
-                        request_id = self.bot.db.create_vip_request(
+                        request_id = await asyncio.to_thread(
+                            self.bot.db.create_vip_request,
                             user_id=member.id,
                             username=member.name,
                             request_type="sync_existing_no_invite",
@@ -1494,13 +1965,15 @@ class VIPUpgrade(commands.Cog):
                         )
                         
                         if request_id > 0:
-                            self.bot.db.update_vip_request_status(request_id, 'completed')
+                            await asyncio.to_thread(self.bot.db.update_vip_request_status, request_id, 'completed')
                             synced_count += 1
                         else:
                             skipped_count += 1
                 else:
                     skipped_count += 1
             
+            self._requests_cache.clear()
+            
             # Backup to cloud
             await self.bot.db.backup_to_cloud()
             
@@ -1514,24 +1987,24 @@ class VIPUpgrade(commands.Cog):
             embed.add_field(name="⏭️ Skipped", value=str(skipped_count), inline=True)
             embed.add_field(name="📝 Note", value="Skipped members already had completed VIP requests", inline=False)
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
-            await interaction.response.send_message(f"❌ Error syncing VIP members: {str(e)}", ephemeral=True)
+            await interaction.response.send_message(f"❌ Error syncing VIP members: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="debug_staff_database", description="[ADMIN] Debug staff invites database with usernames")
     async def debug_staff_database(self, interaction: discord.Interaction):
         """Debug staff invites database with proper usernames"""
         if not (isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator):
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
         
         try:
             # Get all staff configurations instead of using the basic debug method
-            staff_configs = self.bot.db.get_all_staff_configs()
+            staff_configs = await asyncio.to_thread(self.bot.db.get_all_staff_configs)
             
             if not staff_configs:
-                await interaction.response.send_message("❌ No staff configurations found in database.", ephemeral=True)
+                await interaction.response.send_message("❌ No staff configurations found in database.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             debug_lines = []
@@ -1598,17 +2071,17 @@ class VIPUpgrade(commands.Cog):
             
             embed.set_footer(text="This debug info includes resolved Discord usernames")
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
-            await interaction.response.send_message(f"❌ Debug failed: {str(e)}", ephemeral=True)
+            await interaction.response.send_message(f"❌ Debug failed: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="debug_user_invite", description="[ADMIN] Debug invite tracking for a specific user")
     @app_commands.describe(user="The user to debug invite tracking for")
     async def debug_user_invite(self, interaction: discord.Interaction, user: discord.Member):
         """Debug invite tracking for a specific user"""
         if not (isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator):
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
         
         try:
@@ -1622,7 +2095,7 @@ class VIPUpgrade(commands.Cog):
             # 1. Check database for user invite info
             debug_lines.append("💾 **DATABASE LOOKUP:**")
             try:
-                invite_info = self.bot.db.get_user_invite_info(user.id)
+                invite_info = await asyncio.to_thread(self.bot.db.get_user_invite_info, user.id)
                 if invite_info:
                     debug_lines.append(f"✅ Found invite info: {invite_info}")
                     invite_code = invite_info.get('invite_code', 'Unknown')
@@ -1630,7 +2103,7 @@ class VIPUpgrade(commands.Cog):
                     # 2. Check staff config for this invite
                     debug_lines.append(f"\n👥 **STAFF LOOKUP FOR INVITE {invite_code}:**")
                     try:
-                        staff_config = self.bot.db.get_staff_config_by_invite(invite_code)
+                        staff_config = await asyncio.to_thread(self.bot.db.get_staff_config_by_invite, invite_code)
                         if staff_config:
                             debug_lines.append(f"✅ Found staff config: {staff_config}")
                         else:
@@ -1647,7 +2120,7 @@ class VIPUpgrade(commands.Cog):
             # 3. Check all staff configs to see what invites exist
             debug_lines.append(f"\n📋 **ALL STAFF INVITES:**")
             try:
-                all_staff = self.bot.db.get_all_staff_configs()
+                all_staff = await asyncio.to_thread(self.bot.db.get_all_staff_configs)
                 for staff in all_staff:
                     staff_id = staff.get('staff_id', 'Unknown')
                     invite_code = staff.get('invite_code', 'None')
@@ -1694,16 +2167,16 @@ class VIPUpgrade(commands.Cog):
                 color=discord.Color.orange()
             )
             
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
-            await interaction.response.send_message(f"❌ User debug failed: {str(e)}", ephemeral=True)
+            await interaction.response.send_message(f"❌ User debug failed: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="diagnose_invites", description="[ADMIN] Comprehensive invite system diagnosis")
     async def diagnose_invites(self, interaction: discord.Interaction):
         """Comprehensive invite system diagnosis"""
         if not (isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator):
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
         
         await interaction.response.defer(ephemeral=True)
@@ -1715,17 +2188,13 @@ class VIPUpgrade(commands.Cog):
             diagnosis.append("🔍 **DATABASE ANALYSIS**")
             try:
                 # Get staff configs which contain invite codes
-                staff_configs = self.bot.db.get_all_staff_configs()
-                db_invites = [(config['staff_id'], config.get('invite_code')) for config in staff_configs if config.get('invite_code')]
-                diagnosis.append(f"Total staff in database: {len(db_invites)}")
+                staff_configs = await asyncio.to_thread(self.bot.db.get_all_staff_configs)
+                db_codes = {config['staff_id']: config.get('invite_code') for config in staff_configs if config.get('invite_code')}
+                usernames = self._staff_usernames(staff_configs)
+                diagnosis.append(f"Total staff in database: {len(db_codes)}")
                 
-                for staff_id, invite_code in db_invites:
-                    try:
-                        user = self.bot.get_user(staff_id)
-                        username = user.display_name if user else f"User {staff_id}"
-                        diagnosis.append(f"• {username}: `{invite_code}`")
-                    except:
-                        diagnosis.append(f"• User {staff_id}: `{invite_code}`")
+                for staff_id, invite_code in db_codes.items():
+                    diagnosis.append(f"• {usernames[staff_id]}: `{invite_code}`")
                         
             except Exception as e:
                 diagnosis.append(f"❌ Database error: {str(e)}")
@@ -1734,47 +2203,39 @@ class VIPUpgrade(commands.Cog):
             diagnosis.append("\n🌐 **DISCORD INVITES ANALYSIS**")
             try:
                 if interaction.guild:
-                    guild_invites = await interaction.guild.invites()
+                    guild_invites = await self._get_guild_invites(interaction.guild)
                     diagnosis.append(f"Total guild invites: {len(guild_invites)}")
                     
-                    active_codes = {}
+                    # Only the inviter name is needed past this loop {code: inviter_name}
+                    inviter_names = {}
                     for invite in guild_invites:
                         inviter_name = invite.inviter.display_name if invite.inviter else "Unknown"
-                        active_codes[invite.code] = {
-                            'inviter': invite.inviter.id if invite.inviter else None,
-                            'inviter_name': inviter_name,
-                            'uses': invite.uses or 0,
-                            'max_uses': invite.max_uses or 0,
-                            'max_age': invite.max_age or 0,
-                            'temporary': invite.temporary
-                        }
+                        inviter_names[invite.code] = inviter_name
                         
-                        status = "🟢 Active"
                         max_age = invite.max_age or 0
-                        if max_age > 0:
-                            status += f" (expires in {max_age}s)"
-                        if invite.temporary:
-                            status += " (temporary)"
-                            
-                        diagnosis.append(f"• `{invite.code}` by {inviter_name}: {invite.uses or 0} uses - {status}")
+                        expiry = f" (expires in {max_age}s)" if max_age > 0 else ""
+                        temporary = " (temporary)" if invite.temporary else ""
+                        diagnosis.append(
+                            f"• `{invite.code}` by {inviter_name}: {invite.uses or 0} uses - 🟢 Active{expiry}{temporary}"
+                        )
                 else:
                     diagnosis.append("❌ Guild not found")
-                    active_codes = {}
+                    inviter_names = {}
                     
             except Exception as e:
                 diagnosis.append(f"❌ Discord API error: {str(e)}")
-                active_codes = {}
+                inviter_names = {}
             
             # 3. Compare database vs Discord
             diagnosis.append("\n🔄 **SYNCHRONIZATION CHECK**")
             try:
-                db_codes = set(code for _, code in db_invites)
-                discord_codes = set(active_codes.keys())
+                db_code_set = set(db_codes.values())
+                discord_codes = set(inviter_names)
                 
                 # Find mismatches
-                db_only = db_codes - discord_codes
-                discord_only = discord_codes - db_codes
-                matching = db_codes & discord_codes
+                db_only = db_code_set - discord_codes
+                discord_only = discord_codes - db_code_set
+                matching = db_code_set & discord_codes
                 
                 diagnosis.append(f"Codes in both DB and Discord: {len(matching)}")
                 diagnosis.append(f"Codes only in database (expired): {len(db_only)}")
@@ -1788,8 +2249,7 @@ class VIPUpgrade(commands.Cog):
                 if discord_only:
                     diagnosis.append("⚠️ **UNTRACKED DISCORD INVITES:**")
                     for code in discord_only:
-                        invite_info = active_codes[code]
-                        diagnosis.append(f"  • `{code}` by {invite_info['inviter_name']} - should be added to DB")
+                        diagnosis.append(f"  • `{code}` by {inviter_names[code]} - should be added to DB")
                         
             except Exception as e:
                 diagnosis.append(f"❌ Comparison error: {str(e)}")
@@ -1800,17 +2260,17 @@ class VIPUpgrade(commands.Cog):
                 # Get individual staff VIP stats
                 total_invites = 0
                 staff_with_stats = 0 
+                all_stats = await asyncio.to_thread(
+                    self.bot.db.get_staff_vip_stats_bulk, [config['staff_id'] for config in staff_configs]
+                )
                 
                 for config in staff_configs:
                     try:
-                        stats = self.bot.db.get_staff_vip_stats(config['staff_id'])
+                        stats = all_stats.get(config['staff_id'])
                         if stats and stats.get('total_invites', 0) > 0:
                             staff_with_stats += 1
                             total_invites += stats['total_invites']
-                            
-                            user = self.bot.get_user(config['discord_id'])
-                            username = user.display_name if user else config.get('name', f"User {config['discord_id']}")
-                            diagnosis.append(f"• {username}: {stats['total_invites']} invites")
+                            diagnosis.append(f"• {usernames[config['staff_id']]}: {stats['total_invites']} invites")
                     except Exception as e:
                         pass  # Skip errors for individual staff
                         
@@ -1836,61 +2296,18 @@ class VIPUpgrade(commands.Cog):
             except:
                 diagnosis.append("Error generating recommendations")
             
-            # Create and send embed
-            diagnosis_text = "\n".join(diagnosis)
-            
-            # Split into multiple embeds if too long
-            if len(diagnosis_text) > 4000:
-                chunks = []
-                current_chunk = []
-                current_length = 0
-                
-                for line in diagnosis:
-                    if current_length + len(line) > 3900:
-                        chunks.append("\n".join(current_chunk))
-                        current_chunk = [line]
-                        current_length = len(line)
-                    else:
-                        current_chunk.append(line)
-                        current_length += len(line) + 1
-                
-                if current_chunk:
-                    chunks.append("\n".join(current_chunk))
-                
-                # Send first chunk as response
-                embed = discord.Embed(
-                    title="🏥 Invite System Diagnosis (1/1)" if len(chunks) == 1 else f"🏥 Invite System Diagnosis (1/{len(chunks)})",
-                    description=chunks[0],
-                    color=discord.Color.orange()
-                )
-                
-                await interaction.followup.send(embed=embed, ephemeral=True)
-                
-                # Send additional chunks
-                for i, chunk in enumerate(chunks[1:], 2):
-                    embed = discord.Embed(
-                        title=f"🏥 Invite System Diagnosis ({i}/{len(chunks)})",
-                        description=chunk,
-                        color=discord.Color.orange()
-                    )
-                    await interaction.followup.send(embed=embed, ephemeral=True)
-            else:
-                embed = discord.Embed(
-                    title="🏥 Invite System Diagnosis",
-                    description=diagnosis_text,
-                    color=discord.Color.orange()
-                )
-                
-                await interaction.followup.send(embed=embed, ephemeral=True)
+            # Send results, split across several embeds if too long
+            await _send_chunked_embeds(interaction, "🏥 Invite System Diagnosis", diagnosis, discord.Color.orange())
                 
         except Exception as e:
-            await interaction.followup.send(f"❌ Diagnosis failed: {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ Diagnosis failed: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="fix_invite_tracking", description="[ADMIN] Fix invite tracking synchronization issues")
+    @_bulk_invite_cooldown()
     async def fix_invite_tracking(self, interaction: discord.Interaction):
         """Fix invite tracking synchronization issues"""
         if not (isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator):
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
         
         await interaction.response.defer(ephemeral=True)
@@ -1900,11 +2317,14 @@ class VIPUpgrade(commands.Cog):
             
             # 1. Get database and Discord invite codes
             try:
-                db_invites = self.bot.db.get_all_staff_configs()
+                db_invites = await asyncio.to_thread(self.bot.db.get_all_staff_configs)
                 db_codes = {config['staff_id']: config.get('invite_code') for config in db_invites if config.get('invite_code')}
+                usernames = self._staff_usernames(db_invites)
                 
-                guild_invites = await interaction.guild.invites()
+                # Rewrites the database from this list, so never trust a cached copy
+                guild_invites = await self._get_guild_invites(interaction.guild, force_refresh=True)
                 discord_codes = {}
+                code_by_inviter = {}  # First Discord invite per inviter {inviter_id: code}
                 for invite in guild_invites:
                     if invite.inviter:
                         discord_codes[invite.code] = {
@@ -1912,8 +2332,9 @@ class VIPUpgrade(commands.Cog):
                             'inviter_name': invite.inviter.display_name,
                             'uses': invite.uses or 0
                         }
+                        code_by_inviter.setdefault(invite.inviter.id, invite.code)
             except Exception as e:
-                await interaction.followup.send(f"❌ Failed to fetch invite data: {str(e)}", ephemeral=True)
+                await interaction.followup.send(f"❌ Failed to fetch invite data: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             # 2. Find expired codes in database
@@ -1922,20 +2343,21 @@ class VIPUpgrade(commands.Cog):
             expired_codes = db_code_set - discord_code_set
             untracked_codes = discord_code_set - db_code_set
             
+            # Staff whose database code is expired, found in one pass for the removal and mismatch steps
+            expired_by_staff = {staff_id: code for staff_id, code in db_codes.items() if code in expired_codes}
+            
             # 3. Remove expired codes from database
             if expired_codes:
                 fixes_applied.append(f"🗑️ **REMOVED EXPIRED CODES ({len(expired_codes)}):**")
-                for staff_id, code in db_codes.items():
-                    if code in expired_codes:
-                        try:
-                            user = self.bot.get_user(staff_id)
-                            username = user.display_name if user else f"User {staff_id}"
-                            
-                            # Clear the expired invite code
-                            self.bot.db.update_staff_invite_code(staff_id, None)
-                            fixes_applied.append(f"  • Removed expired code `{code}` from {username}")
-                        except Exception as e:
-                            fixes_applied.append(f"  • Failed to remove code `{code}`: {str(e)}")
+                for staff_id, code in expired_by_staff.items():
+                    try:
+                        username = usernames[staff_id]
+                        
+                        # Clear the expired invite code
+                        await asyncio.to_thread(self.bot.db.update_staff_invite_code, staff_id, None)
+                        fixes_applied.append(f"  • Removed expired code `{code}` from {username}")
+                    except Exception as e:
+                        fixes_applied.append(f"  • Failed to remove code `{code}`: {str(e)}")
             
             # 4. Add untracked Discord invites to database
             if untracked_codes:
@@ -1947,10 +2369,10 @@ class VIPUpgrade(commands.Cog):
                         inviter_name = invite_info['inviter_name']
                         
                         # Check if this user needs a code assigned
-                        staff_config = self.bot.db.get_staff_by_discord_id(inviter_id)
+                        staff_config = await asyncio.to_thread(self.bot.db.get_staff_by_discord_id, inviter_id)
                         if staff_config and not staff_config.get('invite_code'):
                             # Assign this code to the staff member
-                            self.bot.db.update_staff_invite_code(inviter_id, code)
+                            await asyncio.to_thread(self.bot.db.update_staff_invite_code, inviter_id, code)
                             fixes_applied.append(f"  • Assigned code `{code}` to {inviter_name}")
                         else:
                             # Just record the invite exists
@@ -1962,26 +2384,20 @@ class VIPUpgrade(commands.Cog):
             fixes_applied.append(f"\n🔄 **UPDATED MISMATCHED CODES:**")
             mismatched_found = False
             
-            for staff_id, db_code in db_codes.items():
-                if db_code and db_code in expired_codes:
-                    # Look for a similar code in Discord
-                    user = self.bot.get_user(staff_id)
-                    username = user.display_name if user else f"User {staff_id}"
-                    
-                    # Find if there's a Discord invite by the same user
-                    matching_discord_code = None
-                    for discord_code, info in discord_codes.items():
-                        if info['inviter_id'] == staff_id:
-                            matching_discord_code = discord_code
-                            break
-                    
-                    if matching_discord_code:
-                        try:
-                            self.bot.db.update_staff_invite_code(staff_id, matching_discord_code)
-                            fixes_applied.append(f"  • Updated {username}: `{db_code}` → `{matching_discord_code}`")
-                            mismatched_found = True
-                        except Exception as e:
-                            fixes_applied.append(f"  • Failed to update {username}: {str(e)}")
+            for staff_id, db_code in expired_by_staff.items():
+                # Look for a similar code in Discord
+                username = usernames[staff_id]
+                
+                # Find if there's a Discord invite by the same user
+                matching_discord_code = code_by_inviter.get(staff_id)
+                
+                if matching_discord_code:
+                    try:
+                        await asyncio.to_thread(self.bot.db.update_staff_invite_code, staff_id, matching_discord_code)
+                        fixes_applied.append(f"  • Updated {username}: `{db_code}` → `{matching_discord_code}`")
+                        mismatched_found = True
+                    except Exception as e:
+                        fixes_applied.append(f"  • Failed to update {username}: {str(e)}")
             
             if not mismatched_found:
                 fixes_applied.append("  • No mismatched codes found")
@@ -1990,13 +2406,16 @@ class VIPUpgrade(commands.Cog):
             fixes_applied.append(f"\n📊 **INVITE STATISTICS VERIFICATION:**")
             try:
                 # Check if we have any recorded invite statistics
-                all_configs = self.bot.db.get_all_staff_configs()
+                all_configs = await asyncio.to_thread(self.bot.db.get_all_staff_configs)
                 staff_with_stats = 0
                 total_recorded_invites = 0
+                all_stats = await asyncio.to_thread(
+                    self.bot.db.get_staff_vip_stats_bulk, [config['staff_id'] for config in all_configs]
+                )
                 
                 for config in all_configs:
                     try:
-                        stats = self.bot.db.get_staff_vip_stats(config['staff_id'])
+                        stats = all_stats.get(config['staff_id'])
                         if stats and stats.get('total_invites', 0) > 0:
                             staff_with_stats += 1
                             total_recorded_invites += stats['total_invites']
@@ -2019,52 +2438,8 @@ class VIPUpgrade(commands.Cog):
             fixes_applied.append(f"  • Updated database synchronization")
             fixes_applied.append(f"  • Verified invite tracking system")
             
-            # Send results
-            fixes_text = "\n".join(fixes_applied)
-            
-            # Split into multiple embeds if too long
-            if len(fixes_text) > 4000:
-                chunks = []
-                current_chunk = []
-                current_length = 0
-                
-                for line in fixes_applied:
-                    if current_length + len(line) > 3900:
-                        chunks.append("\n".join(current_chunk))
-                        current_chunk = [line]
-                        current_length = len(line)
-                    else:
-                        current_chunk.append(line)
-                        current_length += len(line) + 1
-                
-                if current_chunk:
-                    chunks.append("\n".join(current_chunk))
-                
-                # Send first chunk as response
-                embed = discord.Embed(
-                    title="🔧 Invite Tracking Fix Results (1/1)" if len(chunks) == 1 else f"🔧 Invite Tracking Fix Results (1/{len(chunks)})",
-                    description=chunks[0],
-                    color=discord.Color.green()
-                )
-                
-                await interaction.followup.send(embed=embed, ephemeral=True)
-                
-                # Send additional chunks
-                for i, chunk in enumerate(chunks[1:], 2):
-                    embed = discord.Embed(
-                        title=f"🔧 Invite Tracking Fix Results ({i}/{len(chunks)})",
-                        description=chunk,
-                        color=discord.Color.green()
-                    )
-                    await interaction.followup.send(embed=embed, ephemeral=True)
-            else:
-                embed = discord.Embed(
-                    title="🔧 Invite Tracking Fix Results",
-                    description=fixes_text,
-                    color=discord.Color.green()
-                )
-                
-                await interaction.followup.send(embed=embed, ephemeral=True)
+            # Send results, split across several embeds if too long
+            await _send_chunked_embeds(interaction, "🔧 Invite Tracking Fix Results", fixes_applied, discord.Color.green())
             
             # Suggest running diagnosis again
             embed = discord.Embed(
@@ -2073,50 +2448,58 @@ class VIPUpgrade(commands.Cog):
                 color=discord.Color.blue()
             )
             
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 
         except Exception as e:
-            await interaction.followup.send(f"❌ Fix failed: {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ Fix failed: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="regenerate_all_invites", description="[ADMIN] Generate fresh invite codes for all staff members")
+    @_bulk_invite_cooldown()
     async def regenerate_all_invites(self, interaction: discord.Interaction):
         """Generate fresh invite codes for all staff members"""
         if not (isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator):
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
         
         await interaction.response.defer(ephemeral=True)
         
         try:
             results = []
-            staff_configs = self.bot.db.get_all_staff_configs()
+            staff_configs = await asyncio.to_thread(self.bot.db.get_all_staff_configs)
             
             if not staff_configs:
-                await interaction.followup.send("❌ No staff configurations found in database.", ephemeral=True)
+                await interaction.followup.send("❌ No staff configurations found in database.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             results.append(f"🔄 **REGENERATING INVITES FOR {len(staff_configs)} STAFF MEMBERS**\n")
             
+            # Every phase below overlaps its REST round-trips, bounded so the invite routes don't get one burst per invite
+            semaphore = asyncio.Semaphore(INVITE_CREATE_CONCURRENCY)
+            
+            async def delete_old_invite(invite):
+                async with semaphore:
+                    try:
+                        await invite.delete(reason="Regenerating fresh staff invites")
+                        self._forget_invite(interaction.guild, invite.code)
+                        return f"  • Deleted old invite: `{invite.code}`"
+                    except discord.NotFound:
+                        return f"  • Invite `{invite.code}` already deleted"
+                    except Exception as e:
+                        return f"  • Failed to delete `{invite.code}`: {str(e)}"
+            
             # First, delete all existing invites created by the bot
             try:
                 if interaction.guild:
-                    guild_invites = await interaction.guild.invites()
+                    guild_invites = await self._get_guild_invites(interaction.guild, force_refresh=True)
                     bot_invites = [invite for invite in guild_invites if invite.inviter and invite.inviter.id == self.bot.user.id]
                 else:
                     results.append("❌ Guild not found\n")
-                    await interaction.followup.send("❌ Guild not found", ephemeral=True)
+                    await interaction.followup.send("❌ Guild not found", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                     return
                 
                 if bot_invites:
                     results.append(f"🗑️ **CLEANING UP OLD INVITES ({len(bot_invites)}):**")
-                    for invite in bot_invites:
-                        try:
-                            await invite.delete(reason="Regenerating fresh staff invites")
-                            results.append(f"  • Deleted old invite: `{invite.code}`")
-                        except discord.NotFound:
-                            results.append(f"  • Invite `{invite.code}` already deleted")
-                        except Exception as e:
-                            results.append(f"  • Failed to delete `{invite.code}`: {str(e)}")
+                    results.extend(await asyncio.gather(*map(delete_old_invite, bot_invites)))
                     results.append("")
                 
             except Exception as e:
@@ -2127,27 +2510,19 @@ class VIPUpgrade(commands.Cog):
             successful_invites = []
             failed_invites = []
             
-            for config in staff_configs:
-                staff_id = config['staff_id']
-                try:
-                    user = self.bot.get_user(staff_id)
-                    username = user.display_name if user else f"User {staff_id}"
-                    
-                    # Create a fresh permanent invite (using same logic as create_staff_invite)
-                    if not interaction.guild:
-                        raise Exception("Guild not available")
-                        
-                    invite_channel = None
-                    
-                    # Find a suitable channel for creating the invite
-                    for channel in interaction.guild.text_channels:
-                        if channel.permissions_for(interaction.guild.me).create_instant_invite:
-                            invite_channel = channel
-                            break
-                    
+            # Find a suitable channel for creating the invites (the same one serves every staff member)
+            invite_channel = None
+            for channel in interaction.guild.text_channels:
+                if channel.permissions_for(interaction.guild.me).create_instant_invite:
+                    invite_channel = channel
+                    break
+            
+            async def create_fresh_invite(staff_id, username):
+                async with semaphore:
                     if not invite_channel:
                         raise Exception("No suitable channel found for invite creation")
                     
+                    # Create a fresh permanent invite (using same logic as create_staff_invite)
                     invite = await invite_channel.create_invite(
                         max_age=0,        # Never expires
                         max_uses=0,       # Unlimited uses
@@ -2155,25 +2530,40 @@ class VIPUpgrade(commands.Cog):
                         unique=True,      # Force create new unique invite
                         reason=f"Fresh staff invite for {username}"
                     )
-                    
-                    # Update database with new invite code
-                    success = self.bot.db.update_staff_invite_code(staff_id, invite.code)
-                    
-                    if success:
-                        successful_invites.append({
-                            'username': username,
-                            'staff_id': staff_id,
-                            'invite_code': invite.code,
-                            'invite_url': f"https://discord.gg/{invite.code}"
-                        })
-                        results.append(f"  ✅ {username}: `{invite.code}` → https://discord.gg/{invite.code}")
-                    else:
-                        failed_invites.append(username)
-                        results.append(f"  ❌ {username}: Created invite but failed to save to database")
-                        
-                except Exception as e:
+                    self._remember_invite(interaction.guild, invite)
+                    return invite
+            
+            staff_members = list(self._staff_usernames(staff_configs).items())
+            
+            outcomes = await asyncio.gather(
+                *(create_fresh_invite(staff_id, username) for staff_id, username in staff_members),
+                return_exceptions=True
+            )
+            
+            # Update database with every new invite code in one transaction
+            saved = await asyncio.to_thread(
+                self.bot.db.update_staff_invite_codes_bulk,
+                [(staff_id, invite.code) for (staff_id, _), invite in zip(staff_members, outcomes)
+                 if not isinstance(invite, BaseException)]
+            )
+            
+            for (staff_id, username), invite in zip(staff_members, outcomes):
+                if isinstance(invite, BaseException):
                     failed_invites.append(username)
-                    results.append(f"  ❌ {username}: {str(e)}")
+                    results.append(f"  ❌ {username}: {str(invite)}")
+                    continue
+                
+                if saved.get(staff_id):
+                    successful_invites.append({
+                        'username': username,
+                        'staff_id': staff_id,
+                        'invite_code': invite.code,
+                        'invite_url': f"https://discord.gg/{invite.code}"
+                    })
+                    results.append(f"  ✅ {username}: `{invite.code}` → https://discord.gg/{invite.code}")
+                else:
+                    failed_invites.append(username)
+                    results.append(f"  ❌ {username}: Created invite but failed to save to database")
             
             # Summary
             results.append(f"\n📊 **GENERATION SUMMARY:**")
@@ -2182,16 +2572,19 @@ class VIPUpgrade(commands.Cog):
             
             if successful_invites:
                 results.append(f"\n🔗 **TESTING INVITE LINKS:**")
-                # Test each invite link
-                for invite_data in successful_invites:
-                    try:
-                        # Fetch the invite to verify it exists and get current stats
-                        fetched_invite = await self.bot.fetch_invite(invite_data['invite_code'])
-                        results.append(f"  ✅ {invite_data['username']}: Link works, {fetched_invite.uses or 0} uses")
-                    except discord.NotFound:
-                        results.append(f"  ❌ {invite_data['username']}: Link not found!")
-                    except Exception as e:
-                        results.append(f"  ⚠️ {invite_data['username']}: Test failed: {str(e)}")
+                # Test each invite link, sharing the same concurrency bound
+                async def test_invite_link(invite_data):
+                    async with semaphore:
+                        try:
+                            # Fetch the invite to verify it exists and get current stats
+                            fetched_invite = await self.bot.fetch_invite(invite_data['invite_code'])
+                            return f"  ✅ {invite_data['username']}: Link works, {fetched_invite.uses or 0} uses"
+                        except discord.NotFound:
+                            return f"  ❌ {invite_data['username']}: Link not found!"
+                        except Exception as e:
+                            return f"  ⚠️ {invite_data['username']}: Test failed: {str(e)}"
+                
+                results.extend(await asyncio.gather(*map(test_invite_link, successful_invites)))
             
             # Recommendations
             results.append(f"\n💡 **NEXT STEPS:**")
@@ -2200,52 +2593,8 @@ class VIPUpgrade(commands.Cog):
             results.append("3. Test VIP upgrade flow to ensure invite tracking works")
             results.append("4. Run `/diagnose_invites` to verify synchronization")
             
-            # Send results
-            results_text = "\n".join(results)
-            
-            # Split into multiple embeds if too long
-            if len(results_text) > 4000:
-                chunks = []
-                current_chunk = []
-                current_length = 0
-                
-                for line in results:
-                    if current_length + len(line) > 3900:
-                        chunks.append("\n".join(current_chunk))
-                        current_chunk = [line]
-                        current_length = len(line)
-                    else:
-                        current_chunk.append(line)
-                        current_length += len(line) + 1
-                
-                if current_chunk:
-                    chunks.append("\n".join(current_chunk))
-                
-                # Send first chunk as response
-                embed = discord.Embed(
-                    title="🔄 Fresh Invite Generation Results (1/1)" if len(chunks) == 1 else f"🔄 Fresh Invite Generation Results (1/{len(chunks)})",
-                    description=chunks[0],
-                    color=discord.Color.gold()
-                )
-                
-                await interaction.followup.send(embed=embed, ephemeral=True)
-                
-                # Send additional chunks
-                for i, chunk in enumerate(chunks[1:], 2):
-                    embed = discord.Embed(
-                        title=f"🔄 Fresh Invite Generation Results ({i}/{len(chunks)})",
-                        description=chunk,
-                        color=discord.Color.gold()
-                    )
-                    await interaction.followup.send(embed=embed, ephemeral=True)
-            else:
-                embed = discord.Embed(
-                    title="🔄 Fresh Invite Generation Results",
-                    description=results_text,
-                    color=discord.Color.gold()
-                )
-                
-                await interaction.followup.send(embed=embed, ephemeral=True)
+            # Send results, split across several embeds if too long
+            await _send_chunked_embeds(interaction, "🔄 Fresh Invite Generation Results", results, discord.Color.gold())
             
             # Send a summary card with working links for easy testing
             if successful_invites:
@@ -2269,65 +2618,77 @@ class VIPUpgrade(commands.Cog):
                         inline=True
                     )
                 
-                await interaction.followup.send(embed=test_embed, ephemeral=True)
+                await interaction.followup.send(embed=test_embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 
         except Exception as e:
-            await interaction.followup.send(f"❌ Invite regeneration failed: {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ Invite regeneration failed: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="test_invite_flow", description="[ADMIN] Test the complete VIP upgrade invite tracking flow")
     async def test_invite_flow(self, interaction: discord.Interaction):
         """Test the complete VIP upgrade invite tracking flow"""
         if not (isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator):
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
         
         await interaction.response.defer(ephemeral=True)
         
+        # Show progress straight away; the results replace it once every check has finished
+        progress = await interaction.followup.send(
+            embed=discord.Embed(title="🧪 Running VIP upgrade flow tests...", color=_PURPLE),
+            ephemeral=True,
+            allowed_mentions=_NO_MENTIONS,
+            wait=True
+        )
+        
         try:
             test_results = []
+            issues_found = []  # Recorded as each check runs, summarised at the end
             
             # 1. Check VIP upgrade channel setup
             test_results.append("🧪 **VIP UPGRADE FLOW TEST**\n")
             
-            vip_channel = self.bot.get_channel(self.VIP_UPGRADE_CHANNEL_ID)
+            vip_channel = self.bot.get_channel(self.cfg.vip_channel_id)
             if vip_channel:
                 test_results.append(f"✅ VIP Channel: {vip_channel.mention}")
             else:
-                test_results.append(f"❌ VIP Channel not found (ID: {self.VIP_UPGRADE_CHANNEL_ID})")
+                test_results.append(f"❌ VIP Channel not found (ID: {self.cfg.vip_channel_id})")
+                issues_found.append("VIP channel not found")
             
             # 2. Check staff invite codes
             test_results.append(f"\n🔗 **STAFF INVITE STATUS:**")
-            staff_configs = self.bot.db.get_all_staff_configs()
+            staff_configs = await asyncio.to_thread(self.bot.db.get_all_staff_configs)
+            usernames = self._staff_usernames(staff_configs)
             active_invites = 0
             
+            # Check every assigned code against one listing of the guild's invites
+            try:
+                guild_invites = {invite.code: invite for invite in await self._get_guild_invites(interaction.guild)}
+                invite_error = None
+            except Exception as e:
+                guild_invites = {}
+                invite_error = e
+            
             for config in staff_configs:
-                staff_id = config['staff_id']
                 invite_code = config.get('invite_code')
+                username = usernames[config['staff_id']]
+                guild_invite = guild_invites.get(invite_code)
                 
-                try:
-                    user = self.bot.get_user(staff_id)
-                    username = user.display_name if user else f"User {staff_id}"
-                    
-                    if invite_code:
-                        try:
-                            # Test if invite is valid
-                            fetched_invite = await self.bot.fetch_invite(invite_code)
-                            uses = fetched_invite.uses or 0
-                            test_results.append(f"  ✅ {username}: `{invite_code}` ({uses} uses)")
-                            active_invites += 1
-                        except discord.NotFound:
-                            test_results.append(f"  ❌ {username}: `{invite_code}` (INVALID)")
-                        except Exception as e:
-                            test_results.append(f"  ⚠️ {username}: `{invite_code}` (Error: {str(e)})")
-                    else:
-                        test_results.append(f"  ❌ {username}: No invite code assigned")
-                        
-                except Exception as e:
-                    test_results.append(f"  ❌ User {staff_id}: Error: {str(e)}")
+                if not invite_code:
+                    test_results.append(f"  ❌ {username}: No invite code assigned")
+                elif invite_error:
+                    test_results.append(f"  ⚠️ {username}: `{invite_code}` (Error: {str(invite_error)})")
+                elif not guild_invite:
+                    test_results.append(f"  ❌ {username}: `{invite_code}` (INVALID)")
+                else:
+                    uses = guild_invite.uses or 0
+                    test_results.append(f"  ✅ {username}: `{invite_code}` ({uses} uses)")
+                    active_invites += 1
             
             # 3. Test invite tracking system
             test_results.append(f"\n📊 **INVITE TRACKING SYSTEM:**")
             test_results.append(f"  • Active staff invites: {active_invites}/{len(staff_configs)}")
+            if active_invites < len(staff_configs):
+                issues_found.append(f"Only {active_invites}/{len(staff_configs)} staff have working invites")
             
             # Check if invite tracker cog is loaded
             invite_tracker = self.bot.get_cog('InviteTracker')
@@ -2335,28 +2696,33 @@ class VIPUpgrade(commands.Cog):
                 test_results.append(f"  ✅ Invite Tracker cog loaded")
             else:
                 test_results.append(f"  ❌ Invite Tracker cog not found")
+                issues_found.append("Invite tracker cog not loaded")
             
             # 4. Check VIP role configuration
             test_results.append(f"\n👑 **VIP ROLE CONFIGURATION:**")
-            if self.VIP_ROLE_ID:
-                vip_role = interaction.guild.get_role(int(self.VIP_ROLE_ID))
+            vip_role = self._get_vip_role(interaction.guild)
+            if not vip_role:
+                issues_found.append("VIP role not configured properly")
+            if self.cfg.vip_role_id:
                 if vip_role:
                     test_results.append(f"  ✅ VIP Role: {vip_role.mention} ({len(vip_role.members)} members)")
                 else:
-                    test_results.append(f"  ❌ VIP Role not found (ID: {self.VIP_ROLE_ID})")
+                    test_results.append(f"  ❌ VIP Role not found (ID: {self.cfg.vip_role_id})")
             else:
                 test_results.append(f"  ❌ VIP_ROLE_ID not configured")
             
             # 5. Test database functionality
             test_results.append(f"\n💾 **DATABASE FUNCTIONALITY:**")
             try:
-                # Test basic database operations
-                test_configs = self.bot.db.get_all_staff_configs()
-                test_results.append(f"  ✅ Database connection working ({len(test_configs)} staff configs)")
+                # Test the connection itself; the staff configs were already loaded above (and may be cached)
+                if await asyncio.to_thread(self.bot.db.ping):
+                    test_results.append(f"  ✅ Database connection working ({len(staff_configs)} staff configs)")
+                else:
+                    test_results.append(f"  ❌ Database connection failed")
                 
                 # Test invite tracking methods
                 try:
-                    staff_status = self.bot.db.get_staff_invite_status()
+                    staff_status = await asyncio.to_thread(self.bot.db.get_staff_invite_status)
                     test_results.append(f"  ✅ Invite status method working")
                 except Exception as e:
                     test_results.append(f"  ⚠️ Invite status method: {str(e)}")
@@ -2374,17 +2740,6 @@ class VIPUpgrade(commands.Cog):
             
             # 7. Summary and recommendations
             test_results.append(f"\n✅ **TEST SUMMARY:**")
-            issues_found = []
-            
-            if not vip_channel:
-                issues_found.append("VIP channel not found")
-            if active_invites < len(staff_configs):
-                issues_found.append(f"Only {active_invites}/{len(staff_configs)} staff have working invites")
-            if not invite_tracker:
-                issues_found.append("Invite tracker cog not loaded")
-            if not self.VIP_ROLE_ID or not interaction.guild.get_role(int(self.VIP_ROLE_ID)):
-                issues_found.append("VIP role not configured properly")
-            
             if issues_found:
                 test_results.append(f"  ⚠️ Issues found: {len(issues_found)}")
                 for issue in issues_found:
@@ -2394,71 +2749,30 @@ class VIPUpgrade(commands.Cog):
                 test_results.append(f"  🎉 All systems appear to be working correctly!")
                 test_results.append(f"  🧪 Ready for live testing with invite links")
             
-            # Send results
-            results_text = "\n".join(test_results)
-            
-            # Split into multiple embeds if too long
-            if len(results_text) > 4000:
-                chunks = []
-                current_chunk = []
-                current_length = 0
-                
-                for line in test_results:
-                    if current_length + len(line) > 3900:
-                        chunks.append("\n".join(current_chunk))
-                        current_chunk = [line]
-                        current_length = len(line)
-                    else:
-                        current_chunk.append(line)
-                        current_length += len(line) + 1
-                
-                if current_chunk:
-                    chunks.append("\n".join(current_chunk))
-                
-                # Send first chunk as response
-                embed = discord.Embed(
-                    title="🧪 VIP Upgrade Flow Test (1/1)" if len(chunks) == 1 else f"🧪 VIP Upgrade Flow Test (1/{len(chunks)})",
-                    description=chunks[0],
-                    color=discord.Color.purple()
-                )
-                
-                await interaction.followup.send(embed=embed, ephemeral=True)
-                
-                # Send additional chunks
-                for i, chunk in enumerate(chunks[1:], 2):
-                    embed = discord.Embed(
-                        title=f"🧪 VIP Upgrade Flow Test ({i}/{len(chunks)})",
-                        description=chunk,
-                        color=discord.Color.purple()
-                    )
-                    await interaction.followup.send(embed=embed, ephemeral=True)
-            else:
-                embed = discord.Embed(
-                    title="🧪 VIP Upgrade Flow Test Results",
-                    description=results_text,
-                    color=discord.Color.purple()
-                )
-                
-                await interaction.followup.send(embed=embed, ephemeral=True)
+            # Send results, split across several embeds if too long
+            await _send_chunked_embeds(
+                interaction, "🧪 VIP Upgrade Flow Test Results", test_results, _PURPLE, message=progress
+            )
                 
         except Exception as e:
-            await interaction.followup.send(f"❌ Test failed: {str(e)}", ephemeral=True)
+            await progress.edit(content=f"❌ Test failed: {str(e)}", embed=None, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="create_missing_invites", description="[ADMIN] Create invites for staff members who don't have them")
+    @_bulk_invite_cooldown()
     async def create_missing_invites(self, interaction: discord.Interaction):
         """Create invite codes for staff members who don't have active invites"""
         if not (isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator):
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
         
         await interaction.response.defer(ephemeral=True)
         
         try:
             results = []
-            staff_configs = self.bot.db.get_all_staff_configs()
+            staff_configs = await asyncio.to_thread(self.bot.db.get_all_staff_configs)
             
             if not staff_configs:
-                await interaction.followup.send("❌ No staff configurations found in database.", ephemeral=True)
+                await interaction.followup.send("❌ No staff configurations found in database.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             # Find staff members without invite codes
@@ -2469,15 +2783,13 @@ class VIPUpgrade(commands.Cog):
                     missing_invites.append(config)
             
             if not missing_invites:
-                await interaction.followup.send("✅ All staff members already have invite codes!", ephemeral=True)
+                await interaction.followup.send("✅ All staff members already have invite codes!", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             results.append(f"🔄 **CREATING INVITES FOR {len(missing_invites)} STAFF MEMBERS**\n")
             
             # Find the welcome channel first, then fallback to other channels
             invite_channel = None
-            WELCOME_CHANNEL_ID = 1401614581503365244
-            preferred_channels = ['welcome', 'general', 'lobby', 'main']
             
             # First priority: use the specific welcome channel ID
             if interaction.guild:
@@ -2490,7 +2802,7 @@ class VIPUpgrade(commands.Cog):
                 # Second priority: find welcome/general channel by name
                 if not invite_channel:
                     for channel in interaction.guild.text_channels:
-                        if (channel.name.lower() in preferred_channels and 
+                        if (channel.name.lower() in PREFERRED_INVITE_CHANNELS and 
                             channel.permissions_for(interaction.guild.me).create_instant_invite):
                             invite_channel = channel
                             results.append(f"🎯 Found preferred channel: {channel.name}")
@@ -2505,7 +2817,7 @@ class VIPUpgrade(commands.Cog):
                             break
             
             if not invite_channel:
-                await interaction.followup.send("❌ Cannot create invites - no suitable channel found", ephemeral=True)
+                await interaction.followup.send("❌ Cannot create invites - no suitable channel found", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             results.append(f"📍 Using channel: {invite_channel.mention}\n")
@@ -2528,9 +2840,10 @@ class VIPUpgrade(commands.Cog):
                         unique=True,  # Create unique invite
                         reason=f"Staff invite for {username}"
                     )
+                    self._remember_invite(interaction.guild, invite)
                     
                     # Update database with new invite code
-                    success = self.bot.db.update_staff_invite_code(staff_id, invite.code)
+                    success = await asyncio.to_thread(self.bot.db.update_staff_invite_code, staff_id, invite.code)
                     
                     if success:
                         successful_invites.append({
@@ -2626,7 +2939,7 @@ class VIPUpgrade(commands.Cog):
                 color=discord.Color.green()
             )
             
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
             # Send test links if successful
             if successful_invites:
@@ -2643,68 +2956,68 @@ class VIPUpgrade(commands.Cog):
                         inline=True
                     )
                 
-                await interaction.followup.send(embed=test_embed, ephemeral=True)
+                await interaction.followup.send(embed=test_embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 
         except Exception as e:
-            await interaction.followup.send(f"❌ Invite creation failed: {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ Invite creation failed: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
     
     @app_commands.command(name="cleanup_unauthorized_invites", description="[ADMIN] Remove invites not created by staff")
+    @_bulk_invite_cooldown()
     async def cleanup_unauthorized_invites(self, interaction: discord.Interaction):
         """Clean up invites that weren't created by authorized staff"""
         if not (isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator):
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
         
         try:
             guild = interaction.guild
             if not guild:
-                await interaction.response.send_message("❌ This command must be used in a server.", ephemeral=True)
+                await interaction.response.send_message("❌ This command must be used in a server.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             all_invites = await guild.invites()
             
             # Get authorized staff invite codes from database (only bot-generated staff invites)
             # Get authorized invite codes from staff configs
-            staff_configs = self.bot.db.get_all_staff_configs()
-            authorized_invite_codes = [(config['staff_id'], config.get('invite_code')) for config in staff_configs if config.get('invite_code')]
-            
-            # Find unauthorized invites (everything except bot-generated staff invites)
-            unauthorized_invites = []
-            staff_invites = []
-            
-            for invite in all_invites:
-                if invite.code in authorized_invite_codes and invite.inviter and invite.inviter.id == self.bot.user.id:
-                    # This is a bot-generated staff invite - keep it
-                    staff_invites.append(invite)
-                else:
-                    # This is unauthorized - remove it (including admin-created invites)
-                    unauthorized_invites.append(invite)
+            staff_configs = await asyncio.to_thread(self.bot.db.get_all_staff_configs)
+            authorized_invite_codes = {code for config in staff_configs if (code := config.get('invite_code'))}
+            
+            # Unauthorized invites (everything except bot-generated staff invites); the confirm button
+            # only deletes these analysed codes, so invites created after this point are never touched
+            bot_user_id = self.bot.user.id
+            unauthorized_codes = frozenset(
+                invite.code for invite in all_invites
+                if _is_unauthorized_invite(invite, authorized_invite_codes, bot_user_id)
+            )
+            unauthorized_count = len(unauthorized_codes)
+            staff_invite_count = len(all_invites) - unauthorized_count
             
             # Show confirmation embed
             embed = discord.Embed(
                 title="🧹 Invite Cleanup Analysis",
                 description="Analysis of current server invites",
-                color=discord.Color.orange()
+                color=_ORANGE
             )
             
             embed.add_field(
                 name="✅ Bot-Generated Staff Invites (Will Keep)",
-                value=f"{len(staff_invites)} official staff invites found",
+                value=f"{staff_invite_count} official staff invites found",
                 inline=True
             )
             
             embed.add_field(
                 name="❌ All Other Invites (Will Remove)",
-                value=f"{len(unauthorized_invites)} non-staff invites found\n*(Including admin-created invites)*",
+                value=f"{unauthorized_count} non-staff invites found\n*(Including admin-created invites)*",
                 inline=True
             )
             
-            if unauthorized_invites:
+            if unauthorized_count:
                 unauthorized_list = []
-                for invite in unauthorized_invites[:5]:  # Show first 5
+                preview = (invite for invite in all_invites if invite.code in unauthorized_codes)
+                for invite in itertools.islice(preview, 5):  # Show first 5
                     unauthorized_list.append(f"• `{invite.code}` by {invite.inviter.name}")
                 
-                if len(unauthorized_invites) > 5:
-                    unauthorized_list.append(f"• ...and {len(unauthorized_invites) - 5} more")
+                if unauthorized_count > 5:
+                    unauthorized_list.append(f"• ...and {unauthorized_count - 5} more")
                 
                 embed.add_field(
                     name="📋 Invites to Remove (All Non-Staff)",
@@ -2713,26 +3026,26 @@ class VIPUpgrade(commands.Cog):
                 )
                 
                 # Add confirmation buttons
-                view = InviteCleanupConfirmView(unauthorized_invites)
-                await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+                view = InviteCleanupConfirmView(unauthorized_codes)
+                await interaction.response.send_message(embed=embed, view=view, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             else:
                 embed.add_field(
                     name="🎉 All Clean!",
                     value="No unauthorized invites found. All invites are official bot-generated staff invites.",
                     inline=False
                 )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+                await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
             logger.error(f"❌ Error analyzing invites: {e}")
-            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+            await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
 
 class InviteCleanupConfirmView(discord.ui.View):
     """Confirmation view for invite cleanup"""
     
-    def __init__(self, unauthorized_invites):
+    def __init__(self, unauthorized_codes):
         super().__init__(timeout=300)  # 5 minute timeout
-        self.unauthorized_invites = unauthorized_invites
+        self.unauthorized_codes = unauthorized_codes  # Codes shown to the admin in the analysis
     
     async def on_timeout(self):
         """Handle view timeout"""
@@ -2749,20 +3062,37 @@ class InviteCleanupConfirmView(discord.ui.View):
             # Acknowledge the interaction immediately
             await interaction.response.defer(ephemeral=True)
             
-            removed_count = 0
-            errors = []
+            # Only the analysed invites the admin confirmed that still exist; newer invites are left alone
+            unauthorized_invites = [
+                invite for invite in await interaction.guild.invites()
+                if invite.code in self.unauthorized_codes
+            ]
             
-            for invite in self.unauthorized_invites:
-                try:
+            # Delete concurrently, bounded like the other bulk invite commands
+            semaphore = asyncio.Semaphore(INVITE_CREATE_CONCURRENCY)
+            vip_cog = interaction.client.get_cog('VIPUpgrade')
+            
+            async def delete_invite(invite):
+                async with semaphore:
                     await invite.delete(reason="Unauthorized invite cleanup by admin")
-                    removed_count += 1
-                except Exception as e:
-                    errors.append(f"Failed to remove {invite.code}: {str(e)}")
+                    if vip_cog:
+                        vip_cog._forget_invite(interaction.guild, invite.code)
+            
+            outcomes = await asyncio.gather(
+                *map(delete_invite, unauthorized_invites), return_exceptions=True
+            )
+            
+            errors = [
+                f"Failed to remove {invite.code}: {str(outcome)}"
+                for invite, outcome in zip(unauthorized_invites, outcomes)
+                if isinstance(outcome, BaseException)
+            ]
+            removed_count = len(outcomes) - len(errors)
             
             embed = discord.Embed(
                 title="✅ Invite Cleanup Complete",
                 description=f"Successfully removed {removed_count} non-staff invites\n\n**Only bot-generated staff invites remain**",
-                color=discord.Color.green()
+                color=_GREEN
             )
             
             if errors:
@@ -2783,12 +3113,12 @@ class InviteCleanupConfirmView(discord.ui.View):
             if interaction.message:
                 await interaction.followup.edit_message(interaction.message.id, embed=embed, view=self)
             else:
-                await interaction.followup.send(embed=embed, ephemeral=True)
+                await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
             try:
-                await interaction.followup.send(f"❌ Error during cleanup: {str(e)}", ephemeral=True)
+                await interaction.followup.send(f"❌ Error during cleanup: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             except Exception as followup_error:
                 logger.error(f"Failed to send followup error message: {followup_error}")
     
@@ -2799,7 +3129,7 @@ class InviteCleanupConfirmView(discord.ui.View):
             embed = discord.Embed(
                 title="❌ Cleanup Cancelled",
                 description="No invites were removed.",
-                color=discord.Color.red()
+                color=_RED
             )
             
             # Disable the view
@@ -2814,7 +3144,7 @@ class InviteCleanupConfirmView(discord.ui.View):
         except Exception as e:
             logger.error(f"Error cancelling cleanup: {e}")
             try:
-                await interaction.response.send_message("❌ Cleanup cancelled", ephemeral=True)
+                await interaction.response.send_message("❌ Cleanup cancelled", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             except:
                 pass
 
@@ -2827,14 +3157,14 @@ class InviteCleanupConfirmView(discord.ui.View):
     async def export_staff_invites(self, interaction: discord.Interaction):
         """Export all current staff invite mappings and user relationships"""
         if not (isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator):
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
 
         try:
             await interaction.response.defer(ephemeral=True)
             
             # Get all staff configurations
-            staff_configs = self.bot.db.get_all_staff_configs()
+            staff_configs = await asyncio.to_thread(self.bot.db.get_all_staff_configs)
             
             if not staff_configs:
                 embed = discord.Embed(
@@ -2842,12 +3172,14 @@ class InviteCleanupConfirmView(discord.ui.View):
                     description="No staff invite configurations found in database.",
                     color=discord.Color.orange()
                 )
-                await interaction.followup.send(embed=embed, ephemeral=True)
+                await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
 
             # Build export data structure
+            # Local naive time keeps the export_timestamp and filename format the import tooling expects
+            exported_at = datetime.now()
             export_data = {
-                "export_timestamp": datetime.now().isoformat(),
+                "export_timestamp": exported_at.isoformat(),
                 "export_version": "1.0",
                 "staff_invites": [],
                 "user_mappings": {}
@@ -2878,7 +3210,7 @@ class InviteCleanupConfirmView(discord.ui.View):
                     export_data["staff_invites"].append(staff_data)
 
                     # Get all users who joined through this invite
-                    invite_users = self.bot.db.get_users_by_invite_code(invite_code)
+                    invite_users = await asyncio.to_thread(self.bot.db.get_users_by_invite_code, invite_code)
                     user_list = []
                     
                     for user_data in invite_users:
@@ -2910,7 +3242,7 @@ class InviteCleanupConfirmView(discord.ui.View):
             json_data = json.dumps(export_data, indent=2, default=str)
             
             # Create file
-            filename = f"staff_invites_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            filename = f"staff_invites_backup_{exported_at.strftime('%Y%m%d_%H%M%S')}.json"
             
             with open(filename, 'w', encoding='utf-8') as f:
                 f.write(json_data)
@@ -2920,7 +3252,7 @@ class InviteCleanupConfirmView(discord.ui.View):
                 title="📤 Staff Invite Data Exported",
                 description="Successfully exported all staff invite data and user mappings.",
                 color=discord.Color.green(),
-                timestamp=datetime.now()
+                timestamp=_now()
             )
             
             total_staff = len(export_data["staff_invites"])
@@ -2949,7 +3281,7 @@ class InviteCleanupConfirmView(discord.ui.View):
             # Send file
             with open(filename, 'rb') as f:
                 file = discord.File(f, filename=filename)
-                await interaction.followup.send(embed=embed, file=file, ephemeral=True)
+                await interaction.followup.send(embed=embed, file=file, ephemeral=True, allowed_mentions=_NO_MENTIONS)
             
             # Clean up temporary file
             try:
@@ -2959,7 +3291,7 @@ class InviteCleanupConfirmView(discord.ui.View):
 
         except Exception as e:
             logger.error(f"Error exporting staff invites: {e}")
-            await interaction.followup.send(f"❌ Export failed: {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ Export failed: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
 
     @app_commands.command(name="import_staff_invites", description="[ADMIN] Import staff invite data from backup")
     @app_commands.describe(backup_file="JSON backup file to import from")
@@ -2967,7 +3299,7 @@ class InviteCleanupConfirmView(discord.ui.View):
     async def import_staff_invites(self, interaction: discord.Interaction, backup_file: discord.Attachment):
         """Import staff invite mappings from exported backup file"""
         if not (isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator):
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
 
         try:
@@ -2975,7 +3307,7 @@ class InviteCleanupConfirmView(discord.ui.View):
             
             # Validate file type
             if not backup_file.filename.endswith('.json'):
-                await interaction.followup.send("❌ Please upload a JSON backup file.", ephemeral=True)
+                await interaction.followup.send("❌ Please upload a JSON backup file.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             # Download and parse file
@@ -2983,13 +3315,13 @@ class InviteCleanupConfirmView(discord.ui.View):
             try:
                 import_data = json.loads(file_content.decode('utf-8'))
             except json.JSONDecodeError as e:
-                await interaction.followup.send(f"❌ Invalid JSON file: {str(e)}", ephemeral=True)
+                await interaction.followup.send(f"❌ Invalid JSON file: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             # Validate backup format
             required_keys = ['export_timestamp', 'staff_invites', 'user_mappings']
             if not all(key in import_data for key in required_keys):
-                await interaction.followup.send("❌ Invalid backup format. Missing required keys.", ephemeral=True)
+                await interaction.followup.send("❌ Invalid backup format. Missing required keys.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             # Import staff configurations
@@ -2998,7 +3330,8 @@ class InviteCleanupConfirmView(discord.ui.View):
             
             for staff_data in import_data.get('staff_invites', []):
                 try:
-                    success = self.bot.db.add_staff_invite_config(
+                    success = await asyncio.to_thread(
+                        self.bot.db.add_staff_invite_config,
                         staff_id=staff_data['staff_id'],
                         staff_username=staff_data['staff_username'],
                         invite_code=staff_data['invite_code'],
@@ -3024,7 +3357,8 @@ class InviteCleanupConfirmView(discord.ui.View):
                     try:
                         # Use manual join recording to restore historical data
                         if hasattr(self.bot.db, 'record_user_join_manual'):
-                            success = self.bot.db.record_user_join_manual(
+                            success = await asyncio.to_thread(
+                                self.bot.db.record_user_join_manual,
                                 user_id=user_data['user_id'],
                                 username=user_data['username'],
                                 invite_code=invite_code,
@@ -3034,7 +3368,8 @@ class InviteCleanupConfirmView(discord.ui.View):
                             )
                         else:
                             # Fallback to regular join recording
-                            success = self.bot.db.record_user_join(
+                            success = await asyncio.to_thread(
+                                self.bot.db.record_user_join,
                                 user_id=user_data['user_id'],
                                 username=user_data['username'],
                                 invite_code=invite_code,
@@ -3056,7 +3391,7 @@ class InviteCleanupConfirmView(discord.ui.View):
             embed = discord.Embed(
                 title="📥 Staff Invite Data Import Complete",
                 color=discord.Color.green() if not staff_errors and not user_errors else discord.Color.orange(),
-                timestamp=datetime.now()
+                timestamp=_now()
             )
             
             embed.add_field(
@@ -3088,25 +3423,25 @@ class InviteCleanupConfirmView(discord.ui.View):
                 inline=False
             )
 
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
 
         except Exception as e:
             logger.error(f"Error importing staff invites: {e}")
-            await interaction.followup.send(f"❌ Import failed: {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ Import failed: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
 
     @app_commands.command(name="rebuild_from_discord", description="[ADMIN] Rebuild staff invite relationships from Discord's live data")
     @app_commands.default_permissions(administrator=True)
     async def rebuild_from_discord(self, interaction: discord.Interaction):
         """Use Discord's live invite data to rebuild missing staff invite connections"""
         if not (isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator):
-            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True)
+            await interaction.response.send_message("❌ You need administrator permissions to use this command.", ephemeral=True, allowed_mentions=_NO_MENTIONS)
             return
 
         try:
             await interaction.response.defer(ephemeral=True)
             
             # Get all staff configurations
-            staff_configs = self.bot.db.get_all_staff_configs()
+            staff_configs = await asyncio.to_thread(self.bot.db.get_all_staff_configs)
             
             if not staff_configs:
                 embed = discord.Embed(
@@ -3114,14 +3449,14 @@ class InviteCleanupConfirmView(discord.ui.View):
                     description="No staff invite configurations found. Import backup data first if available.",
                     color=discord.Color.orange()
                 )
-                await interaction.followup.send(embed=embed, ephemeral=True)
+                await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             # Get all Discord invites
             try:
                 discord_invites = await interaction.guild.invites()
             except Exception as e:
-                await interaction.followup.send(f"❌ Failed to fetch Discord invites: {str(e)}", ephemeral=True)
+                await interaction.followup.send(f"❌ Failed to fetch Discord invites: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
                 return
             
             # Build mapping of staff invite codes
@@ -3181,7 +3516,7 @@ class InviteCleanupConfirmView(discord.ui.View):
                 title="🔄 Discord Data Rebuild Complete",
                 description="Analyzed Discord's live invite data and attempted to rebuild relationships.",
                 color=discord.Color.blue(),
-                timestamp=datetime.now()
+                timestamp=_now()
             )
             
             embed.add_field(
@@ -3240,11 +3575,11 @@ class InviteCleanupConfirmView(discord.ui.View):
                 inline=False
             )
 
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True, allowed_mentions=_NO_MENTIONS)
 
         except Exception as e:
             logger.error(f"Error rebuilding from Discord: {e}")
-            await interaction.followup.send(f"❌ Rebuild failed: {str(e)}", ephemeral=True)
+            await interaction.followup.send(f"❌ Rebuild failed: {str(e)}", ephemeral=True, allowed_mentions=_NO_MENTIONS)
 
 async def setup(bot):
     await bot.add_cog(VIPUpgrade(bot))
\ No newline at end of file
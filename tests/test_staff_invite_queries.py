@@ -0,0 +1,220 @@
+"""
+Tests for the staff invite and VIP request queries shared by both SQLite backends
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from utils.cloud_database import CloudAPIServerDatabase
+from utils.database import ServerDatabase
+
+STAFF_A = 111
+STAFF_B = 222
+NOT_IN_CONFIG = 999
+
+STAFF_CONFIG = {
+    "staff_members": {
+        "alice": {
+            "discord_id": STAFF_A,
+            "username": "alice",
+            "vantage_referral_link": "https://example.com/ref/alice",
+            "vantage_ib_code": "1001"
+        },
+        "bob": {
+            "discord_id": STAFF_B,
+            "username": "bob",
+            "vantage_referral_link": "https://example.com/ref/bob",
+            "vantage_ib_code": "1002"
+        }
+    }
+}
+
+
+class StaffInviteQueriesMixin:
+    """Behaviour every backend must share; subclasses provide make_db()"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.tmp_dir, "staff_config.json")
+        with open(self.config_path, 'w') as f:
+            json.dump(STAFF_CONFIG, f)
+        self.db = self.make_db()
+        self.db.config_path = self.config_path
+        self.db._staff_config = None
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def query(self, sql, params=()):
+        conn = self.db.get_connection()
+        rows = conn.execute(sql, params).fetchall()
+        conn.close()
+        return rows
+
+    def add_joins(self, invite_code, count, inviter_id=STAFF_A):
+        """Insert count joins for invite_code, one minute apart (user 1 joined first)"""
+        start = datetime(2025, 1, 1)
+        conn = self.db.get_connection()
+        conn.executemany('''
+            INSERT INTO invite_tracking (user_id, username, invite_code, inviter_id, inviter_username, joined_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', [(user_id, f"user{user_id}", invite_code, inviter_id, "alice", start + timedelta(minutes=user_id))
+              for user_id in range(1, count + 1)])
+        conn.commit()
+        conn.close()
+
+    # reassign_staff_invite
+
+    def test_reassign_unknown_code_is_not_found(self):
+        self.assertEqual(self.db.reassign_staff_invite("nope", STAFF_B), ('not_found', None))
+
+    def test_reassign_to_same_owner_is_unchanged(self):
+        self.db.update_staff_invite_code(STAFF_A, "codeA")
+        self.assertEqual(self.db.reassign_staff_invite("codeA", STAFF_A), ('unchanged', STAFF_A))
+        self.assertEqual(self.query('SELECT staff_id FROM staff_invites WHERE invite_code = ?', ("codeA",)), [(STAFF_A,)])
+
+    def test_reassign_moves_invite_requests_and_joins(self):
+        self.db.update_staff_invite_code(STAFF_A, "codeA")
+        self.db.create_vip_request(500, "member", "new_account", STAFF_A, "{}")
+        self.add_joins("codeA", 2)
+
+        self.assertEqual(self.db.reassign_staff_invite("codeA", STAFF_B), ('updated', STAFF_A))
+
+        self.assertEqual(self.query('SELECT staff_id FROM staff_invites WHERE invite_code = ?', ("codeA",)), [(STAFF_B,)])
+        self.assertEqual(self.query('SELECT DISTINCT staff_id FROM vip_requests'), [(STAFF_B,)])
+        self.assertEqual(self.query('SELECT DISTINCT inviter_id FROM invite_tracking'), [(STAFF_B,)])
+
+    # update_staff_invite_codes_bulk
+
+    def test_bulk_update_skips_ids_missing_from_config(self):
+        results = self.db.update_staff_invite_codes_bulk([
+            (STAFF_A, "newA"), (NOT_IN_CONFIG, "ghost"), (STAFF_B, "newB")
+        ])
+
+        self.assertEqual(results, {STAFF_A: True, NOT_IN_CONFIG: False, STAFF_B: True})
+        self.assertEqual(
+            self.query('SELECT staff_id, invite_code FROM staff_invites ORDER BY staff_id'),
+            [(STAFF_A, "newA"), (STAFF_B, "newB")]
+        )
+
+    def test_bulk_update_with_only_unknown_ids_writes_nothing(self):
+        self.assertEqual(self.db.update_staff_invite_codes_bulk([(NOT_IN_CONFIG, "ghost")]), {NOT_IN_CONFIG: False})
+        self.assertEqual(self.query('SELECT COUNT(*) FROM staff_invites'), [(0,)])
+
+    # get_invite_user_summary
+
+    def test_invite_user_summary_pages_newest_first(self):
+        self.add_joins("codeA", 30)
+
+        users, total = self.db.get_invite_user_summary("codeA", limit=25, offset=0)
+        self.assertEqual(total, 30)
+        self.assertEqual([u.user_id for u in users], list(range(30, 5, -1)))
+
+        users, total = self.db.get_invite_user_summary("codeA", limit=25, offset=25)
+        self.assertEqual(total, 30)
+        self.assertEqual([u.user_id for u in users], [5, 4, 3, 2, 1])
+
+    def test_invite_user_summary_past_last_page_keeps_total(self):
+        self.add_joins("codeA", 30)
+        self.assertEqual(self.db.get_invite_user_summary("codeA", limit=25, offset=50), ([], 30))
+
+    def test_invite_user_summary_unused_code(self):
+        self.assertEqual(self.db.get_invite_user_summary("unused"), ([], 0))
+
+    def test_invite_user_summary_sees_new_join_immediately(self):
+        self.add_joins("codeA", 2)
+        self.assertEqual(self.db.get_invite_user_summary("codeA")[1], 2)
+
+        self.db.record_user_join(50, "late", "codeA", STAFF_A, "alice", 2, 3)
+
+        users, total = self.db.get_invite_user_summary("codeA")
+        self.assertEqual(total, 3)
+        self.assertEqual(users[0].user_id, 50)
+
+    def test_reassign_clears_invite_user_cache(self):
+        self.db.update_staff_invite_code(STAFF_A, "codeA")
+        self.add_joins("codeA", 1)
+        self.db.get_invite_user_summary("codeA")
+        self.assertTrue(self.db._invite_user_cache)
+
+        self.db.reassign_staff_invite("codeA", STAFF_B)
+        self.assertEqual(self.db._invite_user_cache, {})
+
+    # get_staff_vip_stats_bulk
+
+    def test_staff_stats_bulk_counts_by_invite_code(self):
+        self.db.update_staff_invite_code(STAFF_A, "codeA")
+        self.add_joins("codeA", 4, inviter_id=STAFF_B)  # Counted for the code's owner, not the recorded inviter
+        self.db.create_vip_request(500, "member", "new_account", STAFF_A, "{}")
+        self.db.create_vip_request(501, "member2", "new_account", STAFF_A, "{}")
+        self.db.update_vip_request_status(1, 'completed')
+
+        stats = self.db.get_staff_vip_stats_bulk([STAFF_A, STAFF_B])
+        self.assertEqual(stats[STAFF_A], {
+            'total_invites': 4, 'vip_conversions': 1, 'pending_requests': 1, 'conversion_rate': 25.0
+        })
+        self.assertEqual(stats[STAFF_B], {
+            'total_invites': 0, 'vip_conversions': 0, 'pending_requests': 0, 'conversion_rate': 0
+        })
+        self.assertEqual(self.db.get_staff_vip_stats_bulk([]), {})
+
+    # get_vip_requests_page
+
+    def test_vip_requests_page_bounds_and_total(self):
+        for user_id in range(1, 14):
+            self.db.create_vip_request(user_id, f"user{user_id}", "new_account", STAFF_A, "{}")
+        self.db.update_vip_request_status(1, 'completed')
+
+        requests, total = self.db.get_vip_requests_page('pending', limit=10, offset=0)
+        self.assertEqual((len(requests), total), (10, 12))
+
+        requests, total = self.db.get_vip_requests_page('pending', limit=10, offset=10)
+        self.assertEqual((len(requests), total), (2, 12))
+
+        self.assertEqual(self.db.get_vip_requests_page('pending', limit=10, offset=20), ([], 12))
+        self.assertEqual(self.db.get_vip_requests_page('all', limit=10, offset=0)[1], 13)
+        self.assertEqual(self.db.get_vip_requests_page('denied'), ([], 0))
+
+    def test_vip_requests_page_matches_full_listing(self):
+        for user_id in range(1, 6):
+            self.db.create_vip_request(user_id, f"user{user_id}", "new_account", STAFF_A, "{}")
+
+        full = self.db.get_vip_requests_by_status('pending')
+        page, _ = self.db.get_vip_requests_page('pending', limit=2, offset=1)
+        self.assertEqual(page, full[1:3])
+        self.assertIsInstance(page[0]['created_ts'], int)
+
+
+class TestServerDatabaseQueries(StaffInviteQueriesMixin, unittest.TestCase):
+    def make_db(self):
+        return ServerDatabase(os.path.join(self.tmp_dir, "server.db"))
+
+
+class TestCloudDatabaseQueries(StaffInviteQueriesMixin, unittest.TestCase):
+    def make_db(self):
+        # The cloud backend always opens server_management.db in the working directory
+        self.old_cwd = os.getcwd()
+        os.chdir(self.tmp_dir)
+        self.addCleanup(os.chdir, self.old_cwd)
+        db = CloudAPIServerDatabase()
+        db.cloud_base_url = None  # Keep trigger_backup local
+        return db
+
+    def test_manual_join_and_removal_refresh_invite_users(self):
+        self.db.record_user_join_manual(1, "user1", "codeA", STAFF_A, "alice", datetime(2025, 1, 1))
+        self.assertEqual(self.db.get_invite_user_summary("codeA")[1], 1)
+
+        self.db.record_user_join_manual(2, "user2", "codeA", STAFF_A, "alice", datetime(2025, 1, 2))
+        self.assertEqual(self.db.get_invite_user_summary("codeA")[1], 2)
+
+        self.db.remove_user_invite_tracking(2)
+        users, total = self.db.get_invite_user_summary("codeA")
+        self.assertEqual((total, [u.user_id for u in users]), (1, [1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
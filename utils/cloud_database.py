@@ -7,17 +7,24 @@ This provides persistent storage that survives deployments using the same patter
 as the main trading service.
 """
 
+import copy
 import sqlite3
 import requests
 import logging
+import time
 import asyncio
 from datetime import datetime
 from typing import Optional, Dict, List, Tuple
 import os
 import json
 
+from utils.database import InviteUser, SQLITE_PRAGMAS
+
 logger = logging.getLogger(__name__)
 
+STAFF_CACHE_TTL = 60  # Seconds staff config reads are reused between writes
+INVITE_USER_CACHE_TTL = 30  # Seconds invite user listings are reused between joins
+
 class CloudAPIServerDatabase:
     """Cloud API database manager for server bot features"""
     
@@ -25,13 +32,32 @@ class CloudAPIServerDatabase:
         self.cloud_base_url = cloud_url or "https://web-production-1299f.up.railway.app"  # Same as trading service
         self.db_path = "server_management.db"  # Local SQLite for temp storage
         self.config_path = os.path.join(os.path.dirname(__file__), "..", "config", "staff_config.json")
+        self._staff_cache = {}  # {name: (monotonic, result)}, cleared on staff_invites writes
+        self._invite_user_cache = {}  # {(query, invite_code, ...): (monotonic, result)}, cleared on invite_tracking writes
+        self._staff_config = None  # Parsed staff_config.json, re-read when its mtime changes
+        self._staff_config_mtime = None
+        self._staff_by_discord_id = {}  # {discord_id: config entry}, rebuilt with _staff_config
         self.init_database()
-        self.load_staff_config()
+        self._get_staff_config()
         # Note: restore_from_cloud() will be called by the bot startup process
     
     def get_connection(self):
         """Get a local SQLite database connection"""
-        return sqlite3.connect(self.db_path, timeout=10.0)
+        conn = sqlite3.connect(self.db_path, timeout=10.0)
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def ping(self) -> bool:
+        """Check that the local SQLite database answers a trivial query"""
+        try:
+            conn = self.get_connection()
+            conn.execute('SELECT 1').fetchone()
+            conn.close()
+            return True
+        except Exception as e:
+            logger.error(f"❌ Database ping failed: {e}")
+            return False
     
     def init_database(self):
         """Initialize SQLite database with cloud API backup capability"""
@@ -40,9 +66,12 @@ class CloudAPIServerDatabase:
             db_dir = os.path.dirname(self.db_path)
             if db_dir:
                 os.makedirs(db_dir, exist_ok=True)
-            conn = sqlite3.connect(self.db_path)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
+            # WAL lets the admin read queries run alongside invite-join writes
+            cursor.execute('PRAGMA journal_mode=WAL')
+            
             # Invite tracking table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS invite_tracking (
@@ -57,6 +86,12 @@ class CloudAPIServerDatabase:
                 )
             ''')
             
+            # Covering index for the paged invite user listings (user_id is the rowid)
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_invite_tracking_code_joined
+                ON invite_tracking(invite_code, joined_at DESC, username)
+            ''')
+            
             # Staff invite configuration table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS staff_invites (
@@ -71,6 +106,12 @@ class CloudAPIServerDatabase:
                 )
             ''')
             
+            # Index invite code lookups (staff_id is already the primary key)
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_staff_invites_invite_code
+                ON staff_invites(invite_code)
+            ''')
+            
             # VIP upgrade requests table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS vip_requests (
@@ -87,6 +128,16 @@ class CloudAPIServerDatabase:
                 )
             ''')
             
+            # Status listings page newest-first straight off these indexes ('all' uses the second)
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_vip_requests_status_created
+                ON vip_requests(status, created_at DESC)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_vip_requests_created
+                ON vip_requests(created_at DESC)
+            ''')
+            
             # Onboarding progress table (welcome system)
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS onboarding_progress (
@@ -116,6 +167,15 @@ class CloudAPIServerDatabase:
                 )
             ''')
             
+            # Sticky embed message cache (local only - rebuilt from channel history on miss)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS sticky_messages (
+                    channel_id INTEGER PRIMARY KEY,
+                    message_id INTEGER,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
             conn.commit()
             conn.close()
             logger.info("✅ SQLite Server database initialized with cloud API backup capability")
@@ -125,15 +185,31 @@ class CloudAPIServerDatabase:
             raise
     
     def load_staff_config(self) -> Dict:
-        """Load staff configuration from JSON file"""
+        """Load staff configuration from JSON file (a copy callers are free to modify)"""
+        return copy.deepcopy(self._get_staff_config())
+    
+    def _get_staff_config(self) -> Dict:
+        """Shared parsed staff configuration, re-read only when the file changes on disk (don't modify)"""
         try:
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
-            return config
+            mtime = os.path.getmtime(self.config_path)
+            if self._staff_config is None or mtime != self._staff_config_mtime:
+                with open(self.config_path, 'r') as f:
+                    config = json.load(f)
+                self._staff_by_discord_id = {
+                    info["discord_id"]: info for info in config.get("staff_members", {}).values()
+                }
+                self._staff_config, self._staff_config_mtime = config, mtime
+            return self._staff_config
         except Exception as e:
             logger.error(f"Failed to load staff config: {e}")
             return {}
     
+    def _get_staff_config_entry(self, discord_id: int) -> Optional[Dict]:
+        """Look up a staff member's config file entry by Discord ID"""
+        if not self._get_staff_config().get("staff_members"):
+            return None
+        return self._staff_by_discord_id.get(discord_id)
+    
     def update_staff_invite_code(self, discord_id: int, invite_code: str) -> bool:
         """
         Update invite code for a staff member using clean architecture:
@@ -142,13 +218,7 @@ class CloudAPIServerDatabase:
         """
         try:
             # Verify staff exists in config first
-            config = self.load_staff_config()
-            staff_info = None
-            
-            for staff_key, info in config["staff_members"].items():
-                if info["discord_id"] == discord_id:
-                    staff_info = info
-                    break
+            staff_info = self._get_staff_config_entry(discord_id)
             
             if not staff_info:
                 logger.warning(f"Staff member with Discord ID {discord_id} not found in config")
@@ -166,6 +236,7 @@ class CloudAPIServerDatabase:
             
             conn.commit()
             conn.close()
+            self._staff_cache.clear()
             
             logger.info(f"✅ Updated invite code for {staff_info['username']} (Discord ID: {discord_id}) with clean architecture")
             
@@ -178,6 +249,47 @@ class CloudAPIServerDatabase:
             logger.error(f"Failed to update staff invite code: {e}")
             return False
     
+    def update_staff_invite_codes_bulk(self, pairs: List[Tuple[int, str]]) -> Dict[int, bool]:
+        """Update invite codes for several staff members in one transaction (and one cloud backup)"""
+        results = {discord_id: False for discord_id, _ in pairs}
+        try:
+            # Same config check as update_staff_invite_code, reading the config file once
+            config = self._get_staff_config()
+            known_ids = {info["discord_id"] for info in config["staff_members"].values()}
+            for discord_id in results.keys() - known_ids:
+                logger.warning(f"Staff member with Discord ID {discord_id} not found in config")
+            
+            now = datetime.now()
+            rows = [(discord_id, invite_code, now) for discord_id, invite_code in pairs if discord_id in known_ids]
+            if not rows:
+                return results
+            
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.executemany('''
+                INSERT OR REPLACE INTO staff_invites 
+                (staff_id, staff_username, invite_code, vantage_referral_link, vantage_ib_code, updated_at)
+                VALUES (?, NULL, ?, NULL, NULL, ?)
+            ''', rows)
+            
+            conn.commit()
+            conn.close()
+            self._staff_cache.clear()
+            
+            for discord_id, _, _ in rows:
+                results[discord_id] = True
+            logger.info(f"✅ Updated invite codes for {len(rows)} staff members with clean architecture")
+            
+            # Trigger immediate cloud backup
+            self.trigger_backup()
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Failed to update staff invite codes: {e}")
+            return results
+    
     def get_all_staff_invite_codes(self) -> set:
         """Get all staff invite codes from database"""
         try:
@@ -196,8 +308,12 @@ class CloudAPIServerDatabase:
     
     def get_staff_invite_status(self) -> Dict:
         """Get staff invite status from database"""
+        cached = self._staff_cache.get('invite_status')
+        if cached and time.monotonic() - cached[0] < STAFF_CACHE_TTL:
+            return cached[1]
+        
         try:
-            config = self.load_staff_config()
+            config = self._get_staff_config()
             result = {}
             
             if config and 'staff_members' in config:
@@ -217,6 +333,7 @@ class CloudAPIServerDatabase:
                 
                 conn.close()
             
+            self._staff_cache['invite_status'] = (time.monotonic(), result)
             return result
             
         except Exception as e:
@@ -266,6 +383,7 @@ class CloudAPIServerDatabase:
             
             conn.commit()
             conn.close()
+            self._invite_user_cache.clear()
             
             logger.info(f"✅ Recorded user join: {username} via invite {invite_code}")
             return True
@@ -292,6 +410,7 @@ class CloudAPIServerDatabase:
             
             conn.commit()
             conn.close()
+            self._invite_user_cache.clear()
             
             logger.info(f"✅ Manually recorded user join: {username} via invite {invite_code}")
             return True
@@ -342,6 +461,7 @@ class CloudAPIServerDatabase:
                 # Remove from invite tracking
                 cursor.execute('DELETE FROM invite_tracking WHERE user_id = ?', (user_id,))
                 conn.commit()
+                self._invite_user_cache.clear()
                 logger.info(f"✅ Removed invite tracking for user {user_id}")
                 result = True
             else:
@@ -389,7 +509,7 @@ class CloudAPIServerDatabase:
             
         try:
             # Get all data from local SQLite
-            conn = sqlite3.connect(self.db_path)
+            conn = self.get_connection()
             conn.row_factory = sqlite3.Row  # For dict-like access
             cursor = conn.cursor()
             
@@ -497,7 +617,7 @@ class CloudAPIServerDatabase:
                         logger.warning(f"Could not parse backup timestamp: {ts_error}")
             
             # Restore to local SQLite
-            conn = sqlite3.connect(self.db_path)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             # Clear existing data
@@ -584,6 +704,8 @@ class CloudAPIServerDatabase:
             
             conn.commit()
             conn.close()
+            self._staff_cache.clear()
+            self._invite_user_cache.clear()
             
             # CRITICAL: Also restore invite cache from cloud backup
             try:
@@ -612,24 +734,22 @@ class CloudAPIServerDatabase:
         """
         try:
             # First get static data from config file
-            config = self.load_staff_config()
+            staff_info = self._get_staff_config_entry(discord_id)
             staff_static_data = None
             
-            for staff_key, staff_info in config["staff_members"].items():
-                if staff_info["discord_id"] == discord_id:
-                    staff_static_data = {
-                        'discord_id': staff_info["discord_id"],
-                        'username': staff_info["username"],
-                        'vantage_referral_link': staff_info["vantage_referral_link"],
-                        'vantage_ib_code': staff_info["vantage_ib_code"]
-                    }
-                    break
+            if staff_info:
+                staff_static_data = {
+                    'discord_id': staff_info["discord_id"],
+                    'username': staff_info["username"],
+                    'vantage_referral_link': staff_info["vantage_referral_link"],
+                    'vantage_ib_code': staff_info["vantage_ib_code"]
+                }
             
             if not staff_static_data:
                 return None  # Staff member not found in config
             
             # Now get dynamic data (invite_code) from database
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -663,7 +783,7 @@ class CloudAPIServerDatabase:
         """
         try:
             # First get Discord ID from database using invite code
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -681,16 +801,15 @@ class CloudAPIServerDatabase:
             discord_id = row[0]
             
             # Now get static data from config file
-            config = self.load_staff_config()
-            for staff_key, staff_info in config["staff_members"].items():
-                if staff_info["discord_id"] == discord_id:
-                    return {
-                        'discord_id': staff_info["discord_id"],
-                        'username': staff_info["username"],
-                        'vantage_referral_link': staff_info["vantage_referral_link"],
-                        'vantage_ib_code': staff_info["vantage_ib_code"],
-                        'invite_code': invite_code
-                    }
+            staff_info = self._get_staff_config_entry(discord_id)
+            if staff_info:
+                return {
+                    'discord_id': staff_info["discord_id"],
+                    'username': staff_info["username"],
+                    'vantage_referral_link': staff_info["vantage_referral_link"],
+                    'vantage_ib_code': staff_info["vantage_ib_code"],
+                    'invite_code': invite_code
+                }
             
             # If we reach here, invite code exists in DB but Discord ID not in config
             logger.warning(f"⚠️ Invite code {invite_code} found in DB but Discord ID {discord_id} not in config")
@@ -709,21 +828,13 @@ class CloudAPIServerDatabase:
         """
         try:
             # Verify staff exists in config first
-            config = self.load_staff_config()
-            staff_exists = False
-            staff_username = None
-            
-            for staff_key, staff_info in config["staff_members"].items():
-                if staff_info["discord_id"] == staff_id:
-                    staff_exists = True
-                    staff_username = staff_info["username"]
-                    break
+            staff_info = self._get_staff_config_entry(staff_id)
             
-            if not staff_exists:
+            if not staff_info:
                 logger.error(f"❌ Staff member with Discord ID {staff_id} not found in config file")
                 return False
             
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             # Store only dynamic data, set static data columns to NULL for clean architecture
@@ -736,8 +847,9 @@ class CloudAPIServerDatabase:
             
             conn.commit()
             conn.close()
+            self._staff_cache.clear()
             
-            logger.info(f"✅ Updated invite code for {staff_username} (Discord ID: {staff_id}) with clean architecture")
+            logger.info(f"✅ Updated invite code for {staff_info['username']} (Discord ID: {staff_id}) with clean architecture")
             
             # Trigger immediate cloud backup
             self.trigger_backup()
@@ -752,7 +864,7 @@ class CloudAPIServerDatabase:
                                  vantage_email: Optional[str] = None) -> bool:
         """Update VIP request status"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             if vantage_email:
@@ -778,55 +890,76 @@ class CloudAPIServerDatabase:
             logger.error(f"❌ Error updating VIP request: {e}")
             return False
 
+    def _fetch_vip_requests(self, cursor, status: Optional[str], limit: int = -1, offset: int = 0) -> List[Dict]:
+        """Fetch VIP requests newest-first, filtered by status unless it is 'all' (limit -1 means no limit)"""
+        if status and status != 'all':
+            where, params = 'WHERE status = ?', (status,)
+        else:
+            where, params = '', ()
+        
+        cursor.execute(f'''
+            SELECT id, user_id, username, request_type, staff_id, status, 
+                   vantage_email, created_at, updated_at,
+                   CAST(strftime('%s', created_at) AS INTEGER) AS created_ts
+            FROM vip_requests 
+            {where}
+            ORDER BY created_at DESC
+            LIMIT ? OFFSET ?
+        ''', params + (limit, offset))
+        
+        requests = []
+        for row in cursor.fetchall():
+            requests.append({
+                'id': row[0],
+                'user_id': row[1],
+                'username': row[2],
+                'request_type': row[3],
+                'staff_id': row[4],
+                'status': row[5],
+                'vantage_email': row[6],
+                'created_at': row[7],
+                'updated_at': row[8],
+                'created_ts': row[9]
+            })
+        return requests
+    
     def get_vip_requests_by_status(self, status: Optional[str] = None) -> List[Dict]:
         """Get VIP requests filtered by status"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            requests = self._fetch_vip_requests(cursor, status)
+            conn.close()
+            return requests
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting VIP requests: {e}")
+            return []
+    
+    def get_vip_requests_page(self, status: Optional[str] = None, limit: int = 10, offset: int = 0) -> Tuple[List[Dict], int]:
+        """Get one page of VIP requests filtered by status, plus the total match count"""
+        try:
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             if status and status != 'all':
-                cursor.execute('''
-                    SELECT id, user_id, username, request_type, staff_id, status, 
-                           vantage_email, created_at, updated_at
-                    FROM vip_requests 
-                    WHERE status = ?
-                    ORDER BY created_at DESC
-                ''', (status,))
+                cursor.execute('SELECT COUNT(*) FROM vip_requests WHERE status = ?', (status,))
             else:
-                cursor.execute('''
-                    SELECT id, user_id, username, request_type, staff_id, status, 
-                           vantage_email, created_at, updated_at
-                    FROM vip_requests 
-                    ORDER BY created_at DESC
-                ''')
+                cursor.execute('SELECT COUNT(*) FROM vip_requests')
+            total = cursor.fetchone()[0]
             
-            results = cursor.fetchall()
+            requests = self._fetch_vip_requests(cursor, status, limit, offset)
             conn.close()
-            
-            requests = []
-            for row in results:
-                requests.append({
-                    'id': row[0],
-                    'user_id': row[1],
-                    'username': row[2],
-                    'request_type': row[3],
-                    'staff_id': row[4],
-                    'status': row[5],
-                    'vantage_email': row[6],
-                    'created_at': row[7],
-                    'updated_at': row[8]
-                })
-            
-            return requests
+            return requests, total
             
         except Exception as e:
-            logger.error(f"❌ Error getting VIP requests: {e}")
-            return []
+            logger.error(f"❌ Error getting VIP requests page: {e}")
+            return [], 0
 
     def get_user_vip_requests(self, user_id: int) -> List[Dict]:
         """Get all VIP requests for a specific user"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -863,7 +996,7 @@ class CloudAPIServerDatabase:
     def get_staff_vip_stats(self, staff_id: int) -> Dict:
         """Get VIP conversion stats for a staff member"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             # First get the staff member's invite code
@@ -907,10 +1040,124 @@ class CloudAPIServerDatabase:
             logger.error(f"❌ Error getting staff stats: {e}")
             return {'total_invites': 0, 'vip_conversions': 0, 'pending_requests': 0, 'conversion_rate': 0}
 
+    def get_staff_vip_stats_bulk(self, staff_ids: List[int]) -> Dict[int, Dict]:
+        """Get VIP conversion stats for several staff members in a single query"""
+        empty_stats = {'total_invites': 0, 'vip_conversions': 0, 'pending_requests': 0, 'conversion_rate': 0}
+        stats = {staff_id: dict(empty_stats) for staff_id in staff_ids}
+        if not staff_ids:
+            return stats
+        
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            # Same rules as get_staff_vip_stats: invites are counted by the staff
+            # member's invite code, and staff without a code report zeros
+            placeholders = ','.join('?' * len(staff_ids))
+            cursor.execute(f'''
+                SELECT s.staff_id,
+                       COALESCE(t.total_invites, 0),
+                       COALESCE(v.vip_conversions, 0),
+                       COALESCE(v.pending_requests, 0)
+                FROM staff_invites s
+                LEFT JOIN (
+                    SELECT invite_code, COUNT(*) AS total_invites
+                    FROM invite_tracking
+                    GROUP BY invite_code
+                ) t ON t.invite_code = s.invite_code
+                LEFT JOIN (
+                    SELECT staff_id,
+                           SUM(status = 'completed') AS vip_conversions,
+                           SUM(status = 'pending') AS pending_requests
+                    FROM vip_requests
+                    GROUP BY staff_id
+                ) v ON v.staff_id = s.staff_id
+                WHERE s.staff_id IN ({placeholders})
+                  AND s.invite_code IS NOT NULL AND s.invite_code != ''
+            ''', list(staff_ids))
+            
+            for staff_id, total_invites, vip_conversions, pending_requests in cursor.fetchall():
+                stats[staff_id] = {
+                    'total_invites': total_invites,
+                    'vip_conversions': vip_conversions,
+                    'pending_requests': pending_requests,
+                    'conversion_rate': (vip_conversions / total_invites * 100) if total_invites > 0 else 0
+                }
+            
+            conn.close()
+            return stats
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting bulk staff stats: {e}")
+            return stats
+
+    def get_staff_invite_by_code(self, invite_code: str) -> Optional[Dict]:
+        """Get one staff invite configuration by its invite code"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT staff_id, staff_username, invite_code, vantage_referral_link, created_at
+                FROM staff_invites 
+                WHERE invite_code = ?
+                LIMIT 1
+            ''', (invite_code,))
+            
+            row = cursor.fetchone()
+            conn.close()
+            
+            if not row:
+                return None
+            
+            return {
+                'staff_id': row[0],
+                'staff_username': row[1],
+                'invite_code': row[2],
+                'vantage_referral_link': row[3],
+                'created_at': row[4]
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting staff invite by code {invite_code}: {e}")
+            return None
+    
+    def find_staff_by_username_ci(self, username: str) -> List[Dict]:
+        """Get staff invite configurations whose username matches, ignoring case"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT staff_id, staff_username, invite_code, vantage_referral_link, created_at
+                FROM staff_invites 
+                WHERE LOWER(staff_username) = LOWER(?)
+                ORDER BY created_at DESC
+            ''', (username,))
+            
+            results = cursor.fetchall()
+            conn.close()
+            
+            return [{
+                'staff_id': row[0],
+                'staff_username': row[1],
+                'invite_code': row[2],
+                'vantage_referral_link': row[3],
+                'created_at': row[4]
+            } for row in results]
+            
+        except Exception as e:
+            logger.error(f"❌ Error finding staff by username {username}: {e}")
+            return []
+    
     def get_all_staff_configs(self) -> List[Dict]:
         """Get all staff invite configurations"""
+        cached = self._staff_cache.get('all_configs')
+        if cached and time.monotonic() - cached[0] < STAFF_CACHE_TTL:
+            return cached[1]
+        
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -932,6 +1179,7 @@ class CloudAPIServerDatabase:
                     'created_at': row[4]
                 })
             
+            self._staff_cache['all_configs'] = (time.monotonic(), staff_configs)
             return staff_configs
             
         except Exception as e:
@@ -940,8 +1188,13 @@ class CloudAPIServerDatabase:
 
     def get_users_by_invite_code(self, invite_code: str) -> List[Dict]:
         """Get all users who joined through a specific invite code"""
+        key = ('all', invite_code)
+        cached = self._invite_user_cache.get(key)
+        if cached and time.monotonic() - cached[0] < INVITE_USER_CACHE_TTL:
+            return cached[1]
+        
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -968,16 +1221,53 @@ class CloudAPIServerDatabase:
                     'invite_uses_after': row[7]
                 })
             
+            self._invite_user_cache[key] = (time.monotonic(), users)
             return users
             
         except Exception as e:
             logger.error(f"❌ Error getting users by invite code: {e}")
             return []
 
+    def get_invite_user_summary(self, invite_code: str, limit: int = 25, offset: int = 0) -> Tuple[List[InviteUser], int]:
+        """Get one page of users who joined through an invite code (newest first) plus the total join count"""
+        key = ('summary', invite_code, limit, offset)
+        cached = self._invite_user_cache.get(key)
+        if cached and time.monotonic() - cached[0] < INVITE_USER_CACHE_TTL:
+            return cached[1]
+        
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT COUNT(*) FROM invite_tracking WHERE invite_code = ?
+            ''', (invite_code,))
+            total = cursor.fetchone()[0]
+            
+            # Skip the sorted page query when the invite is unused or the page is past the end
+            users = []
+            if offset < total:
+                cursor.execute('''
+                    SELECT user_id, username, joined_at
+                    FROM invite_tracking 
+                    WHERE invite_code = ?
+                    ORDER BY joined_at DESC
+                    LIMIT ? OFFSET ?
+                ''', (invite_code, limit, offset))
+                users = list(map(InviteUser._make, cursor.fetchall()))
+            
+            conn.close()
+            self._invite_user_cache[key] = (time.monotonic(), (users, total))
+            return users, total
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting invite user summary: {e}")
+            return [], 0
+
     def update_staff_discord_id(self, old_discord_id: int, new_discord_id: int) -> bool:
         """Update Discord ID for a staff member (fixes ID mismatches)"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             # Update staff_invites table
@@ -1003,6 +1293,8 @@ class CloudAPIServerDatabase:
             
             conn.commit()
             conn.close()
+            self._staff_cache.clear()
+            self._invite_user_cache.clear()
             
             # Trigger backup to sync changes
             self.trigger_backup()
@@ -1014,6 +1306,58 @@ class CloudAPIServerDatabase:
             logger.error(f"❌ Error updating staff Discord ID: {e}")
             return False
 
+    def reassign_staff_invite(self, invite_code: str, new_discord_id: int) -> Tuple[str, Optional[int]]:
+        """
+        Move the staff member owning invite_code to new_discord_id in one transaction.
+        Returns (status, old_discord_id) where status is 'not_found', 'unchanged', 'updated' or 'error'.
+        """
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            # Take the write lock before reading so nothing changes between the check and the update
+            cursor.execute('BEGIN IMMEDIATE')
+            cursor.execute('''
+                SELECT staff_id FROM staff_invites WHERE invite_code = ? LIMIT 1
+            ''', (invite_code,))
+            row = cursor.fetchone()
+            
+            if not row:
+                conn.rollback()
+                conn.close()
+                return 'not_found', None
+            
+            old_discord_id = row[0]
+            if old_discord_id == new_discord_id:
+                conn.rollback()
+                conn.close()
+                return 'unchanged', old_discord_id
+            
+            cursor.execute('''
+                UPDATE staff_invites SET staff_id = ? WHERE staff_id = ?
+            ''', (new_discord_id, old_discord_id))
+            cursor.execute('''
+                UPDATE vip_requests SET staff_id = ? WHERE staff_id = ?
+            ''', (new_discord_id, old_discord_id))
+            cursor.execute('''
+                UPDATE invite_tracking SET inviter_id = ? WHERE inviter_id = ?
+            ''', (new_discord_id, old_discord_id))
+            
+            conn.commit()
+            conn.close()
+            self._staff_cache.clear()
+            self._invite_user_cache.clear()
+            
+            # Trigger backup to sync changes
+            self.trigger_backup()
+            
+            logger.info(f"✅ Reassigned invite {invite_code}: {old_discord_id} → {new_discord_id}")
+            return 'updated', old_discord_id
+            
+        except Exception as e:
+            logger.error(f"❌ Error reassigning staff invite {invite_code}: {e}")
+            return 'error', None
+
     def trigger_backup(self):
         """Trigger immediate backup (non-blocking)"""
         try:
@@ -1022,7 +1366,7 @@ class CloudAPIServerDatabase:
                 return
                 
             # Get all data from local SQLite
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
@@ -1073,7 +1417,7 @@ class CloudAPIServerDatabase:
     def update_staff_username(self, staff_id: int, username: str) -> bool:
         """Update staff username in the database"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -1084,6 +1428,7 @@ class CloudAPIServerDatabase:
             
             conn.commit()
             conn.close()
+            self._staff_cache.clear()
             
             logger.info(f"✅ Updated staff username for ID {staff_id} to {username}")
             return True
@@ -1092,6 +1437,45 @@ class CloudAPIServerDatabase:
             logger.error(f"❌ Error updating staff username: {e}")
             return False
 
+    # ========================================
+    # STICKY EMBED CACHE
+    # ========================================
+    
+    def get_sticky_message_id(self, channel_id: int) -> Optional[int]:
+        """Get the cached sticky embed message ID for a channel"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('SELECT message_id FROM sticky_messages WHERE channel_id = ?', (channel_id,))
+            row = cursor.fetchone()
+            conn.close()
+            
+            return row[0] if row else None
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting sticky message ID: {e}")
+            return None
+    
+    def set_sticky_message_id(self, channel_id: int, message_id: int) -> bool:
+        """Cache the sticky embed message ID for a channel"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT OR REPLACE INTO sticky_messages (channel_id, message_id, updated_at)
+                VALUES (?, ?, ?)
+            ''', (channel_id, message_id, datetime.now()))
+            
+            conn.commit()
+            conn.close()
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Error caching sticky message ID: {e}")
+            return False
+    
     # ========================================
     # ONBOARDING SYSTEM METHODS  
     # ========================================
@@ -1099,7 +1483,7 @@ class CloudAPIServerDatabase:
     async def init_onboarding_progress(self, user_id: str, username: str) -> bool:
         """Initialize onboarding progress for a new user"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -1124,7 +1508,7 @@ class CloudAPIServerDatabase:
     async def update_onboarding_step(self, user_id: str, step_name: str) -> bool:
         """Update user's onboarding progress"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             # Update the specific step
@@ -1169,7 +1553,7 @@ class CloudAPIServerDatabase:
     async def log_onboarding_event(self, user_id: str, event_type: str, step_name: str, metadata: Optional[dict] = None) -> bool:
         """Log onboarding analytics event"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             metadata_json = json.dumps(metadata) if metadata else None
@@ -1191,7 +1575,7 @@ class CloudAPIServerDatabase:
     def get_onboarding_stats(self) -> dict:
         """Get onboarding completion statistics"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             # Get completion stats
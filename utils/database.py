@@ -8,8 +8,11 @@ Handles database operations for server management features including:
 - Staff attribution and referral tracking
 """
 
+import copy
 import sqlite3
 import logging
+import time
+from collections import namedtuple
 from datetime import datetime
 from typing import Optional, Dict, List, Tuple
 import os
@@ -17,20 +20,59 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# One row of an invite's user listing (see get_invite_user_summary)
+InviteUser = namedtuple('InviteUser', 'user_id username joined_at')
+
+STAFF_CACHE_TTL = 60  # Seconds staff config reads are reused between writes
+INVITE_USER_CACHE_TTL = 30  # Seconds invite user listings are reused between joins
+
+# Per-connection SQLite tuning; journal_mode=WAL is persistent and set once in init_database
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",  # Safe under WAL, skips the fsync on every commit
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB of the file read through the OS page cache
+)
+
 class ServerDatabase:
     """Database manager for server bot features"""
     
     def __init__(self, db_path: str = "server_management.db"):
         self.db_path = db_path
         self.config_path = os.path.join(os.path.dirname(__file__), "..", "config", "staff_config.json")
+        self._staff_cache = {}  # {name: (monotonic, result)}, cleared on staff_invites writes
+        self._invite_user_cache = {}  # {(query, invite_code, ...): (monotonic, result)}, cleared on invite_tracking writes
+        self._staff_config = None  # Parsed staff_config.json, re-read when its mtime changes
+        self._staff_config_mtime = None
+        self._staff_by_discord_id = {}  # {discord_id: config entry}, rebuilt with _staff_config
         self.init_database()
-        self.load_staff_config()
+        self._get_staff_config()
+    
+    def get_connection(self):
+        """Get a SQLite database connection"""
+        conn = sqlite3.connect(self.db_path, timeout=10.0)
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def ping(self) -> bool:
+        """Check that the local SQLite database answers a trivial query"""
+        try:
+            conn = self.get_connection()
+            conn.execute('SELECT 1').fetchone()
+            conn.close()
+            return True
+        except Exception as e:
+            logger.error(f"❌ Database ping failed: {e}")
+            return False
     
     def init_database(self):
         """Initialize database with required tables"""
-        conn = sqlite3.connect(self.db_path, timeout=10.0)
+        conn = self.get_connection()
         cursor = conn.cursor()
         
+        # WAL lets the admin read queries run alongside invite-join writes
+        cursor.execute('PRAGMA journal_mode=WAL')
+        
         # Invite tracking table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS invite_tracking (
@@ -46,6 +88,12 @@ class ServerDatabase:
             )
         ''')
         
+        # Covering index for the paged invite user listings (user_id is the rowid)
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_invite_tracking_code_joined
+            ON invite_tracking(invite_code, joined_at DESC, username)
+        ''')
+        
         # Staff invite configuration table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS staff_invites (
@@ -60,6 +108,12 @@ class ServerDatabase:
             )
         ''')
         
+        # Index invite code lookups (staff_id is already the primary key)
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_staff_invites_invite_code
+            ON staff_invites(invite_code)
+        ''')
+        
         # VIP upgrade requests table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS vip_requests (
@@ -76,6 +130,16 @@ class ServerDatabase:
             )
         ''')
         
+        # Status listings page newest-first straight off these indexes ('all' uses the second)
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_vip_requests_status_created
+            ON vip_requests(status, created_at DESC)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_vip_requests_created
+            ON vip_requests(created_at DESC)
+        ''')
+        
         # Onboarding progress tracking table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS onboarding_progress (
@@ -105,16 +169,36 @@ class ServerDatabase:
             )
         ''')
         
+        # Sticky embed message cache
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS sticky_messages (
+                channel_id INTEGER PRIMARY KEY,
+                message_id INTEGER,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
         conn.commit()
         conn.close()
         logger.info("✅ Server database initialized")
     
     def load_staff_config(self) -> Dict:
-        """Load staff configuration from JSON file"""
+        """Load staff configuration from JSON file (a copy callers are free to modify)"""
+        return copy.deepcopy(self._get_staff_config())
+    
+    def _get_staff_config(self) -> Dict:
+        """Shared parsed staff configuration, re-read only when the file changes on disk (don't modify)"""
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    return json.load(f)
+                mtime = os.path.getmtime(self.config_path)
+                if self._staff_config is None or mtime != self._staff_config_mtime:
+                    with open(self.config_path, 'r') as f:
+                        config = json.load(f)
+                    self._staff_by_discord_id = {
+                        info["discord_id"]: info for info in config.get("staff_members", {}).values()
+                    }
+                    self._staff_config, self._staff_config_mtime = config, mtime
+                return self._staff_config
             else:
                 logger.warning(f"Staff config file not found: {self.config_path}")
                 return {"staff_members": {}, "email_template": {}, "channels": {}, "roles": {}}
@@ -122,40 +206,37 @@ class ServerDatabase:
             logger.error(f"Failed to load staff config: {e}")
             return {"staff_members": {}, "email_template": {}, "channels": {}, "roles": {}}
     
+    def _get_staff_config_entry(self, discord_id: int) -> Optional[Dict]:
+        """Look up a staff member's config file entry by Discord ID"""
+        if not self._get_staff_config().get("staff_members"):
+            return None
+        return self._staff_by_discord_id.get(discord_id)
+    
     def get_staff_by_discord_id(self, discord_id: int) -> Optional[Dict]:
         """Get staff member info by Discord ID"""
-        config = self.load_staff_config()
-        for staff_key, staff_info in config["staff_members"].items():
-            if staff_info["discord_id"] == discord_id:
-                return staff_info
-        return None
+        staff_info = self._get_staff_config_entry(discord_id)
+        return dict(staff_info) if staff_info else None
     
     def get_staff_by_invite_code(self, invite_code: str) -> Optional[Dict]:
         """Get staff member info by invite code"""
-        config = self.load_staff_config()
+        config = self._get_staff_config()
         for staff_key, staff_info in config["staff_members"].items():
             if staff_info.get("invite_code") == invite_code:
-                return staff_info
+                return dict(staff_info)
         return None
     
     def update_staff_invite_code(self, discord_id: int, invite_code: str) -> bool:
         """Update invite code for a staff member in database"""
         try:
             # Get staff info from config
-            config = self.load_staff_config()
-            staff_info = None
-            
-            for staff_key, info in config["staff_members"].items():
-                if info["discord_id"] == discord_id:
-                    staff_info = info
-                    break
+            staff_info = self._get_staff_config_entry(discord_id)
             
             if not staff_info:
                 logger.warning(f"Staff member with Discord ID {discord_id} not found in config")
                 return False
             
             # Store in database
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -168,6 +249,7 @@ class ServerDatabase:
             
             conn.commit()
             conn.close()
+            self._staff_cache.clear()
             
             logger.info(f"Updated invite code for staff {discord_id}: {invite_code}")
             return True
@@ -176,10 +258,53 @@ class ServerDatabase:
             logger.error(f"Failed to update staff invite code: {e}")
             return False
     
+    def update_staff_invite_codes_bulk(self, pairs: List[Tuple[int, str]]) -> Dict[int, bool]:
+        """Update invite codes for several staff members in one transaction"""
+        results = {discord_id: False for discord_id, _ in pairs}
+        try:
+            # Get staff info from config, reading the config file once
+            config = self._get_staff_config()
+            staff_by_id = {info["discord_id"]: info for info in config["staff_members"].values()}
+            for discord_id in results.keys() - staff_by_id.keys():
+                logger.warning(f"Staff member with Discord ID {discord_id} not found in config")
+            
+            now = datetime.now()
+            rows = []
+            for discord_id, invite_code in pairs:
+                staff_info = staff_by_id.get(discord_id)
+                if staff_info:
+                    rows.append((discord_id, staff_info['username'], invite_code,
+                                 staff_info['vantage_referral_link'], staff_info['vantage_ib_code'], now))
+            if not rows:
+                return results
+            
+            # Store in database
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.executemany('''
+                INSERT OR REPLACE INTO staff_invites 
+                (staff_id, staff_username, invite_code, vantage_referral_link, vantage_ib_code, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', rows)
+            
+            conn.commit()
+            conn.close()
+            self._staff_cache.clear()
+            
+            for row in rows:
+                results[row[0]] = True
+            logger.info(f"Updated invite codes for {len(rows)} staff members")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Failed to update staff invite codes: {e}")
+            return results
+    
     def get_all_staff_invite_codes(self) -> set:
         """Get all staff invite codes from database"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('SELECT invite_code FROM staff_invites WHERE invite_code IS NOT NULL')
@@ -194,8 +319,12 @@ class ServerDatabase:
     
     def get_staff_invite_status(self) -> Dict:
         """Get staff invite status combining config and database info"""
+        cached = self._staff_cache.get('invite_status')
+        if cached and time.monotonic() - cached[0] < STAFF_CACHE_TTL:
+            return cached[1]
+        
         try:
-            config = self.load_staff_config()
+            config = self._get_staff_config()
             result = {}
             
             if config and 'staff_members' in config:
@@ -204,7 +333,7 @@ class ServerDatabase:
                     username = staff_info['username']
                     
                     # Get invite code from database
-                    conn = sqlite3.connect(self.db_path, timeout=10.0)
+                    conn = self.get_connection()
                     cursor = conn.cursor()
                     cursor.execute('SELECT invite_code FROM staff_invites WHERE staff_id = ?', (discord_id,))
                     row = cursor.fetchone()
@@ -217,6 +346,7 @@ class ServerDatabase:
                     invite_code = row[0] if row and row[0] else None
                     result[username] = invite_code
             
+            self._staff_cache['invite_status'] = (time.monotonic(), result)
             return result
             
         except Exception as e:
@@ -230,7 +360,7 @@ class ServerDatabase:
     def debug_staff_invites_table(self) -> str:
         """Debug method to see all data in staff_invites table"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             cursor.execute('SELECT * FROM staff_invites')
             rows = cursor.fetchall()
@@ -253,7 +383,7 @@ class ServerDatabase:
                         uses_before: int, uses_after: int) -> bool:
         """Record when a user joins through a specific invite"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -266,6 +396,7 @@ class ServerDatabase:
             
             conn.commit()
             conn.close()
+            self._invite_user_cache.clear()
             
             logger.info(f"✅ Recorded user join: {username} via invite {invite_code}")
             return True
@@ -274,10 +405,46 @@ class ServerDatabase:
             logger.error(f"❌ Error recording user join: {e}")
             return False
     
+    def get_invite_user_summary(self, invite_code: str, limit: int = 25, offset: int = 0) -> Tuple[List[InviteUser], int]:
+        """Get one page of users who joined through an invite code (newest first) plus the total join count"""
+        key = ('summary', invite_code, limit, offset)
+        cached = self._invite_user_cache.get(key)
+        if cached and time.monotonic() - cached[0] < INVITE_USER_CACHE_TTL:
+            return cached[1]
+        
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT COUNT(*) FROM invite_tracking WHERE invite_code = ?
+            ''', (invite_code,))
+            total = cursor.fetchone()[0]
+            
+            # Skip the sorted page query when the invite is unused or the page is past the end
+            users = []
+            if offset < total:
+                cursor.execute('''
+                    SELECT user_id, username, joined_at
+                    FROM invite_tracking 
+                    WHERE invite_code = ?
+                    ORDER BY joined_at DESC
+                    LIMIT ? OFFSET ?
+                ''', (invite_code, limit, offset))
+                users = list(map(InviteUser._make, cursor.fetchall()))
+            
+            conn.close()
+            self._invite_user_cache[key] = (time.monotonic(), (users, total))
+            return users, total
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting invite user summary: {e}")
+            return [], 0
+    
     def get_user_invite_info(self, user_id: int) -> Optional[Dict]:
         """Get invite information for a user"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -307,7 +474,7 @@ class ServerDatabase:
                                vantage_ib_code: str, email_template: str) -> bool:
         """Add or update staff invite configuration"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -320,6 +487,7 @@ class ServerDatabase:
             
             conn.commit()
             conn.close()
+            self._staff_cache.clear()
             
             logger.info(f"✅ Updated staff invite config for {staff_username}")
             return True
@@ -331,7 +499,7 @@ class ServerDatabase:
     def get_staff_config_by_invite(self, invite_code: str) -> Optional[Dict]:
         """Get staff configuration by invite code"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -361,7 +529,7 @@ class ServerDatabase:
                           staff_id: int, request_data: Optional[str] = None) -> Optional[int]:
         """Create a new VIP upgrade request"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -385,7 +553,7 @@ class ServerDatabase:
                                  vantage_email: Optional[str] = None) -> bool:
         """Update VIP request status"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             if vantage_email:
@@ -411,10 +579,122 @@ class ServerDatabase:
             logger.error(f"❌ Error updating VIP request: {e}")
             return False
     
+    def get_staff_invite_by_code(self, invite_code: str) -> Optional[Dict]:
+        """Get one staff invite configuration by its invite code"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT staff_id, staff_username, invite_code, vantage_referral_link, created_at
+                FROM staff_invites 
+                WHERE invite_code = ?
+                LIMIT 1
+            ''', (invite_code,))
+            
+            row = cursor.fetchone()
+            conn.close()
+            
+            if not row:
+                return None
+            
+            return {
+                'staff_id': row[0],
+                'staff_username': row[1],
+                'invite_code': row[2],
+                'vantage_referral_link': row[3],
+                'created_at': row[4]
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting staff invite by code {invite_code}: {e}")
+            return None
+    
+    def reassign_staff_invite(self, invite_code: str, new_discord_id: int) -> Tuple[str, Optional[int]]:
+        """
+        Move the staff member owning invite_code to new_discord_id in one transaction.
+        Returns (status, old_discord_id) where status is 'not_found', 'unchanged', 'updated' or 'error'.
+        """
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            # Take the write lock before reading so nothing changes between the check and the update
+            cursor.execute('BEGIN IMMEDIATE')
+            cursor.execute('''
+                SELECT staff_id FROM staff_invites WHERE invite_code = ? LIMIT 1
+            ''', (invite_code,))
+            row = cursor.fetchone()
+            
+            if not row:
+                conn.rollback()
+                conn.close()
+                return 'not_found', None
+            
+            old_discord_id = row[0]
+            if old_discord_id == new_discord_id:
+                conn.rollback()
+                conn.close()
+                return 'unchanged', old_discord_id
+            
+            cursor.execute('''
+                UPDATE staff_invites SET staff_id = ? WHERE staff_id = ?
+            ''', (new_discord_id, old_discord_id))
+            cursor.execute('''
+                UPDATE vip_requests SET staff_id = ? WHERE staff_id = ?
+            ''', (new_discord_id, old_discord_id))
+            cursor.execute('''
+                UPDATE invite_tracking SET inviter_id = ? WHERE inviter_id = ?
+            ''', (new_discord_id, old_discord_id))
+            
+            conn.commit()
+            conn.close()
+            self._staff_cache.clear()
+            self._invite_user_cache.clear()
+            
+            logger.info(f"✅ Reassigned invite {invite_code}: {old_discord_id} → {new_discord_id}")
+            return 'updated', old_discord_id
+            
+        except Exception as e:
+            logger.error(f"❌ Error reassigning staff invite {invite_code}: {e}")
+            return 'error', None
+    
+    def find_staff_by_username_ci(self, username: str) -> List[Dict]:
+        """Get staff invite configurations whose username matches, ignoring case"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT staff_id, staff_username, invite_code, vantage_referral_link, created_at
+                FROM staff_invites 
+                WHERE LOWER(staff_username) = LOWER(?)
+                ORDER BY created_at DESC
+            ''', (username,))
+            
+            results = cursor.fetchall()
+            conn.close()
+            
+            return [{
+                'staff_id': row[0],
+                'staff_username': row[1],
+                'invite_code': row[2],
+                'vantage_referral_link': row[3],
+                'created_at': row[4]
+            } for row in results]
+            
+        except Exception as e:
+            logger.error(f"❌ Error finding staff by username {username}: {e}")
+            return []
+    
     def get_all_staff_configs(self) -> List[Dict]:
         """Get all staff invite configurations"""
+        cached = self._staff_cache.get('all_configs')
+        if cached and time.monotonic() - cached[0] < STAFF_CACHE_TTL:
+            return cached[1]
+        
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -436,63 +716,83 @@ class ServerDatabase:
                     'created_at': row[4]
                 })
             
+            self._staff_cache['all_configs'] = (time.monotonic(), staff_configs)
             return staff_configs
             
         except Exception as e:
             logger.error(f"❌ Error getting all staff configs: {e}")
             return []
     
+    def _fetch_vip_requests(self, cursor, status: Optional[str], limit: int = -1, offset: int = 0) -> List[Dict]:
+        """Fetch VIP requests newest-first, filtered by status unless it is 'all' (limit -1 means no limit)"""
+        if status and status != 'all':
+            where, params = 'WHERE status = ?', (status,)
+        else:
+            where, params = '', ()
+        
+        cursor.execute(f'''
+            SELECT id, user_id, username, request_type, staff_id, status, 
+                   vantage_email, created_at, updated_at,
+                   CAST(strftime('%s', created_at) AS INTEGER) AS created_ts
+            FROM vip_requests 
+            {where}
+            ORDER BY created_at DESC
+            LIMIT ? OFFSET ?
+        ''', params + (limit, offset))
+        
+        requests = []
+        for row in cursor.fetchall():
+            requests.append({
+                'id': row[0],
+                'user_id': row[1],
+                'username': row[2],
+                'request_type': row[3],
+                'staff_id': row[4],
+                'status': row[5],
+                'vantage_email': row[6],
+                'created_at': row[7],
+                'updated_at': row[8],
+                'created_ts': row[9]
+            })
+        return requests
+    
     def get_vip_requests_by_status(self, status: Optional[str] = None) -> List[Dict]:
         """Get VIP requests filtered by status"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            requests = self._fetch_vip_requests(cursor, status)
+            conn.close()
+            return requests
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting VIP requests: {e}")
+            return []
+    
+    def get_vip_requests_page(self, status: Optional[str] = None, limit: int = 10, offset: int = 0) -> Tuple[List[Dict], int]:
+        """Get one page of VIP requests filtered by status, plus the total match count"""
+        try:
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             if status and status != 'all':
-                cursor.execute('''
-                    SELECT id, user_id, username, request_type, staff_id, status, 
-                           vantage_email, created_at, updated_at
-                    FROM vip_requests 
-                    WHERE status = ?
-                    ORDER BY created_at DESC
-                ''', (status,))
+                cursor.execute('SELECT COUNT(*) FROM vip_requests WHERE status = ?', (status,))
             else:
-                cursor.execute('''
-                    SELECT id, user_id, username, request_type, staff_id, status, 
-                           vantage_email, created_at, updated_at
-                    FROM vip_requests 
-                    ORDER BY created_at DESC
-                ''')
+                cursor.execute('SELECT COUNT(*) FROM vip_requests')
+            total = cursor.fetchone()[0]
             
-            results = cursor.fetchall()
+            requests = self._fetch_vip_requests(cursor, status, limit, offset)
             conn.close()
-            
-            requests = []
-            for row in results:
-                requests.append({
-                    'id': row[0],
-                    'user_id': row[1],
-                    'username': row[2],
-                    'request_type': row[3],
-                    'staff_id': row[4],
-                    'status': row[5],
-                    'vantage_email': row[6],
-                    'created_at': row[7],
-                    'updated_at': row[8]
-                })
-            
-            return requests
+            return requests, total
             
         except Exception as e:
-            logger.error(f"❌ Error getting VIP requests: {e}")
-            return []
-
-
+            logger.error(f"❌ Error getting VIP requests page: {e}")
+            return [], 0
     
     def get_staff_vip_stats(self, staff_id: int) -> Dict:
         """Get VIP conversion stats for a staff member"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             # Get total invites and VIP conversions
@@ -524,6 +824,96 @@ class ServerDatabase:
             logger.error(f"❌ Error getting staff stats: {e}")
             return {'total_invites': 0, 'vip_conversions': 0, 'pending_requests': 0, 'conversion_rate': 0}
     
+    def get_staff_vip_stats_bulk(self, staff_ids: List[int]) -> Dict[int, Dict]:
+        """Get VIP conversion stats for several staff members in a single query"""
+        empty_stats = {'total_invites': 0, 'vip_conversions': 0, 'pending_requests': 0, 'conversion_rate': 0}
+        stats = {staff_id: dict(empty_stats) for staff_id in staff_ids}
+        if not staff_ids:
+            return stats
+        
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            # Same query as the cloud backend: invites are counted by the staff
+            # member's invite code, and staff without a code report zeros
+            placeholders = ','.join('?' * len(staff_ids))
+            cursor.execute(f'''
+                SELECT s.staff_id,
+                       COALESCE(t.total_invites, 0),
+                       COALESCE(v.vip_conversions, 0),
+                       COALESCE(v.pending_requests, 0)
+                FROM staff_invites s
+                LEFT JOIN (
+                    SELECT invite_code, COUNT(*) AS total_invites
+                    FROM invite_tracking
+                    GROUP BY invite_code
+                ) t ON t.invite_code = s.invite_code
+                LEFT JOIN (
+                    SELECT staff_id,
+                           SUM(status = 'completed') AS vip_conversions,
+                           SUM(status = 'pending') AS pending_requests
+                    FROM vip_requests
+                    GROUP BY staff_id
+                ) v ON v.staff_id = s.staff_id
+                WHERE s.staff_id IN ({placeholders})
+                  AND s.invite_code IS NOT NULL AND s.invite_code != ''
+            ''', list(staff_ids))
+            
+            for staff_id, total_invites, vip_conversions, pending_requests in cursor.fetchall():
+                stats[staff_id] = {
+                    'total_invites': total_invites,
+                    'vip_conversions': vip_conversions,
+                    'pending_requests': pending_requests,
+                    'conversion_rate': (vip_conversions / total_invites * 100) if total_invites > 0 else 0
+                }
+            
+            conn.close()
+            return stats
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting bulk staff stats: {e}")
+            return stats
+    
+    # ========================================
+    # STICKY EMBED CACHE
+    # ========================================
+    
+    def get_sticky_message_id(self, channel_id: int) -> Optional[int]:
+        """Get the cached sticky embed message ID for a channel"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('SELECT message_id FROM sticky_messages WHERE channel_id = ?', (channel_id,))
+            row = cursor.fetchone()
+            conn.close()
+            
+            return row[0] if row else None
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting sticky message ID: {e}")
+            return None
+    
+    def set_sticky_message_id(self, channel_id: int, message_id: int) -> bool:
+        """Cache the sticky embed message ID for a channel"""
+        try:
+            conn = self.get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT OR REPLACE INTO sticky_messages (channel_id, message_id, updated_at)
+                VALUES (?, ?, ?)
+            ''', (channel_id, message_id, datetime.now()))
+            
+            conn.commit()
+            conn.close()
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Error caching sticky message ID: {e}")
+            return False
+    
     # ========================================
     # ONBOARDING SYSTEM METHODS
     # ========================================
@@ -531,7 +921,7 @@ class ServerDatabase:
     def init_onboarding_progress(self, user_id: str, username: str) -> bool:
         """Initialize onboarding progress for a new user"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -553,7 +943,7 @@ class ServerDatabase:
     def update_onboarding_step(self, user_id: str, step_name: str) -> bool:
         """Update user's onboarding progress"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             # Update the specific step
@@ -595,7 +985,7 @@ class ServerDatabase:
     def log_onboarding_event(self, user_id: str, event_type: str, step_name: str, metadata: Optional[dict] = None) -> bool:
         """Log onboarding analytics event"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             import json
@@ -618,7 +1008,7 @@ class ServerDatabase:
     def get_onboarding_stats(self) -> dict:
         """Get onboarding completion statistics"""
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn = self.get_connection()
             cursor = conn.cursor()
             
             # Get completion stats
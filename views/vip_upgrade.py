@@ -41,11 +41,11 @@ class StaffVIPApprovalView(discord.ui.View):
                 return
             
             # Update request status in database
-            success = bot.db.update_vip_request_status(self.request_id, 'completed')
+            success = await asyncio.to_thread(bot.db.update_vip_request_status, self.request_id, 'completed')
             
             if success:
                 # Get the guild and user
-                guild = bot.get_guild(int(vip_cog.GUILD_ID))
+                guild = bot.get_guild(vip_cog.cfg.guild_id)
                 if not guild:
                     await interaction.response.send_message("❌ Guild not found.", ephemeral=True)
                     return
@@ -56,7 +56,7 @@ class StaffVIPApprovalView(discord.ui.View):
                     return
                 
                 # Add VIP role
-                vip_role_id = int(vip_cog.VIP_ROLE_ID)
+                vip_role_id = vip_cog.cfg.vip_role_id
                 vip_role = guild.get_role(vip_role_id)
                 
                 if vip_role:
@@ -71,7 +71,7 @@ class StaffVIPApprovalView(discord.ui.View):
                     await interaction.response.send_message(embed=embed)
                     
                     # Notify user in VIP upgrade channel
-                    vip_channel = guild.get_channel(int(vip_cog.VIP_UPGRADE_CHANNEL_ID))
+                    vip_channel = guild.get_channel(vip_cog.cfg.vip_channel_id)
                     if vip_channel:
                         user_embed = discord.Embed(
                             title="🎉 VIP Upgrade Approved!",
@@ -139,13 +139,13 @@ class DenialReasonModal(discord.ui.Modal):
                 return
             
             # Update request status in database
-            success = bot.db.update_vip_request_status(self.request_id, 'denied')
+            success = await asyncio.to_thread(bot.db.update_vip_request_status, self.request_id, 'denied')
             
             if success:
                 # Get the guild and VIP upgrade channel
-                guild = bot.get_guild(int(vip_cog.GUILD_ID))
+                guild = bot.get_guild(vip_cog.cfg.guild_id)
                 if guild:
-                    vip_channel = guild.get_channel(int(vip_cog.VIP_UPGRADE_CHANNEL_ID))
+                    vip_channel = guild.get_channel(vip_cog.cfg.vip_channel_id)
                     member = guild.get_member(self.user_id)
                     
                     if vip_channel and member:
@@ -286,7 +286,7 @@ class VIPRestartView(discord.ui.View):
             if db:
                 cancelled_count = 0
                 for request in self.active_requests:
-                    if db.update_vip_request_status(request.get('id'), 'cancelled'):
+                    if await asyncio.to_thread(db.update_vip_request_status, request.get('id'), 'cancelled'):
                         cancelled_count += 1
                 
                 embed = discord.Embed(
@@ -365,11 +365,10 @@ class VIPUpgradeView(discord.ui.View):
         try:
             # Check if user already has VIP role
             vip_cog = interaction.client.get_cog('VIPUpgrade')
-            if vip_cog and vip_cog.VIP_ROLE_ID:
-                vip_role_id = int(vip_cog.VIP_ROLE_ID)
+            if vip_cog and vip_cog.cfg.vip_role_id:
+                vip_role_id = vip_cog.cfg.vip_role_id
                 if interaction.guild:
-                    vip_role = interaction.guild.get_role(vip_role_id)
-                    if vip_role and isinstance(interaction.user, discord.Member) and vip_role in interaction.user.roles:
+                    if isinstance(interaction.user, discord.Member) and interaction.user.get_role(vip_role_id):
                         embed = discord.Embed(
                             title="👑 Already VIP!",
                             description="You already have VIP access! This channel is for new members upgrading to VIP.",
@@ -431,13 +430,13 @@ class VIPUpgradeView(discord.ui.View):
         try:
             # Load staff config to check if user is staff
             vip_cog = interaction.client.get_cog('VIPUpgrade')
-            config = vip_cog.bot.db.load_staff_config() if vip_cog else None
+            config = await asyncio.to_thread(vip_cog.bot.db.load_staff_config) if vip_cog else None
             
             # Check for existing active requests for this user
             db = vip_cog.bot.db if vip_cog else None
             if db:
                 # Check for pending/awaiting requests
-                pending_requests = db.get_user_vip_requests(interaction.user.id)
+                pending_requests = await asyncio.to_thread(db.get_user_vip_requests, interaction.user.id)
                 active_requests = [req for req in pending_requests if req.get('status') in ['pending', 'awaiting_proof', 'email_sent']]
                 
                 if active_requests:
@@ -489,7 +488,7 @@ class VIPUpgradeView(discord.ui.View):
                     is_staff = True
             
             # Check if user already has VIP role
-            vip_role_id = int(vip_cog.VIP_ROLE_ID) if vip_cog and vip_cog.VIP_ROLE_ID else None
+            vip_role_id = vip_cog.cfg.vip_role_id if vip_cog and vip_cog.cfg.vip_role_id else None
             
             if vip_role_id and interaction.guild:
                 vip_role = interaction.guild.get_role(vip_role_id)
@@ -549,17 +548,17 @@ class VantageAccountView(discord.ui.View):
             # Get user's invite information
             # Use the bot's database instance instead of creating a new one
             db = self.bot.db
-            invite_info = db.get_user_invite_info(interaction.user.id)
+            invite_info = await asyncio.to_thread(db.get_user_invite_info, interaction.user.id)
             
             # Get staff configuration - fallback to default if no invite found
             if invite_info:
-                staff_config = db.get_staff_config_by_invite(invite_info['invite_code'])
+                staff_config = await asyncio.to_thread(db.get_staff_config_by_invite, invite_info['invite_code'])
             else:
                 staff_config = None
             
             # If no staff config found, use first available staff member as fallback
             if not staff_config:
-                config = db.load_staff_config()
+                config = await asyncio.to_thread(db.load_staff_config)
                 if "staff_members" in config and config["staff_members"]:
                     # Get first available staff member as fallback
                     for staff_key, staff_info in config["staff_members"].items():
@@ -598,7 +597,8 @@ class VantageAccountView(discord.ui.View):
                 'request_type': 'existing_account'
             })
             
-            request_id = db.create_vip_request(
+            request_id = await asyncio.to_thread(
+                db.create_vip_request,
                 user_id=interaction.user.id,
                 username=f"{interaction.user.name}#{interaction.user.discriminator}",
                 request_type='existing_account',
@@ -612,7 +612,7 @@ class VantageAccountView(discord.ui.View):
             
             # Get email template from config
             bot = interaction.client
-            config = bot.db.load_staff_config()
+            config = await asyncio.to_thread(bot.db.load_staff_config)
             
             # Show email template with placeholders filled (user fills in name themselves)
             email_template = config["email_template"]["body_template"].format(
@@ -688,17 +688,17 @@ class VantageAccountView(discord.ui.View):
             # Use the bot's database instance instead of creating a new one
             bot = interaction.client
             db = bot.db
-            invite_info = db.get_user_invite_info(interaction.user.id)
+            invite_info = await asyncio.to_thread(db.get_user_invite_info, interaction.user.id)
             
             # Get staff configuration - fallback to default if no invite found
             if invite_info:
-                staff_config = db.get_staff_config_by_invite(invite_info['invite_code'])
+                staff_config = await asyncio.to_thread(db.get_staff_config_by_invite, invite_info['invite_code'])
             else:
                 staff_config = None
             
             # If no staff config found, use first available staff member as fallback
             if not staff_config:
-                config = db.load_staff_config()
+                config = await asyncio.to_thread(db.load_staff_config)
                 if "staff_members" in config and config["staff_members"]:
                     # Get first available staff member as fallback
                     for staff_key, staff_info in config["staff_members"].items():
@@ -737,7 +737,8 @@ class VantageAccountView(discord.ui.View):
                 'request_type': 'new_account'
             })
             
-            request_id = db.create_vip_request(
+            request_id = await asyncio.to_thread(
+                db.create_vip_request,
                 user_id=interaction.user.id,
                 username=f"{interaction.user.name}#{interaction.user.discriminator}",
                 request_type='new_account',
@@ -828,7 +829,7 @@ class EmailSentView(discord.ui.View):
             try:
                 bot = interaction.client
                 db = bot.db
-                success = db.update_vip_request_status(self.request_id, 'email_sent')
+                success = await asyncio.to_thread(db.update_vip_request_status, self.request_id, 'email_sent')
                 
                 if success:
                     embed = discord.Embed(
@@ -876,7 +877,7 @@ class EmailProofModal(discord.ui.Modal):
             # Update status to awaiting proof
             bot = interaction.client
             db = bot.db
-            db.update_vip_request_status(self.request_id, 'awaiting_proof')
+            await asyncio.to_thread(db.update_vip_request_status, self.request_id, 'awaiting_proof')
             
             # Show the file upload modal directly
             upload_modal = EmailProofUploadModal(self.request_id)
@@ -939,7 +940,7 @@ class EmailProofUploadModal(discord.ui.Modal):
             # Update request status and notify staff
             bot = interaction.client
             db = bot.db
-            success = db.update_vip_request_status(self.request_id, 'proof_uploaded')
+            success = await asyncio.to_thread(db.update_vip_request_status, self.request_id, 'proof_uploaded')
             
             if not success:
                 await interaction.response.send_message(
@@ -968,7 +969,7 @@ class EmailProofUploadModal(discord.ui.Modal):
             # Send staff DM with the screenshot
             try:
                 # Get request details to find responsible staff member
-                request_details = db.get_vip_requests_by_status('proof_uploaded')
+                request_details = await asyncio.to_thread(db.get_vip_requests_by_status, 'proof_uploaded')
                 current_request = None
                 for req in request_details:
                     if req['id'] == self.request_id:
@@ -976,7 +977,7 @@ class EmailProofUploadModal(discord.ui.Modal):
                         break
                 
                 if current_request and current_request['staff_id']:
-                    staff_config = db.get_staff_by_discord_id(current_request['staff_id'])
+                    staff_config = await asyncio.to_thread(db.get_staff_by_discord_id, current_request['staff_id'])
                     if staff_config:
                         # Create a mock attachment object for the notification
                         class MockAttachment:
@@ -1063,7 +1064,7 @@ class VantageEmailModal(discord.ui.Modal):
             # Update request with email and set to pending verification
             bot = interaction.client
             db = bot.db
-            success = db.update_vip_request_status(self.request_id, 'account_created', email)
+            success = await asyncio.to_thread(db.update_vip_request_status, self.request_id, 'account_created', email)
             
             if success:
                 embed = discord.Embed(
@@ -1086,7 +1087,7 @@ class VantageEmailModal(discord.ui.Modal):
                 # Send DM notification to responsible staff member
                 try:
                     # Get request details to find staff member
-                    request_details = db.get_vip_requests_by_status('account_created')
+                    request_details = await asyncio.to_thread(db.get_vip_requests_by_status, 'account_created')
                     current_request = None
                     for req in request_details:
                         if req['id'] == self.request_id:
@@ -1094,7 +1095,7 @@ class VantageEmailModal(discord.ui.Modal):
                             break
                     
                     if current_request and current_request['staff_id']:
-                        staff_config = db.get_staff_by_discord_id(current_request['staff_id'])
+                        staff_config = await asyncio.to_thread(db.get_staff_by_discord_id, current_request['staff_id'])
                         if staff_config:
                             await send_staff_vip_notification(
                                 bot=interaction.client,